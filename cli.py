@@ -5,17 +5,12 @@ Command-line interface for JobSpy.
 """
 import click
 import sys
-from pathlib import Path
 from uuid import UUID, uuid4
 from datetime import datetime
 
-sys.path.insert(0, str(Path(__file__).parent))
-
-from jobspy.services import ProfileService, JobSearchService, MatchingService
+# Services (and the scrapers behind them) are imported inside each command so
+# that lightweight commands like `version` start quickly.
 from jobspy.config import get_config
-from jobspy.util import create_logger
-
-log = create_logger("CLI")
 
 
 @click.group()
@@ -40,6 +35,8 @@ def profile():
 def create(email, name, experience):
     """Create a new profile."""
     try:
+        from jobspy.services import ProfileService
+
         service = ProfileService()
 
         existing = service.get_profile_by_email(email)
@@ -69,6 +66,8 @@ def create(email, name, experience):
 def show(email):
     """Show profile details."""
     try:
+        from jobspy.services import ProfileService
+
         service = ProfileService()
         profile = service.get_profile_by_email(email)
 
@@ -102,9 +101,12 @@ def search():
 @click.option('--sites', default='linkedin,naukri', help='Comma-separated sites')
 @click.option('--results', default=100, type=int, help='Number of results')
 @click.option('--remote/--no-remote', default=False, help='Filter for remote jobs')
-def run(profile_id, keywords, location, sites, results, remote):
+@click.option('--threads', default=1, type=int, help='Scrape keywords concurrently with N threads')
+def run(profile_id, keywords, location, sites, results, remote, threads):
     """Run a job search."""
     try:
+        from jobspy.services import JobSearchService
+
         service = JobSearchService()
 
         profile_uuid = UUID(profile_id)
@@ -117,6 +119,7 @@ def run(profile_id, keywords, location, sites, results, remote):
         click.echo(f"  Location: {location}")
         click.echo(f"  Sites: {', '.join(site_list)}")
         click.echo(f"  Results wanted: {results}")
+        click.echo(f"  Threads: {threads}")
         click.echo()
 
         result = service.execute_search(
@@ -126,7 +129,8 @@ def run(profile_id, keywords, location, sites, results, remote):
             sites=site_list,
             results_wanted=results,
             is_remote=remote,
-            auto_match=True
+            auto_match=True,
+            max_workers=threads
         )
 
         click.echo(f"\nSearch completed!")
@@ -153,6 +157,8 @@ def run(profile_id, keywords, location, sites, results, remote):
 def history(profile_id, limit):
     """Show search history."""
     try:
+        from jobspy.services import JobSearchService
+
         service = JobSearchService()
         profile_uuid = UUID(profile_id)
 
@@ -199,7 +205,7 @@ def status():
         from jobspy.database import get_db
 
         db_instance = get_db()
-        result = db_instance.client.table('profiles').select('id', count='exact').limit(0).execute()
+        result = db_instance.client.table('profiles').select('*', count='exact', head=True).execute()
 
         click.echo("Database connection: OK")
         click.echo(f"Total profiles: {result.count or 0}")
@@ -214,7 +220,8 @@ def status():
 def server():
     """Start the API server."""
     click.echo("Starting JobSpy API server...")
-    click.echo("Use: uvicorn jobspy.api.app:create_app --factory --reload")
+    click.echo("Use: uvicorn jobspy.api.app:create_app --factory --loop uvloop --http httptools --workers $(nproc)")
+    click.echo("Dev: uvicorn jobspy.api.app:create_app --factory --reload")
     click.echo("Or run: python run_server.py")
 
 
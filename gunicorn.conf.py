@@ -0,0 +1,16 @@
+# gunicorn.conf.py
+"""
+Production server settings: gunicorn managing Uvicorn workers.
+
+    gunicorn -c gunicorn.conf.py "jobspy.api.app:create_app()"
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('API_PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1)))
+
+# Uses uvloop and httptools automatically when they are installed
+worker_class = "uvicorn.workers.UvicornWorker"
+
+timeout = 120  # searches scrape synchronously before responding
+keepalive = 5
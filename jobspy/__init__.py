@@ -3,6 +3,10 @@ Top‑level hook for the JobSpy package.
 Re‑exports the public classes and functions for convenient access.
 """
 
+import importlib
+import sys
+import types
+
 # Import core data models and enums
 from .model import (
     ScraperInput,
@@ -17,42 +21,66 @@ from .model import (
     SalarySource,
     Location,
 )
-# Import the working scrapers
-from .linkedin import LinkedIn
-from .naukri import Naukri
+# Everything else is resolved lazily on first attribute access (PEP 562), so
+# `from jobspy import Site` does not pull in the scrapers, pandas or requests.
+_LAZY_ATTRS = {
+    # Scrapers
+    "LinkedIn": ".linkedin",
+    "Naukri": ".naukri",
+    # Shared exceptions
+    "JobScrapingException": ".exception",
+    "LinkedInException": ".exception",
+    "NaukriException": ".exception",
+    "PageFetchError": ".exception",
+    "RateLimitError": ".exception",
+    "ResumeParsingException": ".exception",
+    "SiteAuthorizationError": ".exception",
+    "JobURLValidationError": ".exception",
+    "APIResponseFormatError": ".exception",
+    "RecaptchaChallenge": ".exception",
+    # Utility and public API functions
+    "convert_to_annual": ".util",
+    "create_logger": ".util",
+    "create_session": ".util",
+    "currency_parser": ".util",
+    "desired_order": ".util",
+    "extract_emails_from_text": ".util",
+    "extract_job_type": ".util",
+    "extract_salary": ".util",
+    "get_enum_from_value": ".util",
+    "markdown_converter": ".util",
+    "map_str_to_site": ".util",
+    "norm_text": ".util",
+    "remove_attributes": ".util",
+    "scrape_jobs": ".scrape_jobs",
+    "set_logger_level": ".scrape_jobs",
+    "run_personalized_pipeline": ".pipeline",
+}
 
-# Import shared exceptions
-from .exception import (
-    JobScrapingException,
-    LinkedInException,
-    NaukriException,
-    PageFetchError,
-    RateLimitError,
-    ResumeParsingException,
-    SiteAuthorizationError,
-    JobURLValidationError,
-    APIResponseFormatError,
-    RecaptchaChallenge,
-)
 
-# Import utility and public API functions
-from .util import (
-    convert_to_annual,
-    create_logger,
-    create_session,
-    currency_parser,
-    desired_order,
-    extract_emails_from_text,
-    extract_job_type,
-    extract_salary,
-    get_enum_from_value,
-    markdown_converter,
-    map_str_to_site,
-    norm_text,
-    remove_attributes,
-)
-from .scrape_jobs import scrape_jobs, set_logger_level
-from .pipeline import run_personalized_pipeline
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+class _JobSpyModule(types.ModuleType):
+    # Importing the `jobspy.scrape_jobs` submodule binds it onto the package,
+    # which would shadow the `scrape_jobs` function re-export.
+    def __setattr__(self, name, value):
+        if name == "scrape_jobs" and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _JobSpyModule
 
 __all__ = [
     # Core Models
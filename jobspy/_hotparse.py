@@ -0,0 +1,81 @@
+# jobspy/_hotparse.py
+"""
+Per-job string parsing shared by the scrapers.
+
+A leaf module: fully annotated, stdlib only, no bs4 or pydantic objects, so it
+can be compiled ahead of time without changing any caller:
+
+    pip install mypy && mypyc jobspy/_hotparse.py
+
+The resulting extension sits next to this file and is imported in its place;
+without it the plain Python module is used.
+"""
+from __future__ import annotations
+import re
+from datetime import date, datetime, timedelta
+from typing import Optional, Tuple
+
+DAYS_AGO_RE = re.compile(r"(\d+)\s*day")
+# "N days ago" labels only ever cover the last few months; their offsets are built once
+DAY_OFFSETS = tuple(timedelta(days=i) for i in range(400))
+
+
+def split_location(location: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Split "City, State[, Country]" into parts; anything else yields all None."""
+    first = location.find(", ")
+    if first >= 0:
+        second = location.find(", ", first + 2)
+        if second < 0:
+            return location[:first], location[first + 2:], None
+        if location.find(", ", second + 2) < 0:
+            return location[:first], location[first + 2:second], location[second + 2:]
+    return None, None, None
+
+
+def split_city_state(label: str) -> Tuple[str, Optional[str]]:
+    """Split "City, State[, ...]" into (city, state); a bare label is all city."""
+    first = label.find(", ")
+    if first < 0:
+        return label, None
+    second = label.find(", ", first + 2)
+    return label[:first], label[first + 2:] if second < 0 else label[first + 2:second]
+
+
+def posted_date(label: Optional[str], created_ms: Optional[int], today: date) -> Optional[date]:
+    """Resolve a "Today" / "3 days ago" label, falling back to a millisecond timestamp."""
+    if not label:
+        return datetime.fromtimestamp(created_ms / 1000).date() if created_ms else None
+    label = label.lower()
+    if "today" in label or "just now" in label or "few hours" in label:
+        return today
+    if "ago" in label:
+        m = DAYS_AGO_RE.search(label)
+        if m is None:
+            return None
+        days = int(m.group(1))
+        return today - (DAY_OFFSETS[days] if days < len(DAY_OFFSETS) else timedelta(days=days))
+    return datetime.fromtimestamp(created_ms / 1000).date() if created_ms else None
+
+
+def mentions_remote(title: str, location: str, description: str) -> bool:
+    """True when any field says remote / work from home / wfh; cheapest fields first.
+
+    One lower() plus substring checks beats a case-insensitive regex alternation
+    by an order of magnitude on description-sized text.
+    """
+    for text in (title, location, description):
+        text = text.lower()
+        if "remote" in text or "work from home" in text or "wfh" in text:
+            return True
+    return False
+
+
+def work_from_home_type(location: str, title: str, description: str) -> Optional[str]:
+    location, title, description = location.lower(), title.lower(), description.lower()
+    if "hybrid" in location or "hybrid" in title or "hybrid" in description:
+        return "Hybrid"
+    if "remote" in location or "remote" in title or "remote" in description:
+        return "Remote"
+    if "work from office" in description or not ("remote" in description or "hybrid" in description):
+        return "Work from office"
+    return None
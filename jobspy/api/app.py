@@ -3,16 +3,17 @@
 Main FastAPI application factory with enhanced features.
 """
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 import time
 from datetime import datetime
 
+from jobspy.api.compression import SmartCompressionMiddleware
 from jobspy.api.routes import profiles, searches, jobs, admin
-from jobspy.util import create_logger
+from jobspy.util import create_logger, close_markdown_pool
 from jobspy.config import get_config
+from jobspy.database import get_db
 
 log = create_logger("API")
 
@@ -24,10 +25,16 @@ async def lifespan(app: FastAPI):
     config = get_config()
     log.info(f"Environment: {config.environment}")
     log.info(f"Database configured: {bool(config.database.url)}")
+    db = get_db() if config.database.dsn else None
+    if db is not None and db.pool_enabled:
+        await db.get_pool()
 
     yield
 
     log.info("Shutting down JobSpy API...")
+    if db is not None:
+        await db.close_pool()
+    close_markdown_pool()
 
 
 def create_app() -> FastAPI:
@@ -39,6 +46,7 @@ def create_app() -> FastAPI:
         description="Intelligent Job Scraping and Matching Platform",
         version="2.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json"
@@ -52,22 +60,25 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    app.add_middleware(SmartCompressionMiddleware, minimum_size=1024, gzip_level=1)
+
+    untimed_paths = {"/", "/health"}
 
     @app.middleware("http")
     async def add_process_time_header(request: Request, call_next):
-        """Add processing time header to responses."""
-        start_time = time.time()
+        """Add processing time header to responses (skipped for root and health checks)."""
+        if request.url.path in untimed_paths:
+            return await call_next(request)
+        start_ns = time.perf_counter_ns()
         response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
+        response.headers["X-Process-Time"] = f"{(time.perf_counter_ns() - start_ns) / 1e9:.6f}"
         return response
 
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
         """Global exception handler for unhandled errors."""
         log.error(f"Unhandled exception: {exc}", exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "Internal server error",
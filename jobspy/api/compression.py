@@ -0,0 +1,121 @@
+# jobspy/api/compression.py
+"""
+Response compression middleware negotiating zstd > br > gzip.
+"""
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+# Streaming responses must reach the client chunk by chunk, never buffered
+UNBUFFERED_MEDIA_TYPES = ("text/event-stream", "application/x-ndjson")
+
+
+def parse_accept_encoding(value: str) -> set:
+    """Return the codings a client accepts, ignoring any with q=0."""
+    accepted = set()
+    for part in value.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                pass
+        accepted.add(coding)
+    return accepted
+
+
+class SmartCompressionMiddleware:
+    """Compress responses with the best coding both sides support.
+
+    zstd and brotli are used when the client accepts them and the libraries are
+    installed; everything else is handed to Starlette's GZipMiddleware. All
+    levels default to fast settings: on JSON most of the size win comes from
+    the lowest levels, and higher ones mostly cost CPU.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        zstd_level: int = 3,
+        brotli_quality: int = 4,
+        gzip_level: int = 1
+    ):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=gzip_level)
+        self.minimum_size = minimum_size
+        self.zstd_level = zstd_level
+        self.brotli_quality = brotli_quality
+
+    def choose_encoding(self, accept_encoding: str):
+        accepted = parse_accept_encoding(accept_encoding)
+        if zstandard is not None and "zstd" in accepted:
+            return "zstd"
+        if brotli is not None and "br" in accepted:
+            return "br"
+        return None
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "zstd":
+            return zstandard.ZstdCompressor(level=self.zstd_level).compress(body)
+        return brotli.compress(body, quality=self.brotli_quality)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = self.choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.gzip(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        chunks = []
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "").split(";")[0].strip()
+                if "content-encoding" in headers or media_type in UNBUFFERED_MEDIA_TYPES:
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            headers = MutableHeaders(raw=start_message["headers"])
+            if len(body) >= self.minimum_size:
+                body = self.compress(encoding, body)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+            headers["Content-Length"] = str(len(body))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
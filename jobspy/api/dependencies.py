@@ -2,6 +2,7 @@
 """
 FastAPI dependency injection for services and authentication.
 """
+from functools import lru_cache
 from typing import Optional
 from fastapi import Header, HTTPException, status
 from uuid import UUID
@@ -14,21 +15,27 @@ from jobspy.services import (
 from jobspy.config import get_config
 
 
+# Services only hold repositories and config, so one instance per process is
+# shared across requests instead of being rebuilt by every Depends() call.
+@lru_cache(maxsize=None)
 def get_profile_service() -> ProfileService:
     """Dependency injection for ProfileService."""
     return ProfileService()
 
 
+@lru_cache(maxsize=None)
 def get_job_search_service() -> JobSearchService:
     """Dependency injection for JobSearchService."""
     return JobSearchService()
 
 
+@lru_cache(maxsize=None)
 def get_scraper_service() -> JobScraperService:
     """Dependency injection for JobScraperService."""
     return JobScraperService()
 
 
+@lru_cache(maxsize=None)
 def get_matching_service() -> MatchingService:
     """Dependency injection for MatchingService."""
     return MatchingService()
@@ -48,8 +55,15 @@ async def get_current_user_id(
             detail="User authentication required. Provide X-User-ID header."
         )
 
+    # Reject malformed IDs before paying for UUID parsing and its exception
+    if len(x_user_id) != 36 or x_user_id.count("-") != 4:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid user ID format"
+        )
+
     try:
-        return UUID(x_user_id)
+        return _parse_user_id(x_user_id)
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -57,6 +71,12 @@ async def get_current_user_id(
         )
 
 
+@lru_cache(maxsize=1024)
+def _parse_user_id(value: str) -> UUID:
+    """Parse a canonical UUID string; the same users hit the API repeatedly."""
+    return UUID(hex=value)
+
+
 def get_api_key(x_api_key: Optional[str] = Header(None)) -> Optional[str]:
     """
     Optional API key validation for rate limiting.
@@ -37,6 +37,12 @@ class ProfileResponse(BaseModel):
     created_at: datetime
 
 
+class ParseResumeRequest(BaseModel):
+    """Request model for resume parsing."""
+    resume_text: str = Field(..., min_length=1)
+    auto_update: bool = False
+
+
 class JobSearchRequest(BaseModel):
     """Request model for job search."""
     keywords: List[str] = Field(..., min_items=1)
@@ -2,46 +2,79 @@
 """
 Admin endpoints for system management.
 """
-from fastapi import APIRouter, Depends, Query
-from typing import Dict, Any
+import hashlib
+import time
+from fastapi import APIRouter, Depends, Query, Request, Response
+from typing import Callable, Dict, Any, Tuple
 from datetime import datetime
 
+import orjson
+
+from jobspy.cache import clear_caches
 from jobspy.database import get_db
 from jobspy.config import get_config
 
 router = APIRouter()
 
+STATS_TABLES = {
+    "total_profiles": "profiles",
+    "total_jobs": "jobs",
+    "total_searches": "job_searches",
+    "total_matches": "job_matches",
+}
 
-@router.get("/stats")
-async def get_system_stats():
-    """Get system statistics."""
-    db = get_db()
+# Admin payloads change slowly; serve them from memory for a short window
+ADMIN_CACHE_TTL_SECONDS = 30
+_admin_cache: Dict[str, Tuple[float, Dict[str, Any], str]] = {}
 
-    stats = {}
 
-    try:
-        profile_count = db.table("profiles").select("id", count="exact").execute()
-        stats["total_profiles"] = profile_count.count or 0
-    except Exception:
-        stats["total_profiles"] = 0
+def _cached_payload(key: str, compute: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], str]:
+    """Return (payload, etag) for `key`, recomputing once the TTL has expired."""
+    now = time.monotonic()
+    entry = _admin_cache.get(key)
+    if entry and now - entry[0] < ADMIN_CACHE_TTL_SECONDS:
+        return entry[1], entry[2]
+    payload = compute()
+    etag = f'"{hashlib.md5(orjson.dumps(payload)).hexdigest()}"'
+    _admin_cache[key] = (now, payload, etag)
+    return payload, etag
 
-    try:
-        job_count = db.table("jobs").select("id", count="exact").execute()
-        stats["total_jobs"] = job_count.count or 0
-    except Exception:
-        stats["total_jobs"] = 0
 
-    try:
-        search_count = db.table("job_searches").select("id", count="exact").execute()
-        stats["total_searches"] = search_count.count or 0
-    except Exception:
-        stats["total_searches"] = 0
+def _cached_response(request: Request, response: Response, key: str, compute: Callable[[], Dict[str, Any]]):
+    payload, etag = _cached_payload(key, compute)
+    headers = {"ETag": etag, "Cache-Control": f"max-age={ADMIN_CACHE_TTL_SECONDS}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return payload
+
+
+@router.get("/stats")
+def get_system_stats(request: Request, response: Response):
+    """Get system statistics."""
+    return _cached_response(request, response, "stats", _compute_system_stats)
+
+
+def _compute_system_stats() -> Dict[str, Any]:
+    db = get_db()
 
     try:
-        match_count = db.table("job_matches").select("id", count="exact").execute()
-        stats["total_matches"] = match_count.count or 0
+        row = db.rpc("stats_counts").execute().data[0]
+        stats = {
+            "total_profiles": row.get("profiles") or 0,
+            "total_jobs": row.get("jobs") or 0,
+            "total_searches": row.get("searches") or 0,
+            "total_matches": row.get("matches") or 0,
+        }
     except Exception:
-        stats["total_matches"] = 0
+        # Fall back to per-table counts if the stats_counts() migration is not applied
+        stats = {}
+        for key, table in STATS_TABLES.items():
+            try:
+                result = db.table(table).select("*", count="exact", head=True).execute()
+                stats[key] = result.count or 0
+            except Exception:
+                stats[key] = 0
 
     return {
         "timestamp": datetime.now().isoformat(),
@@ -50,8 +83,12 @@ async def get_system_stats():
 
 
 @router.get("/config")
-async def get_system_config():
+async def get_system_config(request: Request, response: Response):
     """Get system configuration (sanitized)."""
+    return _cached_response(request, response, "config", _compute_system_config)
+
+
+def _compute_system_config() -> Dict[str, Any]:
     config = get_config()
 
     return {
@@ -74,7 +111,9 @@ async def get_system_config():
 @router.post("/cache/clear")
 async def clear_cache():
     """Clear application cache."""
+    _admin_cache.clear()
+    clear_caches()
     return {
         "status": "success",
-        "message": "Cache cleared (not yet implemented)"
+        "message": "Cache cleared"
     }
@@ -2,9 +2,13 @@
 """
 Job listing endpoints.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from uuid import UUID
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import orjson
+from pydantic import TypeAdapter
 
 from jobspy.api.models import JobResponse, JobMatchResponse, ErrorResponse
 from jobspy.api.dependencies import (
@@ -13,54 +17,108 @@ from jobspy.api.dependencies import (
     get_current_user_id
 )
 from jobspy.services import JobScraperService, MatchingService
+from jobspy.util import create_logger
 
 router = APIRouter()
+log = create_logger("API:jobs")
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Validate and serialize job lists in one pydantic-core pass instead of per item
+_JOB_LIST = TypeAdapter(List[JobResponse])
+_JOB = TypeAdapter(JobResponse)
+
+
+def _job_list_response(rows: List[Dict[str, Any]]) -> Response:
+    jobs = _JOB_LIST.validate_python(rows)
+    return Response(content=_JOB_LIST.dump_json(jobs), media_type="application/json")
+
+
+def _wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _ndjson_lines(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    # Same JobResponse shape as the JSON list; the 200 is already sent when a page
+    # fails, so the failure is reported as a final ErrorResponse line
+    try:
+        for row in rows:
+            yield _JOB.dump_json(_JOB.validate_python(row)) + b"\n"
+    except Exception as e:
+        log.error(f"NDJSON stream aborted: {e}")
+        error = ErrorResponse(error="Stream aborted", detail=str(e), code="STREAM_ERROR")
+        yield orjson.dumps(error.model_dump()) + b"\n"
+
+
+def _ndjson_response(rows: Iterable[Dict[str, Any]]) -> StreamingResponse:
+    """Stream rows as newline-delimited JSON as they are fetched."""
+    return StreamingResponse(_ndjson_lines(rows), media_type=NDJSON_MEDIA_TYPE)
 
 
 @router.get(
     "/jobs/recent",
-    response_model=List[JobResponse]
+    response_model=None,
+    responses={200: {"model": List[JobResponse]}}
 )
-async def get_recent_jobs(
+def get_recent_jobs(
+    request: Request,
     days: int = Query(default=7, ge=1, le=30),
     limit: int = Query(default=50, ge=1, le=200),
     service: JobScraperService = Depends(get_scraper_service)
 ):
-    """Get recently scraped jobs."""
+    """Get recently scraped jobs.
+
+    Send `Accept: application/x-ndjson` to stream one job per line instead.
+    """
+    if _wants_ndjson(request):
+        return _ndjson_response(service.iter_recent_jobs(days=days, limit=limit))
     jobs = service.get_recent_jobs(days=days, limit=limit)
-    return jobs
+    return _job_list_response(jobs)
 
 
 @router.get(
     "/jobs/search",
-    response_model=List[JobResponse]
+    response_model=None,
+    responses={200: {"model": List[JobResponse]}}
 )
-async def search_jobs(
+def search_jobs(
+    request: Request,
     keywords: Optional[str] = Query(default=None),
     location: Optional[str] = Query(default=None),
     is_remote: Optional[bool] = Query(default=None),
     limit: int = Query(default=50, ge=1, le=200),
     service: JobScraperService = Depends(get_scraper_service)
 ):
-    """Search existing jobs in database."""
+    """Search existing jobs in database.
+
+    Send `Accept: application/x-ndjson` to stream one job per line instead.
+    """
     keyword_list = None
     if keywords:
         keyword_list = [k.strip() for k in keywords.split(",")]
 
+    if _wants_ndjson(request):
+        return _ndjson_response(service.iter_search_jobs(
+            keywords=keyword_list,
+            location=location,
+            is_remote=is_remote,
+            limit=limit
+        ))
+
     jobs = service.search_jobs(
         keywords=keyword_list,
         location=location,
         is_remote=is_remote,
         limit=limit
     )
-    return jobs
+    return _job_list_response(jobs)
 
 
 @router.get(
     "/jobs/matches",
     response_model=List[JobMatchResponse]
 )
-async def get_my_top_matches(
+def get_my_top_matches(
     user_id: UUID = Depends(get_current_user_id),
     min_score: int = Query(default=45, ge=0, le=100),
     limit: int = Query(default=50, ge=1, le=100),
@@ -80,7 +138,7 @@ async def get_my_top_matches(
     response_model=JobResponse,
     responses={404: {"model": ErrorResponse}}
 )
-async def get_job(
+def get_job(
     job_id: UUID,
     service: JobScraperService = Depends(get_scraper_service)
 ):
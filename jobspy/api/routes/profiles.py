@@ -10,6 +10,7 @@ from jobspy.api.models import (
     ProfileCreate,
     ProfileUpdate,
     ProfileResponse,
+    ParseResumeRequest,
     ErrorResponse
 )
 from jobspy.api.dependencies import get_profile_service, get_current_user_id
@@ -24,7 +25,7 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED,
     responses={400: {"model": ErrorResponse}}
 )
-async def create_profile(
+def create_profile(
     profile_data: ProfileCreate,
     user_id: UUID = Depends(get_current_user_id),
     service: ProfileService = Depends(get_profile_service)
@@ -59,7 +60,7 @@ async def create_profile(
     response_model=ProfileResponse,
     responses={404: {"model": ErrorResponse}}
 )
-async def get_my_profile(
+def get_my_profile(
     user_id: UUID = Depends(get_current_user_id),
     service: ProfileService = Depends(get_profile_service)
 ):
@@ -79,16 +80,13 @@ async def get_my_profile(
     "/profiles/me",
     response_model=ProfileResponse
 )
-async def update_my_profile(
+def update_my_profile(
     updates: ProfileUpdate,
     user_id: UUID = Depends(get_current_user_id),
     service: ProfileService = Depends(get_profile_service)
 ):
     """Update current user's profile."""
-    update_data = {
-        k: v for k, v in updates.model_dump().items()
-        if v is not None
-    }
+    update_data = updates.model_dump(exclude_none=True)
 
     if not update_data:
         raise HTTPException(
@@ -111,23 +109,15 @@ async def update_my_profile(
     "/profiles/me/parse-resume",
     response_model=dict
 )
-async def parse_resume(
-    resume: dict,
+def parse_resume(
+    resume: ParseResumeRequest,
     user_id: UUID = Depends(get_current_user_id),
     service: ProfileService = Depends(get_profile_service)
 ):
     """Parse resume text to extract skills and experience."""
-    resume_text = resume.get("resume_text", "")
+    parsed_data = service.parse_resume(resume.resume_text)
 
-    if not resume_text:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="resume_text is required"
-        )
-
-    parsed_data = service.parse_resume(resume_text)
-
-    if resume.get("auto_update", False):
+    if resume.auto_update:
         service.update_profile(user_id, parsed_data)
 
     return parsed_data
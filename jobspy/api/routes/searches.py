@@ -2,10 +2,15 @@
 """
 Job search endpoints.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import Response
 from uuid import UUID
 from typing import List, Optional
 
+from pydantic import TypeAdapter
+
 from jobspy.api.models import (
     JobSearchRequest,
     JobSearchResponse,
@@ -17,6 +22,12 @@ from jobspy.services import JobSearchService
 
 router = APIRouter()
 
+# Match rows carry the joined job; validate and serialize them in one pydantic-core pass
+_MATCH_LIST = TypeAdapter(List[JobMatchResponse])
+
+# Results for a finished search rarely change; let clients revalidate cheaply
+SEARCH_RESULTS_MAX_AGE = 60
+
 
 @router.post(
     "/searches",
@@ -24,7 +35,7 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED,
     responses={400: {"model": ErrorResponse}}
 )
-async def create_search(
+def create_search(
     search_request: JobSearchRequest,
     user_id: UUID = Depends(get_current_user_id),
     service: JobSearchService = Depends(get_job_search_service)
@@ -61,7 +72,7 @@ async def create_search(
     "/searches",
     response_model=List[dict]
 )
-async def get_my_searches(
+def get_my_searches(
     user_id: UUID = Depends(get_current_user_id),
     limit: int = Query(default=20, ge=1, le=100),
     service: JobSearchService = Depends(get_job_search_service)
@@ -73,9 +84,11 @@ async def get_my_searches(
 
 @router.get(
     "/searches/{search_id}/results",
-    response_model=List[JobMatchResponse]
+    response_model=None,
+    responses={200: {"model": List[JobMatchResponse]}}
 )
 async def get_search_results(
+    request: Request,
     search_id: UUID,
     user_id: UUID = Depends(get_current_user_id),
     min_score: Optional[int] = Query(default=None, ge=0, le=100),
@@ -83,8 +96,17 @@ async def get_search_results(
 ):
     """Get matched results for a specific search."""
     try:
-        results = service.get_search_results(search_id, min_score=min_score)
-        return results
+        results = _MATCH_LIST.validate_python(
+            await service.fetch_search_results(search_id, min_score=min_score, profile_id=user_id)
+        )
+        body = _MATCH_LIST.dump_json(results)
+        headers = {
+            "ETag": f'"{hashlib.md5(body).hexdigest()}"',
+            "Cache-Control": f"private, max-age={SEARCH_RESULTS_MAX_AGE}"
+        }
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
 
     except Exception as e:
         raise HTTPException(
@@ -0,0 +1,140 @@
+# jobspy/cache.py
+"""
+In-process TTL caches for deterministic service results.
+"""
+import asyncio
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from jobspy.config import get_config
+
+_caches: List["TTLCache"] = []
+_groups: Dict[str, List["TTLCache"]] = {}
+# Guards lazy cache creation and the registries above
+_registry_lock = threading.Lock()
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire `ttl` seconds after being stored.
+
+    Least recently used entries are evicted first once `maxsize` is reached.
+    Safe to share between threadpool workers.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def evict(self, match: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key satisfies `match`."""
+        with self._lock:
+            for key in [k for k in self._data if match(k)]:
+                del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def clear_caches() -> None:
+    """Empty every cache created by `ttl_cached`."""
+    with _registry_lock:
+        caches = list(_caches)
+    for cache in caches:
+        cache.clear()
+
+
+def evict_group(group: str, match: Callable[[Hashable], bool]) -> None:
+    """Drop matching entries from every `ttl_cached` cache registered under `group`."""
+    with _registry_lock:
+        caches = list(_groups.get(group, ()))
+    for cache in caches:
+        cache.evict(match)
+
+
+def ttl_cached(key: Callable[..., Hashable], ttl_field: str = "ttl_seconds", group: Optional[str] = None):
+    """
+    Cache a function's results in a TTLCache sized from `config.cache`.
+
+    Args:
+        key: Called with the wrapped function's arguments; returns the cache key
+        ttl_field: `config.cache` field holding this cache's lifetime in seconds
+        group: Name under which writers can drop stale entries with `evict_group`
+
+    Falsy results are not stored, so the empty lists repositories return on
+    errors are retried on the next call. Works for sync and async functions.
+    """
+    def decorator(func):
+        state: dict = {}
+
+        def get_cache() -> Optional[TTLCache]:
+            cfg = get_config().cache
+            if not cfg.enabled:
+                return None
+            if "cache" not in state:
+                with _registry_lock:
+                    # another thread may have built it while this one waited
+                    if "cache" not in state:
+                        cache = TTLCache(cfg.max_size, getattr(cfg, ttl_field))
+                        _caches.append(cache)
+                        if group is not None:
+                            _groups.setdefault(group, []).append(cache)
+                        state["cache"] = cache
+            return state["cache"]
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache = get_cache()
+                if cache is None:
+                    return await func(*args, **kwargs)
+                k = key(*args, **kwargs)
+                result = cache.get(k)
+                if result is None:
+                    result = await func(*args, **kwargs)
+                    if result:
+                        cache.set(k, result)
+                return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_cache()
+            if cache is None:
+                return func(*args, **kwargs)
+            k = key(*args, **kwargs)
+            result = cache.get(k)
+            if result is None:
+                result = func(*args, **kwargs)
+                if result:
+                    cache.set(k, result)
+            return result
+        return wrapper
+    return decorator
@@ -6,19 +6,28 @@ from pathlib import Path
 from typing import Optional, List
 from pydantic import BaseModel, Field, validator
 import os
+import settings
 
 
 class DatabaseConfig(BaseModel):
     url: str = Field(..., env="SUPABASE_URL")
     anon_key: str = Field(..., env="SUPABASE_ANON_KEY")
     service_role_key: str = Field(..., env="SUPABASE_SERVICE_ROLE_KEY")
+    # Optional direct Postgres DSN; enables the asyncpg read path when asyncpg is installed
+    dsn: str = Field(default="", env="SUPABASE_DB_URL")
+    # asyncpg pool bounds per worker process; total connections are these times the worker count
+    pool_min_size: int = Field(default=1, env="DB_POOL_MIN_SIZE")
+    pool_max_size: int = Field(default=5, env="DB_POOL_MAX_SIZE")
 
     @classmethod
     def from_env(cls):
         return cls(
             url=os.getenv("SUPABASE_URL", ""),
             anon_key=os.getenv("SUPABASE_ANON_KEY", ""),
-            service_role_key=os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
+            service_role_key=os.getenv("SUPABASE_SERVICE_ROLE_KEY", ""),
+            dsn=os.getenv("SUPABASE_DB_URL", ""),
+            pool_min_size=int(os.getenv("DB_POOL_MIN_SIZE", 1)),
+            pool_max_size=int(os.getenv("DB_POOL_MAX_SIZE", 5))
         )
 
 
@@ -42,37 +51,25 @@ class ScraperConfig(BaseModel):
 
 
 class MatchingConfig(BaseModel):
-    primary_skills: List[str] = [
-        "linux", "shell", "bash", "python", "jenkins", "bitbucket",
-        "azure", "aws", "terraform", "ci_cd", "automation", "cloudops",
-        "monitoring", "alerting", "log_analysis", "network_fundamentals",
-        "mft", "sftp", "ftps", "ftp", "as2", "goanywhere", "fms", "ftg",
-        "servicenow", "itil", "incident_management", "sla_management"
-    ]
-
-    secondary_skills: List[str] = [
-        "java", "spring boot", "rest api", "microservices", "docker", "kubernetes",
-        "observability", "grafana", "prometheus", "databricks", "spark"
-    ]
-
-    exclude_signals: List[str] = [
-        "frontend", "react", "vue", "angular", "ux", "ui",
-        "dsa", "competitive programming", "html", "css"
-    ]
-
-    primary_weight: int = 12
-    secondary_weight: int = 5
-    mft_bonus: int = 10
-    oncall_bonus: int = 7
-    cloud_bonus: int = 5
-    support_bonus: int = 6
-    dev_penalty: int = 30
-    min_score: int = 45
+    # Defaults come from settings.py so the API matcher and ProfileMatchEvaluator share one profile
+    primary_skills: List[str] = Field(default_factory=lambda: list(settings.PROFILE_PRIMARY_SKILLS))
+    secondary_skills: List[str] = Field(default_factory=lambda: list(settings.PROFILE_SECONDARY_SKILLS))
+    exclude_signals: List[str] = Field(default_factory=lambda: list(settings.PROFILE_EXCLUDE_SIGNALS))
+
+    primary_weight: int = settings.EVAL_PRIMARY_WEIGHT
+    secondary_weight: int = settings.EVAL_SECONDARY_WEIGHT
+    mft_bonus: int = settings.EVAL_MFT_BONUS
+    oncall_bonus: int = settings.EVAL_ONCALL_BONUS
+    cloud_bonus: int = settings.EVAL_CLOUD_BONUS
+    support_bonus: int = settings.EVAL_SUPPORT_BONUS
+    dev_penalty: int = settings.EVAL_DEV_PENALTY
+    min_score: int = settings.PROFILE_MIN_SCORE
 
 
 class CacheConfig(BaseModel):
     enabled: bool = True
     ttl_seconds: int = 3600
+    search_results_ttl_seconds: int = 60  # also evicted whenever matches for the search are written
     max_size: int = 1000
 
 
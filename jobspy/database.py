@@ -2,19 +2,37 @@
 """
 Database connection and session management using Supabase.
 """
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
+import orjson
 from supabase import create_client, Client
 from jobspy.config import get_config
 from jobspy.util import create_logger
 
+try:
+    import asyncpg
+except ImportError:  # optional; only needed for direct Postgres reads
+    asyncpg = None
+
 log = create_logger("Database")
 
 
+async def _init_connection(conn) -> None:
+    """Decode jsonb columns to Python objects, as PostgREST does."""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=lambda v: orjson.dumps(v).decode(),
+        decoder=orjson.loads,
+        schema="pg_catalog"
+    )
+
+
 class Database:
     """Supabase database client wrapper with connection pooling."""
 
     _instance: Optional['Database'] = None
     _client: Optional[Client] = None
+    _pool = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -45,16 +63,52 @@ class Database:
         """Get a table reference."""
         return self.client.table(name)
 
+    def rpc(self, fn: str, params: Optional[Dict[str, Any]] = None):
+        """Call a Postgres function exposed through PostgREST."""
+        return self.client.rpc(fn, params or {})
+
+    @property
+    def pool_enabled(self) -> bool:
+        """Whether read paths can bypass PostgREST and query Postgres directly."""
+        return asyncpg is not None and bool(get_config().database.dsn)
+
+    async def get_pool(self):
+        """Get the asyncpg pool, creating it on first use.
+
+        Each worker process opens its own pool, so up to `pool_max_size` times the
+        worker count connections can be held against Postgres at once.
+        """
+        if self._pool is None:
+            db_config = get_config().database
+            self._pool = await asyncpg.create_pool(
+                db_config.dsn,
+                min_size=db_config.pool_min_size,
+                max_size=db_config.pool_max_size,
+                command_timeout=30,
+                init=_init_connection
+            )
+            log.info("Postgres pool established")
+        return self._pool
+
+    async def close_pool(self):
+        """Close the asyncpg pool if one was opened."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            log.info("Postgres pool closed")
+
     def close(self):
         """Close database connection."""
         self._client = None
         log.info("Database connection closed")
 
 
-# Singleton instance
-db = Database()
-
-
+@lru_cache(maxsize=1)
 def get_db() -> Database:
-    """Dependency injection helper for database."""
-    return db
+    """
+    Dependency injection helper for database.
+
+    The client is created on first use rather than at import, so CLI commands
+    and tests that never touch the database don't need credentials.
+    """
+    return Database()
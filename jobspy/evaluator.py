@@ -1,94 +1,159 @@
 # jobspy/evaluator.py
 from __future__ import annotations
 import re
-from typing import List, Dict
+from functools import lru_cache
+from typing import Container, Iterable, List, Optional, Set, TypedDict
 import settings
 
+try:
+    import ahocorasick
+except ImportError:  # optional; KeywordScanner falls back to plain substring checks
+    ahocorasick = None
+
+ONCALL_KEYWORDS = ("on-call", "on call", "rota", "rotation", "shift", "night shift", "24x7")
+MFT_KEYWORDS = ("mft", "goanywhere", "go-anywhere", "go anywhere", "managed file transfer", "fms", "ftg")
+CLOUD_KEYWORDS = ("azure", "aws", "gcp", "google cloud")
+SUPPORT_KEYWORDS = ("production", "support", "incident", "l2", "l3", "troubleshoot", "root cause",
+                    "incident management", "problem management", "service desk", "ticket")
+DEV_KEYWORDS = ("develop", "implementation", "design", "feature", "software engineer", "engineer -")
+ITSM_KEYWORDS = ("servicenow", "itil", "incident")
+CICD_KEYWORDS = ("jenkins", "ci/cd")
+DEV_HEAVY_KEYWORDS = ("software engineer", "senior backend", "full stack", "frontend")
+SERVICENOW_ALIASES = ("service now", "service-now", "servicenow")
+DESIRED_SKILLS = ("linux", "sftp", "servicenow", "itil")
+
+EXPERIENCE_REGEX = re.compile(r"(?P<min>\d+)[+]?\s*[-–to]{0,3}\s*(?P<max>\d+)?\s*years?", re.I)
+# Experience requirements sit near the top of a JD; don't scan the long tail
+EXPERIENCE_SEARCH_LIMIT = 4096
+
+class MatchEvaluation(TypedDict, total=False):
+    match_score: int
+    match_reasons: List[str]
+    missing_skills: List[str]
+    key_skills: List[str]
+    experience_range: Optional[str]
+    resume_alignment_level: str
+    why_this_job_fits: Optional[str]
+
 def norm_text(text: str) -> str:
     if not text: return ""
     return text.lower()
 
+# Shared with MatchingService so both scorers read experience and clouds the same way
+def extract_experience(text: str) -> Optional[str]:
+    m = EXPERIENCE_REGEX.search(text, 0, EXPERIENCE_SEARCH_LIMIT)
+    if m:
+        min_exp = m.group("min")
+        max_exp = m.group("max")
+        if max_exp:
+            return f"{min_exp}-{max_exp} years"
+        return f"{min_exp}+ years"
+    return None
+
+def detect_clouds(found: Container[str]) -> List[str]:
+    """`found` is either lowered job text or a set of scan hits; both support `in`."""
+    clouds = []
+    if "azure" in found: clouds.append("Azure")
+    if "aws" in found: clouds.append("AWS")
+    if "gcp" in found or "google cloud" in found: clouds.append("GCP")
+    return clouds
+
+class KeywordScanner:
+    """Report which of a fixed set of keywords occur in a text, in one pass.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed and one
+    substring check per keyword otherwise; both give identical results.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(k for k in keywords if k))
+        self._automaton = None
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for k in self.keywords: automaton.add_word(k, k)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def scan(self, text: str) -> Set[str]:
+        if not text: return set()
+        if self._automaton is None: return {k for k in self.keywords if k in text}
+        return {k for _, k in self._automaton.iter(text)}
+
+@lru_cache(maxsize=8)
+def _build_scanner(skills: tuple) -> KeywordScanner:
+    return KeywordScanner(
+        skills + ONCALL_KEYWORDS + MFT_KEYWORDS + CLOUD_KEYWORDS + SUPPORT_KEYWORDS
+        + DEV_KEYWORDS + ITSM_KEYWORDS + CICD_KEYWORDS + DEV_HEAVY_KEYWORDS + SERVICENOW_ALIASES + DESIRED_SKILLS
+    )
+
+@lru_cache(maxsize=1)
+def _build_exclude_regex(signals: tuple) -> re.Pattern | None:
+    """All exclusion signals as one word-bounded alternation; longest first so prefixes don't shadow."""
+    signals = sorted(set(signals), key=len, reverse=True)
+    return re.compile(r"\b(" + "|".join(map(re.escape, signals)) + r")\b") if signals else None
+
 class ProfileMatchEvaluator:
-    def __init__(self):
-        self.exp_regex = re.compile(r"(?P<min>\d+)[+]?\s*[-–to]{0,3}\s*(?P<max>\d+)?\s*years?", re.I)
-
-    def _extract_skills(self, text: str) -> List[str]:
-        txt = norm_text(text)
-        found = set()
-        for skill in settings.PROFILE_PRIMARY_SKILLS + settings.PROFILE_SECONDARY_SKILLS:
-            if skill in txt:
-                found.add(skill)
-        if "service now" in txt or "service-now" in txt or "servicenow" in txt:
-            found.add("servicenow")
-        return sorted(found)
-
-    def _extract_experience(self, text: str) -> str | None:
-        txt = norm_text(text)
-        m = self.exp_regex.search(txt)
-        if m:
-            min_exp = m.group("min")
-            max_exp = m.group("max")
-            if max_exp:
-                return f"{min_exp}-{max_exp} years"
-            return f"{min_exp}+ years"
-        return None
-
-    def _detect_oncall(self, text: str) -> bool:
-        txt = norm_text(text)
-        return any(k in txt for k in ["on-call", "on call", "rota", "rotation", "shift", "night shift", "24x7"])
-
-    def _detect_mft(self, text: str) -> bool:
-        txt = norm_text(text)
-        return any(k in txt for k in ["mft", "goanywhere", "go-anywhere", "go anywhere", "managed file transfer", "fms", "ftg"])
-
-    def _detect_cloud(self, text: str) -> List[str]:
-        txt = norm_text(text)
-        clouds = []
-        if "azure" in txt: clouds.append("Azure")
-        if "aws" in txt: clouds.append("AWS")
-        if "gcp" in txt or "google cloud" in txt: clouds.append("GCP")
-        return clouds
-
-    def _detect_support_signal(self, text: str) -> tuple[bool, List[str]]:
-        txt = norm_text(text)
-        support_keywords = ["production", "support", "incident", "l2", "l3", "troubleshoot", "root cause",
-                           "incident management", "problem management", "service desk", "ticket"]
-        dev_keywords = ["develop", "implementation", "design", "feature", "software engineer", "engineer -"]
-        has_support = any(k in txt for k in support_keywords)
-        has_dev = any(k in txt for k in dev_keywords)
-        return has_support and not has_dev, [k for k in support_keywords if k in txt]
-
-    def evaluate(self, text: str) -> Dict:
-        txt = text or ""
+    def __init__(self) -> None:
+        self.all_skills = tuple(dict.fromkeys(settings.PROFILE_PRIMARY_SKILLS + settings.PROFILE_SECONDARY_SKILLS))
+        self.primary_skills = frozenset(settings.PROFILE_PRIMARY_SKILLS)
+        self.secondary_skills = frozenset(settings.PROFILE_SECONDARY_SKILLS)
+        # Built once per distinct profile settings and shared by every evaluator instance
+        self.scanner = _build_scanner(self.all_skills)
+        self.exclude_regex = _build_exclude_regex(tuple(settings.PROFILE_EXCLUDE_SIGNALS))
+
+    def _extract_skills(self, hits: Set[str]) -> List[str]:
+        # Profile order (primary before secondary) is already deterministic; no sort needed
+        found = [skill for skill in self.all_skills if skill in hits]
+        if "servicenow" not in found and any(k in hits for k in SERVICENOW_ALIASES):
+            found.append("servicenow")
+        return found
+
+    def _extract_experience(self, lowered: str) -> Optional[str]:
+        return extract_experience(lowered)
+
+    def _detect_oncall(self, hits: Set[str]) -> bool:
+        return any(k in hits for k in ONCALL_KEYWORDS)
+
+    def _detect_mft(self, hits: Set[str]) -> bool:
+        return any(k in hits for k in MFT_KEYWORDS)
+
+    def _detect_cloud(self, hits: Set[str]) -> List[str]:
+        return detect_clouds(hits)
+
+    def _detect_support_signal(self, hits: Set[str]) -> bool:
+        if not any(k in hits for k in SUPPORT_KEYWORDS):
+            return False
+        return not any(k in hits for k in DEV_KEYWORDS)
+
+    def evaluate_batch(self, texts: Iterable[str]) -> List[MatchEvaluation]:
+        """Score many job texts with this one instance, reusing its scanner and compiled regexes."""
+        evaluate = self.evaluate
+        return [evaluate(t) for t in texts]
+
+    def evaluate(self, text: str) -> MatchEvaluation:
         score = 0
         reasons: List[str] = []
-        key_skills = self._extract_skills(txt)
-
-        lowered = norm_text(txt)
-        for ex in settings.PROFILE_EXCLUDE_SIGNALS:
-            try:
-                if re.search(rf"\b{re.escape(ex)}\b", lowered, re.I):
-                    return {
-                        "match_score": 0,
-                        "match_reasons": [f"Exclusion signal: '{ex}'"],
-                        "missing_skills": [],
-                        "key_skills": key_skills,
-                        "experience_range": self._extract_experience(txt),
-                        "resume_alignment_level": "Ignore",
-                    }
-            except re.error:
-                if ex in lowered:
-                    return {
-                        "match_score": 0,
-                        "match_reasons": [f"Exclusion signal: '{ex}'"],
-                        "missing_skills": [],
-                        "key_skills": key_skills,
-                        "experience_range": self._extract_experience(txt),
-                        "resume_alignment_level": "Ignore",
-                    }
-
-        primary_hits = [s for s in key_skills if s in settings.PROFILE_PRIMARY_SKILLS]
-        secondary_hits = [s for s in key_skills if s in settings.PROFILE_SECONDARY_SKILLS]
+        # Lowercase once; every helper works off `lowered` or the scan hits
+        lowered = norm_text(text)
+        exp = self._extract_experience(lowered)
+
+        # Excluded jobs are dropped anyway, so reject them before the keyword scan
+        excluded = self.exclude_regex.search(lowered) if self.exclude_regex else None
+        if excluded:
+            return {
+                "match_score": 0,
+                "match_reasons": [f"Exclusion signal: '{excluded.group(1)}'"],
+                "missing_skills": [],
+                "key_skills": [],
+                "experience_range": exp,
+                "resume_alignment_level": "Ignore",
+            }
+
+        hits = self.scanner.scan(lowered)
+        key_skills = self._extract_skills(hits)
+
+        primary_hits = [s for s in key_skills if s in self.primary_skills]
+        secondary_hits = [s for s in key_skills if s in self.secondary_skills]
 
         score += min(len(primary_hits) * settings.EVAL_PRIMARY_WEIGHT, 60)
         if primary_hits: reasons.append(f"Primary skills: {', '.join(primary_hits)}")
@@ -96,41 +161,38 @@ class ProfileMatchEvaluator:
         score += min(len(secondary_hits) * settings.EVAL_SECONDARY_WEIGHT, 15)
         if secondary_hits: reasons.append(f"Secondary skills: {', '.join(secondary_hits)}")
 
-        if self._detect_mft(txt):
+        if self._detect_mft(hits):
             score += settings.EVAL_MFT_BONUS
             reasons.append("MFT / file transfer tools")
-        if self._detect_oncall(txt):
+        if self._detect_oncall(hits):
             score += settings.EVAL_ONCALL_BONUS
             reasons.append("On-call / shift work")
-        clouds = self._detect_cloud(txt)
+        clouds = self._detect_cloud(hits)
         if clouds:
             score += min(5 * len(clouds), 10)
             reasons.append(f"Cloud: {', '.join(clouds)}")
-        if any(k in lowered for k in ["servicenow", "itil", "incident"]):
+        if any(k in hits for k in ITSM_KEYWORDS):
             score += 8
             reasons.append("ServiceNow/ITIL/incident")
-        if any(k in lowered for k in ["jenkins", "ci/cd"]):
+        if any(k in hits for k in CICD_KEYWORDS):
             score += 4
             reasons.append("CI/CD")
-        support_signal, _ = self._detect_support_signal(txt)
-        if support_signal:
+        if self._detect_support_signal(hits):
             score += settings.EVAL_SUPPORT_BONUS
             reasons.append("Support/production oriented")
         else:
-            if any(k in lowered for k in ["software engineer", "senior backend", "full stack", "frontend"]):
+            if any(k in hits for k in DEV_HEAVY_KEYWORDS):
                 reasons.append("Development heavy; down-ranked")
                 score = max(score - settings.EVAL_DEV_PENALTY, 0)
 
         score = max(0, min(100, int(score)))
-        desired = ["linux", "sftp", "servicenow", "itil"]
-        missing = [d for d in desired if d not in key_skills and d not in lowered]
+        missing = [d for d in DESIRED_SKILLS if d not in key_skills and d not in hits]
 
         if score >= 70: level = "Strong Match"
         elif score >= 45: level = "Good Match"
         elif score >= 20: level = "Stretch Role"
         else: level = "Ignore"
 
-        exp = self._extract_experience(txt)
         if exp: reasons.append(f"Experience: {exp}")
 
         return {
@@ -2,8 +2,8 @@
 from typing import Callable, Optional
 
 class JobScrapingException(Exception):
-    def __init__(self, message: str, code: str = "GEN_ERROR", resolve: Optional[Callable[[], str]] = None, retry_after: Optional[int] = None, *args, **kwargs):
-        super().__init__(message, *args, **kwargs)
+    def __init__(self, message: str, code: str = "GEN_ERROR", resolve: Optional[Callable[[], str]] = None, retry_after: Optional[int] = None):
+        super().__init__(message)
         self.code = code
         self.resolve = resolve
         self.retry_after = retry_after
@@ -11,13 +11,15 @@ class JobScrapingException(Exception):
 class PageFetchError(JobScrapingException):
     def __init__(self, url: str, status_code: int):
         msg = f"Failed to fetch {url} – Status {status_code}"
-        super().__init__(msg, code=f"PAGE_{status_code}", url=url)
+        super().__init__(msg, code=f"PAGE_{status_code}")
+        self.url = url
+        self.status_code = status_code
 
 class ResumeParsingException(JobScrapingException):
     def __init__(self, error_msg: str, missing_sections: Optional[list[str]] = None):
         msg = f"Resume analysis failed: {error_msg}"
-        sections = ", ".join(missing_sections or ["any"])
-        super().__init__(msg, code="RESUME_PARSE_ERROR", missing_sections=sections)
+        super().__init__(msg, code="RESUME_PARSE_ERROR")
+        self.missing_sections = ", ".join(missing_sections or ["any"])
 
 class SiteAuthorizationError(JobScrapingException):
     def __init__(self, site: str, message: str):
@@ -30,7 +32,8 @@ class SiteAuthorizationError(JobScrapingException):
 
 class JobURLValidationError(JobScrapingException):
     def __init__(self, url: str):
-        super().__init__(f"Invalid job URL: {url}", code="INVALID_URL", url=url)
+        super().__init__(f"Invalid job URL: {url}", code="INVALID_URL")
+        self.url = url
 
 class RateLimitError(JobScrapingException):
     def __init__(self, remaining: int, headers: dict):
@@ -45,14 +48,22 @@ class RateLimitError(JobScrapingException):
 class APIResponseFormatError(JobScrapingException):
     def __init__(self, service: str, expected: str, received: str):
         msg = f"Unexpected response from {service}"
-        super().__init__(msg, code=f"FORMAT_{service.upper()}", service=service, expected=expected, received=received)
+        super().__init__(msg, code=f"FORMAT_{service.upper()}")
+        self.service = service
+        self.expected = expected
+        self.received = received
 
 class RecaptchaChallenge(JobScrapingException):
     def __init__(self, site: str, challenge: str):
         msg = f"CAPTCHA required for {site}"
-        super().__init__(msg, code="CAPTCHA_REQ", challenge=challenge, resolve="Check rate limits or use headless browser")
+        super().__init__(msg, code="CAPTCHA_REQ", resolve=lambda: "Check rate limits or use headless browser")
+        self.challenge = challenge
 
 class DataValidationError(Exception):
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
     def __str__(self):
         return f"Data validation failed: {self.errors}"
 
@@ -63,4 +74,4 @@ class LinkedInException(JobScrapingException):
 
 class NaukriException(JobScrapingException):
     def __init__(self, message: str):
-        super().__init__(message, code="NAUKRI_ERROR")
\ No newline at end of file
+        super().__init__(message, code="NAUKRI_ERROR")
@@ -1,6 +1,8 @@
 # jobspy/linkedin/constant.py
 import settings
 
+SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search?"
+
 headers = {
     "authority": "www.linkedin.com",
     "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
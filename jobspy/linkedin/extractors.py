@@ -1,25 +1,45 @@
 """Thin wrapper utilities to invoke existing extractors in removed_scripts.
-These are thin convenience functions for the prototype. They run the existing scripts
-via subprocess and return the process object for monitoring.
+The requests extractor runs in-process on a background thread and returns a Future
+(its result is the summary dict); pass in_process=False to run it as a subprocess
+instead. The selenium extractor always runs via subprocess and returns the process
+object for monitoring.
 """
+from concurrent.futures import Future, ThreadPoolExecutor
 from subprocess import Popen
 import shlex
 import os
+import threading
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 
+_executor = None
+_executor_lock = threading.Lock()
 
-def run_selenium_extractor(input_csv: str, url_column: str = 'URL', output_dir: str = 'outputs', batch_size: int = 100, workers: int = 1, headless: bool = True, single_driver: bool = True):
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="extractor")
+        return _executor
+
+
+def run_selenium_extractor(input_csv: str, url_column: str = 'URL', output_dir: str = 'outputs', batch_size: int = 100, workers: int = 1, headless: bool = True, single_driver: bool = True, reuse_driver: bool = False):
     cmd = ["python", os.path.join(ROOT, 'removed_scripts', 'linkedin_contact_extractor_selenium.py'), "--input", input_csv, "--url-column", url_column, "--output-dir", output_dir, "--batch-size", str(batch_size), "--workers", str(workers)]
     if headless:
         cmd.append("--headless")
     if single_driver:
         cmd.append("--single-driver")
+    if reuse_driver:
+        cmd.append("--reuse-driver")
     proc = Popen([str(c) for c in cmd])
     return proc
 
 
-def run_requests_extractor(input_csv: str, url_column: str = 'URL', output_dir: str = 'outputs', max_profiles: int = None):
+def run_requests_extractor(input_csv: str, url_column: str = 'URL', output_dir: str = 'outputs', max_profiles: int = None, in_process: bool = True) -> Future | Popen:
+    if in_process:
+        from removed_scripts.linkedin_contact_extractor import run
+        return _get_executor().submit(run, input_csv, url_column=url_column, output_dir=output_dir, max_profiles=max_profiles)
     cmd = ["python", os.path.join(ROOT, 'removed_scripts', 'linkedin_contact_extractor.py'), "--input", input_csv, "--url-column", url_column, "--output-dir", output_dir]
     if max_profiles:
         cmd.extend(["--max-profiles", str(max_profiles)])
@@ -3,86 +3,179 @@ from __future__ import annotations
 import math
 import random
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlparse, urlunparse, unquote
 import regex as re
-from bs4 import BeautifulSoup
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 from jobspy.model import (
     JobPost, Location, JobResponse, Country, Compensation, DescriptionFormat,
     Scraper, ScraperInput, Site,
 )
 from jobspy.util import (
-    extract_emails_from_text, currency_parser, markdown_converter,
-    create_session, remove_attributes, create_logger,
+    extract_emails_from_text, currency_parser, markdown_converter_batch,
+    cached_session, BARE_HTML, create_logger, TokenBucket, SeenIds, HTML_PARSER, has_class, throttle_feedback,
 )
-from jobspy.linkedin.util import is_job_remote, job_type_code, parse_job_type, parse_job_level, parse_company_industry
+from jobspy.exception import LinkedInException
+from jobspy._hotparse import split_location
+from jobspy.linkedin.constant import SEARCH_PATH, headers
+from jobspy.linkedin.util import is_job_remote, job_type_code, parse_detail_parts, criteria_fields
 import settings
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional
+    LexborHTMLParser = None
+
 log = create_logger("LinkedIn")
 
+# (connect, read) seconds: a stalled host fails fast instead of pinning a worker thread
+PAGE_TIMEOUT = (3.05, 10)
+DETAIL_TIMEOUT = (3.05, 5)
+
+# Only the job cards of a search page are read, so only they are built into a tree
+SEARCH_CARDS = SoupStrainer("div", class_=has_class("base-search-card"))
+# Likewise a detail page only needs its description, criteria list and logo
+DETAIL_PARTS = SoupStrainer(class_=has_class("show-more-less-html__markup", "description__job-criteria-list", "artdeco-entity-image"))
+
+CARD_LINK, CARD_TITLE, CARD_COMPANY = "a.base-card__full-link", "span.sr-only", "h4.base-search-card__subtitle a"
+CARD_SALARY, CARD_LOCATION = "span.job-search-card__salary-info", "div.base-search-card__metadata span.job-search-card__location"
+CARD_LISTDATE = "div.base-search-card__metadata time.job-search-card__listdate"
+
+
+def _node_fields(card) -> dict:
+    """Read a lexbor search card into the plain fields _process_job uses."""
+    title, company = card.css_first(CARD_TITLE), card.css_first(CARD_COMPANY)
+    salary, location, listdate = card.css_first(CARD_SALARY), card.css_first(CARD_LOCATION), card.css_first(CARD_LISTDATE)
+    return {
+        "title": title.text(strip=True) if title else None,
+        "company": company.text(strip=True) if company else None,
+        "company_href": company.attributes.get("href") if company else None,
+        "salary": salary.text(separator=" ").strip() if salary else None,
+        "location": location.text().strip() if location else None,
+        "listdate": listdate.attributes.get("datetime") if listdate else None,
+    }
+
+
+def _tag_fields(card: Tag) -> dict:
+    """BeautifulSoup twin of _node_fields."""
+    title, company = card.find("span", class_="sr-only"), card.find("h4", class_="base-search-card__subtitle")
+    company = company.find("a") if company else None
+    salary, metadata = card.find("span", class_="job-search-card__salary-info"), card.find("div", class_="base-search-card__metadata")
+    location = metadata.find("span", class_="job-search-card__location") if metadata else None
+    listdate = metadata.find("time", class_="job-search-card__listdate") if metadata else None
+    return {
+        "title": title.get_text(strip=True) if title else None,
+        "company": company.get_text(strip=True) if company else None,
+        "company_href": company.get("href") if company else None,
+        "salary": salary.get_text(separator=" ").strip() if salary else None,
+        "location": location.text.strip() if location else None,
+        "listdate": listdate.get("datetime") if listdate else None,
+    }
+
+
+def _search_cards(html: str) -> list[tuple]:
+    """(link href, card) for every job card on a search page, parsed with lexbor (C, CSS selectors) when installed.
+
+    Only the link is read up front; the rest of a card is read by _card_fields once its id is claimed.
+    """
+    if LexborHTMLParser is not None:
+        cards = LexborHTMLParser(html).css("div.base-search-card")
+        return [(link.attributes.get("href") if (link := card.css_first(CARD_LINK)) else None, card) for card in cards]
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=SEARCH_CARDS)
+    cards = soup.find_all("div", class_="base-search-card")
+    return [(link.get("href") if (link := card.find("a", class_="base-card__full-link")) else None, card) for card in cards]
+
+
+def _card_fields(card) -> dict:
+    return _tag_fields(card) if isinstance(card, Tag) else _node_fields(card)
+
+JOB_URL_DIRECT_RE = re.compile(r'(?<=\?url=)[^"]+')
+# The apply URL sits in a hidden <code> block; it is located in the raw bytes, and only that slice is decoded
+APPLY_URL_MARKER = b'id="applyUrl"'
+
+@lru_cache(maxsize=256)
+def _location(label: str | None, default_country) -> Location:
+    """Location for a "City, State[, Country]" label; a search repeats the same few, so jobs share one instance each."""
+    if not label: return Location.model_construct(country=default_country)
+    city, state, country = split_location(label)
+    return Location.model_construct(city=city, state=state, country=Country.from_string(country) if country is not None else default_country)
+
+@lru_cache(maxsize=512)
+def _list_date(value: str) -> date | None:
+    """Parse a card's posting date; a results page repeats the same few dates, so each is parsed once."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
 class LinkedIn(Scraper):
     base_url = "https://www.linkedin.com"
+    search_url = base_url + SEARCH_PATH
     delay = settings.LI_DELAY
     band_delay = settings.LI_BAND_DELAY
     jobs_per_page = settings.LI_JOBS_PER_PAGE
     max_pages = settings.LI_MAX_PAGES
+    description_workers = settings.LI_DESCRIPTION_WORKERS
+    # Shared by all instances so concurrent keyword scrapes stay under one per-host budget
+    _limiter = TokenBucket(settings.LI_REQUESTS_PER_SECOND, settings.LI_REQUEST_BURST)
 
-    def __init__(self, proxies=None, ca_cert=None):
+    def __init__(self, proxies=None, ca_cert=None, session=None):
         super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert)
-        self.session = create_session(
-            proxies=self.proxies,
-            ca_cert=self.ca_cert,
-            is_tls=False,
-            has_retry=True,
-            delay=self.delay,
-            clear_cookies=True,
-        )
-        self.headers = {
-            "authority": "www.linkedin.com",
-            "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "accept-language": "en-US,en;q=0.9",
-            "cache-control": "max-age=0",
-            "upgrade-insecure-requests": "1",
-            "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        }
-        self.session.headers.update(self.headers)
+        # Without a session from the caller, every instance shares the site's warmed one; headers are set when it is made
+        if session is None:
+            session = cached_session(
+                self.site.value,
+                setup=lambda s: s.headers.update(headers),
+                proxies=self.proxies,
+                ca_cert=self.ca_cert,
+                is_tls=False,
+                has_retry=True,
+                delay=self.delay,
+                pool_maxsize=max(settings.LI_POOL_SIZE, self.description_workers + 1),
+                pool_block=True,
+            )
+        self.session = session
         self.scraper_input = None
         self.country = "worldwide"
-        self.job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
+        self.location_country = Country.from_string(self.country)
+        self._executor: ThreadPoolExecutor | None = None
+        self._page_executor: ThreadPoolExecutor | None = None
+        self.seen_ids: SeenIds | None = None
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
+        self._executor = ThreadPoolExecutor(max_workers=self.description_workers) if scraper_input.linkedin_fetch_description else None
+        self._page_executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            return self._scrape_pages(scraper_input)
+        finally:
+            if self._executor is not None: self._executor.shutdown(wait=True)
+            self._page_executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._page_executor = None
+
+    def _scrape_pages(self, scraper_input: ScraperInput) -> JobResponse:
         job_list: list[JobPost] = []
-        seen_ids = set()
+        seen_ids = self.seen_ids if self.seen_ids is not None else SeenIds()
         start = (scraper_input.offset // 10) * 10 if scraper_input.offset else 0
         request_count = 0
-        seconds_old = scraper_input.hours_old * 3600 if scraper_input.hours_old else None
-        continue_search = lambda: len(job_list) < scraper_input.results_wanted and start < 1000
+        base_params = self._search_params(scraper_input)
+        page_params = lambda start: {**base_params, "start": start}
+        more_pages = lambda start: start < 1000 and request_count < self.max_pages
+        continue_search = lambda: len(job_list) < scraper_input.results_wanted and more_pages(start)
+        listed_ids: set[str] = set()
+
+        next_page = None
         while continue_search():
             request_count += 1
             log.info(f"LinkedIn page {request_count} / {math.ceil(scraper_input.results_wanted / 10)}")
-            params = {
-                "keywords": scraper_input.search_term,
-                "location": scraper_input.location,
-                "distance": scraper_input.distance,
-                "f_WT": 2 if scraper_input.is_remote else None,
-                "f_JT": job_type_code(scraper_input.job_type) if scraper_input.job_type else None,
-                "pageNum": 0,
-                "start": start,
-                "f_AL": "true" if scraper_input.easy_apply else None,
-                "f_C": ",".join(map(str, scraper_input.linkedin_company_ids)) if scraper_input.linkedin_company_ids else None,
-            }
-            if seconds_old is not None:
-                params["f_TPR"] = f"r{seconds_old}"
-            params = {k: v for k, v in params.items() if v is not None}
             try:
-                response = self.session.get(
-                    f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
-                    params=params,
-                    timeout=10,
-                )
+                response = next_page.result() if next_page is not None else self._fetch_page(page_params(start))
+                next_page = None
                 if response.status_code not in range(200, 400):
                     if response.status_code == 429:
                         err = "429 Response - Blocked by LinkedIn for too many requests"
@@ -90,78 +183,71 @@ class LinkedIn(Scraper):
                         err = f"LinkedIn response status code {response.status_code}"
                     log.error(err)
                     return JobResponse(jobs=job_list)
+            except requests.Timeout:
+                log.warning("LinkedIn search page timed out")
+                return JobResponse(jobs=job_list)
             except Exception as e:
                 log.error(f"LinkedIn request failed: {str(e)}")
                 return JobResponse(jobs=job_list)
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_cards = soup.find_all("div", class_="base-search-card")
+            job_cards = _search_cards(response.text)
             if not job_cards:
                 return JobResponse(jobs=job_list)
 
-            for job_card in job_cards:
-                href_tag = job_card.find("a", class_="base-card__full-link")
-                if href_tag and "href" in href_tag.attrs:
-                    href = href_tag.attrs["href"].split("?")[0]
-                    job_id = href.split("-")[-1]
-                    if job_id in seen_ids: continue
-                    seen_ids.add(job_id)
-                    try:
-                        job_post = self._process_job(job_card, job_id, scraper_input.linkedin_fetch_description)
-                        if job_post: job_list.append(job_post)
-                        if not continue_search(): break
-                    except Exception as e:
-                        raise LinkedInException(str(e))
+            cards_by_id = {}
+            for href, job_card in job_cards:
+                if href is not None:
+                    cards_by_id.setdefault(href.split("?", 1)[0].rsplit("-", 1)[-1], job_card)
+            # a page of nothing but cards this search already listed means the endpoint is repeating itself
+            if cards_by_id and listed_ids.issuperset(cards_by_id):
+                log.info("LinkedIn returned an already listed page, stopping")
+                break
+            listed_ids.update(cards_by_id)
+            wanted = scraper_input.results_wanted - len(job_list)
+            # claimed before the detail fetch so jobs another keyword already took are never fetched twice
+            new_cards = [(cards_by_id[job_id], job_id) for job_id in seen_ids.claim_new(cards_by_id, limit=wanted)]
+            next_start = start + len(job_cards)
+            # This page can't fill the request, so the next one is requested (after the usual delay) while its details load
+            if len(new_cards) < wanted and more_pages(next_start):
+                next_page = self._page_executor.submit(self._fetch_page, page_params(next_start), self._page_delay())
+            details = self._fetch_job_details([job_id for _, job_id in new_cards]) if scraper_input.linkedin_fetch_description else {}
+            for job_card, job_id in new_cards:
+                try:
+                    job_post = self._process_job(_card_fields(job_card), job_id, details.get(job_id))
+                    if job_post: job_list.append(job_post)
+                except Exception as e:
+                    raise LinkedInException(str(e))
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-                start += len(job_list)
+                if next_page is None: time.sleep(self._page_delay())
+                start = next_start
         job_list = job_list[:scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
 
-    def _process_job(self, job_card: Tag, job_id: str, full_descr: bool) -> Optional[JobPost]:
-        salary_tag = job_card.find("span", class_="job-search-card__salary-info")
+    def _process_job(self, job_card: dict, job_id: str, job_details: dict | None) -> Optional[JobPost]:
+        salary_text = job_card["salary"]
         compensation = None
-        if salary_tag:
-            salary_text = salary_tag.get_text(separator=" ").strip()
+        if salary_text:
             salary_values = [currency_parser(v) for v in salary_text.split("-")]
             salary_min, salary_max = salary_values[0], salary_values[1]
             currency = salary_text[0] if salary_text[0] != "$" else "USD"
-            compensation = Compensation(min_amount=int(salary_min), max_amount=int(salary_max), currency=currency)
+            compensation = Compensation.model_construct(min_amount=float(int(salary_min)), max_amount=float(int(salary_max)), currency=currency)
 
-        title_tag = job_card.find("span", class_="sr-only")
-        title = title_tag.get_text(strip=True) if title_tag else "N/A"
+        title = job_card["title"] if job_card["title"] is not None else "N/A"
 
-        company_tag = job_card.find("h4", class_="base-search-card__subtitle")
-        company_a_tag = company_tag.find("a") if company_tag else None
-        company_url = (
-            f"{self.base_url}" + urlunparse(urlparse(company_a_tag.get("href"))._replace(query=""))
-            if company_a_tag and company_a_tag.has_attr("href")
-            else ""
-        )
-        company = company_a_tag.get_text(strip=True) if company_a_tag else "N/A"
-
-        metadata_card = job_card.find("div", class_="base-search-card__metadata")
-        location = self._get_location(metadata_card)
+        company_href = job_card["company_href"]
+        company_url = f"{self.base_url}" + urlunparse(urlparse(company_href)._replace(query="")) if company_href is not None else ""
+        company = job_card["company"] if job_card["company"] is not None else "N/A"
 
-        datetime_tag = metadata_card.find("time", class_="job-search-card__listdate") if metadata_card else None
-        date_posted = None
-        if datetime_tag and "datetime" in datetime_tag.attrs:
-            datetime_str = datetime_tag["datetime"]
-            try:
-                date_posted = datetime.strptime(datetime_str, "%Y-%m-%d").date()
-            except:
-                date_posted = None
+        location = self._location_from_label(job_card["location"])
+        date_posted = _list_date(job_card["listdate"]) if job_card["listdate"] is not None else None
 
-        job_details = {}
-        if full_descr:
-            job_details = self._get_job_details(job_id)
-            description = job_details.get("description")
-        else:
-            description = None
+        job_details = job_details or {}
+        description = job_details.get("description")
 
         is_remote = is_job_remote(title, description, location)
 
-        return JobPost(
+        # Every field above is already the declared type, so per-field validation would only re-check it
+        return JobPost.model_construct(
             id=f"li-{job_id}",
             title=title,
             company_name=company,
@@ -172,7 +258,7 @@ class LinkedIn(Scraper):
             job_url=f"{self.base_url}/jobs/view/{job_id}",
             compensation=compensation,
             job_type=job_details.get("job_type"),
-            job_level=job_details.get("job_level", "").lower(),
+            job_level=(job_details.get("job_level") or "").lower(),
             company_industry=job_details.get("company_industry"),
             description=description,
             job_url_direct=job_details.get("job_url_direct"),
@@ -181,100 +267,118 @@ class LinkedIn(Scraper):
             job_function=job_details.get("job_function"),
         )
 
-    def _get_job_details(self, job_id: str) -> dict:
+    def enrich_descriptions(self, jobs: list[JobPost], concurrency: int | None = None) -> list[JobPost]:
+        """
+        Fill in detail-page fields for jobs scraped with linkedin_fetch_description=False.
+
+        Lets callers scrape list pages only and fetch descriptions just for the jobs
+        they keep. Jobs that already have a description, or whose page can't be
+        fetched, are returned unchanged; order is preserved.
+        """
+        pending = {job.id[3:]: job for job in jobs if job.description is None and job.id and job.id.startswith("li-")}
+        if not pending: return list(jobs)
+        if self.scraper_input is None:
+            self.scraper_input = ScraperInput(site_type=[Site.LINKEDIN])
+        with ThreadPoolExecutor(max_workers=concurrency or self.description_workers) as executor:
+            self._executor = executor
+            try:
+                details = self._fetch_job_details(list(pending))
+            finally:
+                self._executor = None
+        enriched = {}
+        for job_id, job in pending.items():
+            job_details = details.get(job_id)
+            if not job_details: continue
+            description = job_details.get("description")
+            enriched[job.id] = job.model_copy(update={
+                "description": description,
+                "is_remote": is_job_remote(job.title, description, job.location),
+                "job_type": job_details.get("job_type"),
+                "job_level": (job_details.get("job_level") or "").lower(),
+                "company_industry": job_details.get("company_industry"),
+                "job_url_direct": job_details.get("job_url_direct"),
+                "emails": extract_emails_from_text(description),
+                "company_logo": job_details.get("company_logo"),
+                "job_function": job_details.get("job_function"),
+            })
+        return [enriched.get(job.id, job) for job in jobs]
+
+    def _search_params(self, scraper_input: ScraperInput) -> dict:
+        """Query parameters shared by every page of a search; only start varies."""
+        seconds_old = scraper_input.hours_old * 3600 if scraper_input.hours_old else None
+        params = {
+            "keywords": scraper_input.search_term,
+            "location": scraper_input.location,
+            "distance": scraper_input.distance,
+            "f_WT": 2 if scraper_input.is_remote else None,
+            "f_JT": job_type_code(scraper_input.job_type) if scraper_input.job_type else None,
+            "pageNum": 0,
+            "f_AL": "true" if scraper_input.easy_apply else None,
+            "f_C": ",".join(map(str, scraper_input.linkedin_company_ids)) if scraper_input.linkedin_company_ids else None,
+        }
+        if seconds_old is not None:
+            params["f_TPR"] = f"r{seconds_old}"
+        return {k: v for k, v in params.items() if v is not None}
+
+    def _page_delay(self) -> float:
+        # Stretched while the limiter is backing off from 429/403 responses
+        return random.uniform(self.delay, self.delay + self.band_delay) * self._limiter.slowdown
+
+    def _fetch_page(self, params: dict, delay: float = 0.0):
+        if delay: time.sleep(delay)
+        return self._request(self.search_url, params=params, timeout=PAGE_TIMEOUT)
+
+    def _request(self, url: str, **kwargs):
+        self._limiter.acquire()
+        response = self.session.get(url, **kwargs)
+        throttle_feedback(self._limiter, response)
+        return response
+
+    def _fetch_job_details(self, job_ids: list[str]) -> dict[str, dict]:
+        """Fetch a page's detail pages together on the scrape's executor; the requests share the session's keep-alive pool.
+
+        Workers only do the I/O; each page is parsed here as soon as it arrives, while the rest are still in flight.
+        """
+        if not job_ids: return {}
+        futures = {self._executor.submit(self._fetch_detail_html, job_id): i for i, job_id in enumerate(job_ids)}
+        details: list[dict] = [{} for _ in job_ids]
+        for future in as_completed(futures):
+            response = future.result()
+            if response is not None: details[futures[future]] = self._parse_detail_html(response)
+        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            descriptions = markdown_converter_batch([d.get("description") for d in details], settings.MARKDOWN_PROCESS_WORKERS)
+            for d, description in zip(details, descriptions):
+                if d: d["description"] = description
+        return dict(zip(job_ids, details))
+
+    def _fetch_detail_html(self, job_id: str) -> requests.Response | None:
         try:
-            response = self.session.get(f"{self.base_url}/jobs/view/{job_id}", timeout=5)
+            response = self._request(f"{self.base_url}/jobs/view/{job_id}", timeout=DETAIL_TIMEOUT)
             response.raise_for_status()
-        except:
-            return {}
-        if "linkedin.com/signup" in response.url:
-            return {}
-        soup = BeautifulSoup(response.text, "html.parser")
-        div_content = soup.find("div", class_=lambda x: x and "show-more-less-html__markup" in x)
-        description = None
-        if div_content is not None:
-            div_content = remove_attributes(div_content)
-            description = div_content.prettify(formatter="html")
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description = markdown_converter(description)
-        h3_tag = soup.find("h3", text=lambda text: text and "Job function" in text.strip())
-        job_function = h3_tag.find_next("span", class_="description__job-criteria-text").get_text(strip=True) if h3_tag else None
-        company_logo = soup.find("img", {"class": "artdeco-entity-image"}).get("data-delayed-url") if soup.find("img", {"class": "artdeco-entity-image"}) else None
+        except Exception:
+            # timeouts and HTTP errors alike just leave this job without details
+            return None
+        return None if "linkedin.com/signup" in response.url else response
+
+    def _parse_detail_html(self, response: requests.Response) -> dict:
+        soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=DETAIL_PARTS)
+        div_content, company_logo, criteria = parse_detail_parts(soup)
+        description = div_content.prettify(formatter=BARE_HTML) if div_content is not None else None
         return {
             "description": description,
-            "job_level": parse_job_level(soup),
-            "company_industry": parse_company_industry(soup),
-            "job_type": parse_job_type(soup),
-            "job_url_direct": self._parse_job_url_direct(soup),
+            **criteria_fields(criteria),
+            "job_url_direct": self._parse_job_url_direct(response.content),
             "company_logo": company_logo,
-            "job_function": job_function,
         }
 
-    def _get_location(self, metadata_card) -> Location:
-        location = Location(country=Country.from_string(self.country))
-        if metadata_card is not None:
-            location_tag = metadata_card.find("span", class_="job-search-card__location")
-            location_string = location_tag.text.strip() if location_tag else "N/A"
-            parts = location_string.split(", ")
-            if len(parts) == 2:
-                city, state = parts
-                location = Location(city=city, state=state, country=Country.from_string(self.country))
-            elif len(parts) == 3:
-                city, state, country = parts
-                country = Country.from_string(country)
-                location = Location(city=city, state=state, country=country)
-        return location
-
-    def _parse_job_url_direct(self, soup: BeautifulSoup) -> str | None:
-        job_url_direct = None
-        code = soup.find("code", id="applyUrl")
-        if code:
-            m = self.job_url_direct_regex.search(code.decode_contents().strip())
-            if m: job_url_direct = unquote(m.group())
-        return job_url_direct
-
-# jobspy/linkedin/exception.py
-from jobspy.exception import LinkedInException
+    def _location_from_label(self, label: str | None) -> Location:
+        return _location(label, self.location_country)
 
-# jobspy/linkedin/util.py
-from bs4 import BeautifulSoup
-from jobspy.model import JobType, Location
-from jobspy.util import get_enum_from_job_type
-
-def job_type_code(job_type_enum) -> str:
-    return {
-        JobType.FULL_TIME: "F",
-        JobType.PART_TIME: "P",
-        JobType.INTERNSHIP: "I",
-        JobType.CONTRACT: "C",
-        JobType.TEMPORARY: "T",
-    }.get(job_type_enum, "")
-
-def parse_job_type(soup) -> list[JobType] | None:
-    h3 = soup.find("h3", class_="description__job-criteria-subheader", string=lambda t: "Employment type" in t)
-    if h3:
-        span = h3.find_next_sibling("span", class_="description__job-criteria-text description__job-criteria-text--criteria")
-        if span:
-            val = span.get_text(strip=True).lower().replace("-", "")
-            return [get_enum_from_job_type(val)] if val else []
-    return []
-
-def parse_job_level(soup) -> str | None:
-    h3 = soup.find("h3", class_="description__job-criteria-subheader", string=lambda t: "Seniority level" in t)
-    if h3:
-        span = h3.find_next_sibling("span", class_="description__job-criteria-text description__job-criteria-text--criteria")
-        return span.get_text(strip=True) if span else None
-    return None
-
-def parse_company_industry(soup) -> str | None:
-    h3 = soup.find("h3", class_="description__job-criteria-subheader", string=lambda t: "Industries" in t)
-    if h3:
-        span = h3.find_next_sibling("span", class_="description__job-criteria-text description__job-criteria-text--criteria")
-        return span.get_text(strip=True) if span else None
-    return None
-
-def is_job_remote(title, description, location) -> bool:
-    remote_keywords = ["remote", "work from home", "wfh"]
-    loc_str = location.display_location()
-    full = f"{title} {description} {loc_str}".lower()
-    return any(k in full for k in remote_keywords)
\ No newline at end of file
+    def _parse_job_url_direct(self, content: bytes) -> str | None:
+        start = content.find(APPLY_URL_MARKER)
+        if start < 0: return None
+        start = content.find(b">", start) + 1
+        end = content.find(b"</code>", start)
+        if not start or end < 0: return None
+        m = JOB_URL_DIRECT_RE.search(content[start:end].decode("utf-8", errors="replace").strip())
+        return unquote(m.group()) if m else None
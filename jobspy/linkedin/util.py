@@ -1,42 +1,66 @@
 # jobspy/linkedin/util.py
 from bs4 import BeautifulSoup
 from jobspy.model import JobType, Location
+from jobspy._hotparse import mentions_remote
 from jobspy.util import get_enum_from_job_type
 
+JOB_TYPE_CODES = {
+    JobType.FULL_TIME: "F",
+    JobType.PART_TIME: "P",
+    JobType.INTERNSHIP: "I",
+    JobType.CONTRACT: "C",
+    JobType.TEMPORARY: "T",
+}
+
 def job_type_code(job_type_enum) -> str:
-    return {
-        JobType.FULL_TIME: "F",
-        JobType.PART_TIME: "P",
-        JobType.INTERNSHIP: "I",
-        JobType.CONTRACT: "C",
-        JobType.TEMPORARY: "T",
-    }.get(job_type_enum, "")
+    return JOB_TYPE_CODES.get(job_type_enum, "")
+
+CRITERIA_TEXT_CLASS = "description__job-criteria-text description__job-criteria-text--criteria"
+
+def parse_detail_parts(soup) -> tuple:
+    """
+    Collect everything a job detail page is read for in one walk of the tree.
+
+    Returns (description tag, company logo url, {criteria header: value}).
+    """
+    description = logo = None
+    criteria: dict[str, str | None] = {}
+    for tag in soup.find_all(True):
+        name = tag.name
+        if name == "div":
+            if description is None and any("show-more-less-html__markup" in c for c in tag.get("class") or ()):
+                description = tag
+        elif name == "img":
+            if logo is None and "artdeco-entity-image" in (tag.get("class") or ()):
+                logo = tag.get("data-delayed-url")
+        elif name == "h3" and "description__job-criteria-subheader" in (tag.get("class") or ()):
+            span = tag.find_next_sibling("span", class_=CRITERIA_TEXT_CLASS)
+            criteria[tag.get_text(strip=True)] = span.get_text(strip=True) if span else None
+    return description, logo, criteria
+
+CRITERIA_KEYS = {"Employment type": "job_type", "Seniority level": "job_level", "Industries": "company_industry", "Job function": "job_function"}
+
+def criteria_fields(criteria: dict) -> dict:
+    """Map a page's criteria headers onto JobPost fields in one pass over them."""
+    fields = dict.fromkeys(CRITERIA_KEYS.values())
+    for name, value in criteria.items():
+        key = CRITERIA_KEYS.get(name) or next((k for label, k in CRITERIA_KEYS.items() if label in name), None)
+        if key is not None and fields[key] is None: fields[key] = value
+    job_type = (fields["job_type"] or "").lower().replace("-", "")
+    fields["job_type"] = [get_enum_from_job_type(job_type)] if job_type else []
+    return fields
+
+def parse_all_criteria(soup) -> dict:
+    return criteria_fields(parse_detail_parts(soup)[2])
 
 def parse_job_type(soup) -> list[JobType] | None:
-    h3 = soup.find("h3", class_="description__job-criteria-subheader", string=lambda t: "Employment type" in t)
-    if h3:
-        span = h3.find_next_sibling("span", class_="description__job-criteria-text description__job-criteria-text--criteria")
-        if span:
-            val = span.get_text(strip=True).lower().replace("-", "")
-            return [get_enum_from_job_type(val)] if val else []
-    return []
+    return parse_all_criteria(soup)["job_type"]
 
 def parse_job_level(soup) -> str | None:
-    h3 = soup.find("h3", class_="description__job-criteria-subheader", string=lambda t: "Seniority level" in t)
-    if h3:
-        span = h3.find_next_sibling("span", class_="description__job-criteria-text description__job-criteria-text--criteria")
-        return span.get_text(strip=True) if span else None
-    return None
+    return parse_all_criteria(soup)["job_level"]
 
 def parse_company_industry(soup) -> str | None:
-    h3 = soup.find("h3", class_="description__job-criteria-subheader", string=lambda t: "Industries" in t)
-    if h3:
-        span = h3.find_next_sibling("span", class_="description__job-criteria-text description__job-criteria-text--criteria")
-        return span.get_text(strip=True) if span else None
-    return None
+    return parse_all_criteria(soup)["company_industry"]
 
 def is_job_remote(title, description, location) -> bool:
-    remote_keywords = ["remote", "work from home", "wfh"]
-    loc_str = location.display_location()
-    full = f"{title} {description} {loc_str}".lower()
-    return any(k in full for k in remote_keywords)
\ No newline at end of file
+    return mentions_remote(title or "", location.display_location(), description or "")
\ No newline at end of file
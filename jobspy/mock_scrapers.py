@@ -5,7 +5,7 @@ from jobspy.model import Scraper, Site, JobPost, JobResponse, Location
 
 
 class MockLinkedIn(Scraper):
-    def __init__(self, proxies=None, ca_cert=None):
+    def __init__(self, proxies=None, ca_cert=None, session=None):
         super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert)
 
     def scrape(self, scraper_input) -> JobResponse:
@@ -22,7 +22,7 @@ class MockLinkedIn(Scraper):
 
 
 class MockNaukri(Scraper):
-    def __init__(self, proxies=None, ca_cert=None):
+    def __init__(self, proxies=None, ca_cert=None, session=None):
         super().__init__(Site.NAUKRI, proxies=proxies, ca_cert=ca_cert)
 
     def scrape(self, scraper_input) -> JobResponse:
@@ -2,8 +2,9 @@
 from __future__ import annotations
 from datetime import date
 from enum import Enum
+from functools import lru_cache
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class JobType(Enum):
     FULL_TIME = "fulltime"
@@ -28,11 +29,11 @@ class Country(Enum):
         if s is None:
             return None
         s = str(s).strip()
-        for member in cls:
-            if s.lower() == member.value or s.lower() == member.name.lower():
-                return member
         # Return the original string to allow location display for values like 'worldwide'
-        return s
+        return _COUNTRY_LOOKUP.get(s.lower(), s)
+
+# Both the value and the lower-cased name resolve to the member
+_COUNTRY_LOOKUP = {key: member for member in Country for key in (member.value, member.name.lower())}
 
 class CompensationInterval(str, Enum):
     YEARLY = "yearly"
@@ -48,17 +49,25 @@ class Compensation(BaseModel):
     currency: Optional[str] = "USD"
 
 class Location(BaseModel):
+    # frozen, so scrapers can hand the same instance to every job at one location
+    model_config = ConfigDict(frozen=True)
+
     country: Country | str | None = None
     city: Optional[str] = None
     state: Optional[str] = None
 
     def display_location(self) -> str:
-        parts = []
-        if self.city: parts.append(self.city)
-        if self.state: parts.append(self.state)
-        if isinstance(self.country, str): parts.append(self.country)
-        elif self.country: parts.append(self.country.value.title())
-        return ", ".join(parts)
+        return display_location(self.city, self.state, self.country)
+
+@lru_cache(maxsize=1024)
+def display_location(city: Optional[str], state: Optional[str], country: Country | str | None) -> str:
+    """"City, State, Country" label; a search yields the same few locations, so each is formatted once."""
+    parts = []
+    if city: parts.append(city)
+    if state: parts.append(state)
+    if isinstance(country, str): parts.append(country)
+    elif country: parts.append(country.value.title())
+    return ", ".join(parts)
 
 class DescriptionFormat(str, Enum):
     MARKDOWN = "markdown"
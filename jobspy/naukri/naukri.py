@@ -2,116 +2,198 @@
 from __future__ import annotations
 import math
 import random
+import threading
 import time
-from datetime import datetime, date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
 from typing import Optional
+import orjson
 import regex as re
+import requests
+
+try:
+    import simdjson
+except ImportError:  # optional
+    simdjson = None
 
 from jobspy.model import (
     JobPost, Location, JobResponse, Country, Compensation, DescriptionFormat,
     Scraper, ScraperInput, Site,
 )
 from jobspy.util import (
-    extract_emails_from_text, currency_parser, markdown_converter,
-    create_session, create_logger,
+    extract_emails_from_text, currency_parser, markdown_converter_batch,
+    cached_session, create_logger, SeenIds, TokenBucket, throttle_feedback,
 )
+from jobspy.exception import NaukriException
+from jobspy._hotparse import split_city_state, posted_date, work_from_home_type
+from jobspy.naukri.constant import headers
 from jobspy.naukri.util import is_job_remote, parse_job_type, parse_company_industry
 import settings
 
 log = create_logger("Naukri")
 
+# (connect, read) seconds: a stalled host fails fast instead of hanging the scrape
+PAGE_TIMEOUT = (3.05, 10)
+
+SALARY_RE = re.compile(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*(Lacs|Lakh|Cr)\s*(P\.A\.)?", re.IGNORECASE)
+
+_local = threading.local()
+
+def _load_job_details(content: bytes) -> list:
+    """Return a search response's jobDetails array.
+
+    With pysimdjson installed only that array is turned into Python objects; the
+    rest of the payload (clusters, filters, SEO blocks) is never materialised.
+    Parsers are reused per thread, as a simdjson document is invalidated by the next parse.
+    """
+    if simdjson is None:
+        return orjson.loads(content).get("jobDetails") or []
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = simdjson.Parser()
+    job_details = parser.parse(content).get("jobDetails")
+    return job_details.as_list() if job_details is not None else []
+
+@lru_cache(maxsize=256)
+def _location(label: str | None, country) -> Location:
+    """Location for a "City, State" label; labels repeat across a search, so jobs share one instance each."""
+    if label is None: return Location.model_construct(country=country)
+    city, state = split_city_state(label)
+    return Location.model_construct(city=city, state=state, country=country)
+
 class Naukri(Scraper):
     base_url = "https://www.naukri.com/jobapi/v3/search"
     delay = settings.NAUKRI_DELAY
     band_delay = settings.NAUKRI_BAND_DELAY
     jobs_per_page = settings.NAUKRI_JOBS_PER_PAGE
     max_pages = settings.NAUKRI_MAX_PAGES
+    # Shared by all instances so concurrent keyword scrapes back off together
+    _limiter = TokenBucket(settings.NAUKRI_REQUESTS_PER_SECOND, settings.NAUKRI_REQUEST_BURST)
 
-    def __init__(self, proxies=None, ca_cert=None):
+    def __init__(self, proxies=None, ca_cert=None, session=None):
         super().__init__(Site.NAUKRI, proxies=proxies, ca_cert=ca_cert)
-        self.session = create_session(
-            proxies=self.proxies,
-            ca_cert=self.ca_cert,
-            is_tls=False,
-            has_retry=True,
-            delay=self.delay,
-            clear_cookies=True,
-        )
-        self.headers = {
-            "authority": "www.naukri.com",
-            "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "accept-language": "en-US,en;q=0.9",
-            "cache-control": "max-age=0",
-            "upgrade-insecure-requests": "1",
-            "appid": "109",
-            "systemid": "Naukri",
-            "Nkparam": "Ppy0YK9uSHqPtG3bEejYc04RTpUN2CjJOrqA68tzQt0SKJHXZKzz9M8cZtKLVkoOuQmfe4cTb1r2CwfHaxW5Tg==",
-            "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        }
-        self.session.headers.update(self.headers)
+        # Without a session from the caller, every instance shares the site's warmed one; headers are set when it is made
+        if session is None:
+            session = cached_session(
+                self.site.value,
+                setup=lambda s: s.headers.update(headers),
+                proxies=self.proxies,
+                ca_cert=self.ca_cert,
+                is_tls=False,
+                has_retry=True,
+                delay=self.delay,
+                pool_maxsize=max(self.jobs_per_page, 32),
+                pool_block=True,
+            )
+        self.session = session
         self.scraper_input = None
         self.country = "India"
+        self.location_country = Country.from_string(self.country)
+        self.seen_ids: SeenIds | None = None
+        self.scrape_date: date | None = None
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
+        # "N days ago" labels are resolved against one date for the whole run
+        self.scrape_date = date.today()
+        self._page_executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            return self._scrape_pages(scraper_input)
+        finally:
+            self._page_executor.shutdown(wait=False, cancel_futures=True)
+            self._page_executor = None
+
+    def _scrape_pages(self, scraper_input: ScraperInput) -> JobResponse:
         job_list: list[JobPost] = []
-        seen_ids = set()
+        seen_ids = self.seen_ids if self.seen_ids is not None else SeenIds()
         page = (scraper_input.offset // self.jobs_per_page) + 1 if scraper_input.offset else 1
         request_count = 0
-        seconds_old = scraper_input.hours_old * 3600 if scraper_input.hours_old else None
+        base_params = self._search_params(scraper_input)
+        page_params = lambda page: {**base_params, "pageNo": page}
         continue_search = lambda: len(job_list) < scraper_input.results_wanted and page <= self.max_pages
+
+        next_page = None
         while continue_search():
             request_count += 1
             log.info(f"Naukri page {request_count} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}")
-            params = {
-                "noOfResults": self.jobs_per_page,
-                "urlType": "search_by_keyword",
-                "searchType": "adv",
-                "keyword": scraper_input.search_term,
-                "pageNo": page,
-                "k": scraper_input.search_term,
-                "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
-                "src": "jobsearchDesk",
-                "latLong": "",
-                "location": scraper_input.location,
-                "remote": "true" if scraper_input.is_remote else None,
-            }
-            if seconds_old:
-                params["days"] = seconds_old // 86400
-            params = {k: v for k, v in params.items() if v is not None}
             try:
-                response = self.session.get(self.base_url, params=params, timeout=10)
+                response = next_page.result() if next_page is not None else self._fetch_page(page_params(page))
+                next_page = None
                 if response.status_code not in range(200, 400):
                     err = f"Naukri API response status code {response.status_code}"
                     log.error(err)
                     return JobResponse(jobs=job_list)
-                data = response.json()
-                job_details = data.get("jobDetails", [])
+                job_details = _load_job_details(response.content)
                 if not job_details:
                     break
+            except requests.Timeout:
+                log.warning("Naukri search page timed out")
+                return JobResponse(jobs=job_list)
             except Exception as e:
                 log.error(f"Naukri API request failed: {str(e)}")
                 return JobResponse(jobs=job_list)
 
+            jobs_by_id = {}
             for job in job_details:
                 job_id = job.get("jobId")
-                if not job_id or job_id in seen_ids:
-                    continue
-                seen_ids.add(job_id)
+                if job_id: jobs_by_id.setdefault(job_id, job)
+            wanted = scraper_input.results_wanted - len(job_list)
+            new_jobs = [(jobs_by_id[job_id], job_id) for job_id in seen_ids.claim_new(jobs_by_id, limit=wanted)]
+            # This page can't fill the request, so the next one is requested (after the usual delay) while this one is processed
+            if len(new_jobs) < wanted and page + 1 <= self.max_pages:
+                next_page = self._page_executor.submit(self._fetch_page, page_params(page + 1), self._page_delay())
+            descriptions = self._get_descriptions([job for job, _ in new_jobs]) if scraper_input.linkedin_fetch_description else [None] * len(new_jobs)
+            for (job, job_id), description in zip(new_jobs, descriptions):
                 try:
-                    job_post = self._process_job(job, job_id, scraper_input.linkedin_fetch_description)
+                    job_post = self._process_job(job, job_id, description)
                     if job_post: job_list.append(job_post)
-                    if not continue_search(): break
                 except Exception as e:
                     log.exception("Naukri job processing error")
                     raise NaukriException(str(e))
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                if next_page is None: time.sleep(self._page_delay())
                 page += 1
         job_list = job_list[:scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
 
-    def _process_job(self, job: dict, job_id: str, full_descr: bool) -> Optional[JobPost]:
+    def _page_delay(self) -> float:
+        # Stretched while the limiter is backing off from 429/403 responses
+        return random.uniform(self.delay, self.delay + self.band_delay) * self._limiter.slowdown
+
+    def _fetch_page(self, params: dict, delay: float = 0.0):
+        if delay: time.sleep(delay)
+        self._limiter.acquire()
+        response = self.session.get(self.base_url, params=params, timeout=PAGE_TIMEOUT)
+        throttle_feedback(self._limiter, response)
+        return response
+
+    def _search_params(self, scraper_input: ScraperInput) -> dict:
+        """Query parameters shared by every page of a search; only pageNo varies."""
+        seconds_old = scraper_input.hours_old * 3600 if scraper_input.hours_old else None
+        params = {
+            "noOfResults": self.jobs_per_page,
+            "urlType": "search_by_keyword",
+            "searchType": "adv",
+            "keyword": scraper_input.search_term,
+            "k": scraper_input.search_term,
+            "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
+            "src": "jobsearchDesk",
+            "latLong": "",
+            "location": scraper_input.location,
+            "remote": "true" if scraper_input.is_remote else None,
+        }
+        if seconds_old:
+            params["days"] = seconds_old // 86400
+        return {k: v for k, v in params.items() if v is not None}
+
+    def _get_descriptions(self, jobs: list[dict]) -> list[str | None]:
+        descriptions = [job.get("jobDescription") for job in jobs]
+        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            descriptions = markdown_converter_batch(descriptions, settings.MARKDOWN_PROCESS_WORKERS)
+        return descriptions
+
+    def _process_job(self, job: dict, job_id: str, description: str | None) -> Optional[JobPost]:
         title = job.get("title", "N/A")
         company = job.get("companyName", "N/A")
         company_url = f"https://www.naukri.com{job.get('staticUrl', '')}" if job.get("staticUrl") else None
@@ -119,9 +201,6 @@ class Naukri(Scraper):
         compensation = self._get_compensation(job.get("placeholders", []))
         date_posted = self._parse_date(job.get("footerPlaceholderLabel"), job.get("createdDate"))
         job_url = f"https://www.naukri.com{job.get('jdURL', f'/job/{job_id}')}"
-        description = job.get("jobDescription") if full_descr else None
-        if description and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            description = markdown_converter(description)
         job_type = parse_job_type(description) if description else None
         company_industry = parse_company_industry(description) if description else None
         is_remote = is_job_remote(title, description or "", location)
@@ -158,23 +237,17 @@ class Naukri(Scraper):
         )
 
     def _get_location(self, placeholders: list[dict]) -> Location:
-        location = Location(country=Country.from_string(self.country))
         for p in placeholders:
             if p.get("type") == "location":
-                loc_str = p.get("label", "")
-                parts = loc_str.split(", ")
-                city = parts[0] if parts else None
-                state = parts[1] if len(parts) > 1 else None
-                location = Location(city=city, state=state, country=Country.from_string(self.country))
-                break
-        return location
+                return _location(p.get("label", ""), self.location_country)
+        return _location(None, self.location_country)
 
     def _get_compensation(self, placeholders: list[dict]) -> Optional[Compensation]:
         for p in placeholders:
             if p.get("type") == "salary":
                 salary_text = p.get("label", "").strip()
                 if salary_text == "Not disclosed": return None
-                m = re.match(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*(Lacs|Lakh|Cr)\s*(P\.A\.)?", salary_text, re.IGNORECASE)
+                m = SALARY_RE.match(salary_text)
                 if m:
                     min_sal, max_sal, unit = float(m.group(1)), float(m.group(2)), m.group(3)
                     currency = "INR"
@@ -182,66 +255,12 @@ class Naukri(Scraper):
                         min_sal *= 100000; max_sal *= 100000
                     elif unit.lower() == "cr":
                         min_sal *= 10000000; max_sal *= 10000000
-                    return Compensation(min_amount=int(min_sal), max_amount=int(max_sal), currency=currency)
+                    return Compensation.model_construct(min_amount=float(int(min_sal)), max_amount=float(int(max_sal)), currency=currency)
         return None
 
     def _parse_date(self, label: str, created_date: int) -> Optional[date]:
-        today = datetime.now()
-        if not label:
-            if created_date:
-                return datetime.fromtimestamp(created_date / 1000).date()
-            return None
-        label = label.lower()
-        if "today" in label or "just now" in label or "few hours" in label:
-            return today.date()
-        elif "ago" in label:
-            m = re.search(r"(\d+)\s*day", label)
-            if m: return (today - timedelta(days=int(m.group(1)))).date()
-        elif created_date:
-            return datetime.fromtimestamp(created_date / 1000).date()
-        return None
+        return posted_date(label, created_date, self.scrape_date or date.today())
 
     def _infer_work_from_home_type(self, placeholders: list[dict], title: str, description: str) -> Optional[str]:
-        loc_str = next((p["label"] for p in placeholders if p["type"] == "location"), "").lower()
-        if "hybrid" in loc_str or "hybrid" in title.lower() or "hybrid" in description.lower():
-            return "Hybrid"
-        elif "remote" in loc_str or "remote" in title.lower() or "remote" in description.lower():
-            return "Remote"
-        elif "work from office" in description.lower() or not ("remote" in description.lower() or "hybrid" in description.lower()):
-            return "Work from office"
-        return None
-
-# jobspy/naukri/exception.py
-from jobspy.exception import NaukriException
-
-# jobspy/naukri/util.py
-from bs4 import BeautifulSoup
-from jobspy.model import JobType, Location
-from jobspy.util import get_enum_from_job_type
-
-def parse_job_type(soup_or_html) -> list[JobType] | None:
-    # Normalize input to BeautifulSoup by stringifying then parsing. This avoids
-    # cases where 'soup_or_html' is an object (e.g., markdown string) with a
-    # .find method of an unexpected type.
-    if not soup_or_html:
-        return None
-    soup = BeautifulSoup(str(soup_or_html), "html.parser")
-    job_type_tag = soup.find("span", class_="job-type")
-    if job_type_tag:
-        val = job_type_tag.get_text(strip=True).lower().replace("-", "")
-        return [get_enum_from_job_type(val)] if val else []
-    return None
-
-
-def parse_company_industry(soup_or_html) -> str | None:
-    if not soup_or_html:
-        return None
-    soup = BeautifulSoup(str(soup_or_html), "html.parser")
-    industry_tag = soup.find("span", class_="industry")
-    return industry_tag.get_text(strip=True) if industry_tag else None
-
-def is_job_remote(title, description, location) -> bool:
-    remote_keywords = ["remote", "work from home", "wfh"]
-    loc_str = location.display_location()
-    full = f"{title} {description} {loc_str}".lower()
-    return any(k in full for k in remote_keywords)
\ No newline at end of file
+        loc_str = next((p["label"] for p in placeholders if p["type"] == "location"), "")
+        return work_from_home_type(loc_str, title, description)
@@ -1,28 +1,46 @@
 # jobspy/naukri/util.py
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from bs4 import BeautifulSoup, SoupStrainer
 from jobspy.model import JobType, Location
-from jobspy.util import get_enum_from_job_type
+from jobspy._hotparse import mentions_remote
+from jobspy.util import get_enum_from_job_type, HTML_PARSER, has_class
+
+JOB_TYPE_TAG = SoupStrainer("span", class_=has_class("job-type"))
+INDUSTRY_TAG = SoupStrainer("span", class_=has_class("industry"))
 
 def parse_job_type(soup_or_html) -> list[JobType] | None:
     if not soup_or_html:
         return None
-    soup = BeautifulSoup(str(soup_or_html), "html.parser")
+    html = str(soup_or_html)
+    # Markdown descriptions never carry the tag, so most calls skip parsing entirely
+    if "job-type" not in html:
+        return None
+    job_type = _job_type_text(html)
+    if job_type is None:
+        return None
+    return [get_enum_from_job_type(job_type)] if job_type else []
+
+@lru_cache(maxsize=1024)
+def _job_type_text(html: str) -> str | None:
+    # Reposted jobs share a description, so each distinct one is parsed once
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=JOB_TYPE_TAG)
     job_type_tag = soup.find("span", class_="job-type")
-    if job_type_tag:
-        val = job_type_tag.get_text(strip=True).lower().replace("-", "")
-        return [get_enum_from_job_type(val)] if val else []
-    return None
+    return job_type_tag.get_text(strip=True).lower().replace("-", "") if job_type_tag else None
 
 
 def parse_company_industry(soup_or_html) -> str | None:
     if not soup_or_html:
         return None
-    soup = BeautifulSoup(str(soup_or_html), "html.parser")
+    html = str(soup_or_html)
+    if "industry" not in html:
+        return None
+    return _industry_text(html)
+
+@lru_cache(maxsize=1024)
+def _industry_text(html: str) -> str | None:
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=INDUSTRY_TAG)
     industry_tag = soup.find("span", class_="industry")
     return industry_tag.get_text(strip=True) if industry_tag else None
 
 def is_job_remote(title, description, location) -> bool:
-    remote_keywords = ["remote", "work from home", "wfh"]
-    loc_str = location.display_location()
-    full = f"{title} {description} {loc_str}".lower()
-    return any(k in full for k in remote_keywords)
\ No newline at end of file
+    return mentions_remote(title or "", location.display_location(), description or "")
\ No newline at end of file
@@ -1,12 +1,19 @@
 # jobspy/pipeline.py
 from __future__ import annotations
+import asyncio
+import functools
+import hashlib
 import logging
+import shelve
+import threading
 import time
 from datetime import datetime
 from typing import List, Dict, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from urllib.parse import urlparse, urlunparse
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 from bs4 import BeautifulSoup
+import httpx
+import orjson
 import pandas as pd
 from jobspy.model import JobPost, JobResponse, Site, ScraperInput, Location
 from jobspy.util import (
@@ -16,24 +23,104 @@ from jobspy.exception import JobScrapingException
 from jobspy.evaluator import ProfileMatchEvaluator
 import settings
 
+try:
+    import h2
+except ImportError:  # optional
+    h2 = None
+
 log = create_logger("Pipeline")
 
+# Stringified location dicts are Python reprs; try them as JSON before falling back to ast.
+_SINGLE_TO_DOUBLE_QUOTE = str.maketrans("'", '"')
+
+_enrich_cache_lock = threading.Lock()
+
+def _enrich_cache_enabled() -> bool:
+    return bool(getattr(settings, "ENRICH_CACHE_ENABLED", False)) and not settings.DRY_RUN
+
+def _profile_hash() -> str:
+    """Fingerprint of every setting the evaluator scores against."""
+    profile = {k: getattr(settings, k) for k in sorted(dir(settings)) if k.startswith(("PROFILE_", "EVAL_"))}
+    return hashlib.sha1(repr(profile).encode()).hexdigest()
+
+_TRACKING_PARAMS = {"refid", "trackingid", "trk", "fbclid", "gclid"}
+
+def canonical_job_url(url: str | None) -> str | None:
+    """Normalize a job URL for dedup: lowercase scheme/host, drop fragment, trailing slash and tracking params."""
+    if not url or not isinstance(url, str): return url
+    try:
+        parts = urlparse(url.strip())
+    except ValueError:
+        return url
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS]
+    path = parts.path.rstrip("/") or "/"
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(), path, parts.params, urlencode(query), ""))
+
+def dedupe_discovery_rows(rows: List[Dict[str, any]]) -> List[Dict[str, any]]:
+    """Keep the first row per canonical job_url; rows without a URL are kept as-is."""
+    seen: Dict[str, Dict[str, any]] = {}
+    unkeyed: List[Dict[str, any]] = []
+    for row in rows:
+        key = canonical_job_url(row.get("job_url"))
+        if key: seen.setdefault(key, row)
+        else: unkeyed.append(row)
+    return list(seen.values()) + unkeyed
+
+def _enrich_cache_key(job_meta: Dict[str, any]) -> str | None:
+    url = canonical_job_url(job_meta.get("job_url"))
+    if not url: return None
+    return hashlib.sha1((url + _profile_hash()).encode()).hexdigest()
+
+def _enrich_cache_get(key: str) -> JobPost | None:
+    try:
+        with _enrich_cache_lock, shelve.open(str(settings.ENRICH_CACHE_PATH)) as db:
+            return db.get(key)
+    except Exception as e:
+        log.warning(f"Enrichment cache read failed: {e}")
+        return None
+
+def _enrich_cache_put(key: str, post: JobPost) -> None:
+    try:
+        with _enrich_cache_lock, shelve.open(str(settings.ENRICH_CACHE_PATH)) as db:
+            db[key] = post
+    except Exception as e:
+        log.warning(f"Enrichment cache write failed: {e}")
+
+def cached_enrichment(func):
+    """Persist enrichment results keyed by (job_url, profile) so re-runs skip scored postings.
+
+    Failed enrichments are not cached.
+    """
+    @functools.wraps(func)
+    def wrapper(job_meta, *args, **kwargs):
+        key = _enrich_cache_key(job_meta) if _enrich_cache_enabled() else None
+        if key:
+            hit = _enrich_cache_get(key)
+            if hit is not None: return hit
+        post = func(job_meta, *args, **kwargs)
+        if key and post is not None: _enrich_cache_put(key, post)
+        return post
+    return wrapper
+
 def discover_jobs(
     keywords: List[str],
     location: str | None = None,
     results_wanted: int = 100,
     sites: List[str] | None = None,
+    seen_ids: Dict | None = None,
 ) -> List[Dict[str, any]]:
     if sites is None:
         sites = settings.SITES
     search_term = " OR ".join([f'"{k}"' for k in keywords])
     log.info(f"Discovery: keywords={keywords}, sites={sites}")
-    from jobspy import scrape_jobs
+    from jobspy.scrape_jobs import scrape_jobs
     df = scrape_jobs(
         site_name=sites,
         search_term=search_term,
         location=location,
         results_wanted=results_wanted,
+        seen_ids=seen_ids,
     )
     rows = []
     if df is not None and not df.empty:
@@ -51,6 +138,37 @@ def discover_jobs(
             })
     return rows
 
+def discover_jobs_by_keyword(
+    keywords: List[str],
+    location: str | None = None,
+    results_wanted: int = 100,
+    sites: List[str] | None = None,
+    max_workers: int | None = None,
+) -> List[Dict[str, any]]:
+    """Run one discovery per keyword concurrently and merge the rows by canonical job_url.
+
+    Each keyword is an independent, network-bound scrape, so they are fanned out
+    over a thread pool. Thread starts are staggered by 100 ms to avoid hitting the
+    same host with a synchronized burst. All keywords share one set of seen job
+    ids so a job is only fetched for the first keyword that finds it.
+    """
+    if not keywords: return []
+    seen_ids: Dict = {}
+
+    def worker(idx: int, keyword: str) -> List[Dict[str, any]]:
+        time.sleep(idx * 0.1)
+        return discover_jobs(keywords=[keyword], location=location, results_wanted=results_wanted, sites=sites, seen_ids=seen_ids)
+
+    collected: List[Dict[str, any]] = []
+    with ThreadPoolExecutor(max_workers=max_workers or len(keywords)) as executor:
+        futures = [executor.submit(worker, i, k) for i, k in enumerate(keywords)]
+        for keyword, future in zip(keywords, futures):
+            try:
+                collected.extend(future.result())
+            except Exception as e:
+                log.error(f"Discovery failed for keyword '{keyword}': {e}")
+    return dedupe_discovery_rows(collected)
+
 def validate_discovery_row(job_meta: Dict[str, any]) -> tuple[bool, str | None]:
     if not job_meta: return False, "empty row"
     if not job_meta.get("job_url"): return False, "missing job_url"
@@ -66,91 +184,197 @@ def normalize_output_df(df: pd.DataFrame) -> pd.DataFrame:
                 if isinstance(val, Location): return val.display_location()
                 if isinstance(val, dict): return Location(**val).display_location()
                 if isinstance(val, str) and val.strip().startswith("{"):
-                    d = ast.literal_eval(val)
+                    try: d = orjson.loads(val.translate(_SINGLE_TO_DOUBLE_QUOTE))
+                    except orjson.JSONDecodeError: d = ast.literal_eval(val)
                     if isinstance(d, dict): return Location(**d).display_location()
             except Exception: pass
             return val
-        df["location"] = df["location"].apply(_normalize_location)
+        df["location"] = _map_unique(df["location"], _normalize_location)
+    def _join(v): return ", ".join([str(x) for x in v]) if isinstance(v, (list, tuple)) else v
     for col in ("key_skills", "missing_skills", "match_reasons", "skills"):
         if col in df.columns:
-            df[col] = df[col].apply(lambda v: ", ".join([str(x) for x in v]) if isinstance(v, (list, tuple)) else v)
+            df[col] = _map_unique(df[col], _join)
     return df
 
-def enrich_job(job_meta: Dict[str, any], timeout_seconds: int = 15) -> JobPost | None:
-    url = job_meta.get("job_url")
-    site = job_meta.get("site")
+def _map_unique(series: pd.Series, func) -> pd.Series:
+    """Apply `func` once per distinct value (by repr) and map the results back.
+
+    Scraped columns like location and skill lists repeat heavily, so this avoids
+    re-parsing the same value for every row. Works for unhashable values too.
+    """
+    if series.empty: return series
+    reprs = series.map(repr)
+    firsts = {}
+    for key, val in zip(reprs, series):
+        if key not in firsts: firsts[key] = val
+    results = {key: func(val) for key, val in firsts.items()}
+    return pd.Series([results[key] for key in reprs], index=series.index, dtype=object, name=series.name)
+
+def _build_enriched_post(job_meta: Dict[str, any], text: str, eval_res: Dict[str, any]) -> JobPost:
     title = job_meta.get("title")
     company = job_meta.get("company")
-    evaluator = ProfileMatchEvaluator()
-    session = create_session(is_tls=False, has_retry=False, clear_cookies=True)
+    loc_val = job_meta.get("location")
+    loc_field = {"city": loc_val} if isinstance(loc_val, str) else loc_val
+    meta_is_remote = job_meta.get("is_remote")
+    meta_wfh = job_meta.get("work_from_home_type")
+    txt_lower = text.lower() if text else ""
+    inferred_is_remote = None
+    if meta_is_remote is not None: inferred_is_remote = bool(meta_is_remote)
+    else:
+        inferred_is_remote = bool(any(k in txt_lower for k in ["remote", "work from home", "wfh"]))
+    inferred_wfh = None
+    if isinstance(meta_wfh, str) and meta_wfh.strip(): inferred_wfh = meta_wfh.strip()
+    else:
+        if "hybrid" in txt_lower: inferred_wfh = "Hybrid"
+        elif any(k in txt_lower for k in ["remote", "work from home", "wfh"]): inferred_wfh = "Remote"
+    job_post = JobPost(
+        title=title,
+        company_name=company,
+        job_url=job_meta.get("job_url"),
+        location=loc_field,
+        description=text,
+        key_skills=eval_res.get("key_skills"),
+        experience_range=eval_res.get("experience_range"),
+        match_score=eval_res.get("match_score"),
+        match_reasons=eval_res.get("match_reasons"),
+        missing_skills=eval_res.get("missing_skills"),
+        resume_alignment_level=eval_res.get("resume_alignment_level"),
+        why_this_job_fits=eval_res.get("why_this_job_fits"),
+        site=job_meta.get("site"),
+        is_remote=inferred_is_remote,
+        work_from_home_type=inferred_wfh,
+    )
+    if job_post.resume_alignment_level and job_post.resume_alignment_level != "Ignore":
+        log.info(f"Accepted: {job_post.resume_alignment_level} - {title} @ {company} (score={job_post.match_score})")
+    else:
+        log.info(f"Rejected: {job_post.resume_alignment_level or 'Ignore'} - {title} @ {company} (score={job_post.match_score})")
+    return job_post
+
+def _enrich_from_description(job_meta: Dict[str, any], description: str | None) -> JobPost:
+    text = markdown_converter(description) if description else ""
+    return _build_enriched_post(job_meta, text, ProfileMatchEvaluator().evaluate(text))
+
+def _join_capped(chunks: List[bytes], encoding: str | None) -> str:
+    return b"".join(chunks)[:settings.ENRICH_MAX_PAGE_BYTES].decode(encoding or "utf-8", errors="replace")
+
+def _read_page(res) -> str:
+    """Stream a requests response, keeping at most ENRICH_MAX_PAGE_BYTES of it."""
+    chunks, size = [], 0
+    for chunk in res.iter_content(65536):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= settings.ENRICH_MAX_PAGE_BYTES: break
+    return _join_capped(chunks, res.encoding)
+
+async def _read_page_async(res: httpx.Response) -> str:
+    """Async sibling of `_read_page` for httpx streams."""
+    chunks, size = [], 0
+    async for chunk in res.aiter_bytes(65536):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= settings.ENRICH_MAX_PAGE_BYTES: break
+    return _join_capped(chunks, res.encoding)
+
+async def _fetch_description(job_meta: Dict[str, any], client: httpx.AsyncClient, semaphore: asyncio.Semaphore) -> str | None:
+    url = job_meta.get("job_url")
+    description = job_meta.get("short_description")
+    if not description and url:
+        try:
+            async with semaphore, client.stream("GET", url, timeout=5) as res:
+                description = await _read_page_async(res)
+        except Exception as e:
+            log.error(f"Fetch error {url}: {e}")
+            description = None
+    return description
+
+@functools.lru_cache(maxsize=1)
+def _enrich_session():
+    """One keep-alive session for every `enrich_job` call, so repeat hosts skip the TCP/TLS handshake."""
+    return create_session(is_tls=False, has_retry=False, clear_cookies=True)
+
+@cached_enrichment
+def enrich_job(job_meta: Dict[str, any], timeout_seconds: int = 15) -> JobPost | None:
+    url = job_meta.get("job_url")
+    session = _enrich_session()
     try:
         description = job_meta.get("short_description")
         if not description and url:
             try:
-                res = session.get(url, timeout=5)
-                html = getattr(res, "text", "")
-                description = html
+                with session.get(url, timeout=5, stream=True) as res:
+                    description = _read_page(res)
             except Exception as e:
                 log.error(f"Fetch error {url}: {e}")
                 description = None
-        text = markdown_converter(description) if description else ""
-        eval_res = evaluator.evaluate(text)
-        loc_val = job_meta.get("location")
-        loc_field = {"city": loc_val} if isinstance(loc_val, str) else loc_val
-        meta_is_remote = job_meta.get("is_remote")
-        meta_wfh = job_meta.get("work_from_home_type")
-        txt_lower = text.lower() if text else ""
-        inferred_is_remote = None
-        if meta_is_remote is not None: inferred_is_remote = bool(meta_is_remote)
-        else:
-            inferred_is_remote = bool(any(k in txt_lower for k in ["remote", "work from home", "wfh"]))
-        inferred_wfh = None
-        if isinstance(meta_wfh, str) and meta_wfh.strip(): inferred_wfh = meta_wfh.strip()
-        else:
-            if "hybrid" in txt_lower: inferred_wfh = "Hybrid"
-            elif any(k in txt_lower for k in ["remote", "work from home", "wfh"]): inferred_wfh = "Remote"
-        job_post = JobPost(
-            title=title,
-            company_name=company,
-            job_url=url,
-            location=loc_field,
-            description=text,
-            key_skills=eval_res.get("key_skills"),
-            experience_range=eval_res.get("experience_range"),
-            match_score=eval_res.get("match_score"),
-            match_reasons=eval_res.get("match_reasons"),
-            missing_skills=eval_res.get("missing_skills"),
-            resume_alignment_level=eval_res.get("resume_alignment_level"),
-            why_this_job_fits=eval_res.get("why_this_job_fits"),
-            site=site,
-            is_remote=inferred_is_remote,
-            work_from_home_type=inferred_wfh,
-        )
-        if job_post.resume_alignment_level and job_post.resume_alignment_level != "Ignore":
-            log.info(f"Accepted: {job_post.resume_alignment_level} - {title} @ {company} (score={job_post.match_score})")
-        else:
-            log.info(f"Rejected: {job_post.resume_alignment_level or 'Ignore'} - {title} @ {company} (score={job_post.match_score})")
-        return job_post
+        return _enrich_from_description(job_meta, description)
     except Exception as e:
         log.error(f"Enrichment error {url}: {e}")
         return None
 
+def _run_coroutine(coro):
+    """`asyncio.run`, or the same on a helper thread when this thread already runs an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+def enrich_jobs_concurrently(job_metas: List[Dict[str, any]], max_concurrency: int = settings.ENRICH_CONCURRENCY) -> List[JobPost | None]:
+    """Enrich many rows at once. Results keep input order.
+
+    Cached rows are served first; the remaining page fetches overlap on one
+    async client, then every fetched text is scored in a single evaluator batch.
+    Safe to call from code that is itself running inside an event loop.
+    """
+    keys = [_enrich_cache_key(m) for m in job_metas] if _enrich_cache_enabled() else [None] * len(job_metas)
+    results: List[JobPost | None] = [_enrich_cache_get(k) if k else None for k in keys]
+    pending = [i for i, post in enumerate(results) if post is None]
+    if not pending: return results
+
+    async def _gather():
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # Keep-alive pool sized to the concurrency; with h2 installed, requests to one host share a connection
+        limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        async with httpx.AsyncClient(follow_redirects=True, limits=limits, http2=h2 is not None) as client:
+            return await asyncio.gather(*[_fetch_description(job_metas[i], client, semaphore) for i in pending])
+
+    texts = []
+    for i, description in zip(pending, _run_coroutine(_gather())):
+        try: texts.append(markdown_converter(description) if description else "")
+        except Exception as e:
+            log.error(f"Enrichment error {job_metas[i].get('job_url')}: {e}")
+            texts.append("")
+    evaluations = ProfileMatchEvaluator().evaluate_batch(texts)
+    for i, text, eval_res in zip(pending, texts, evaluations):
+        try:
+            post = _build_enriched_post(job_metas[i], text, eval_res)
+        except Exception as e:
+            log.error(f"Enrichment error {job_metas[i].get('job_url')}: {e}")
+            continue
+        results[i] = post
+        if keys[i]: _enrich_cache_put(keys[i], post)
+    return results
+
 def run_personalized_pipeline(
     keywords: List[str],
     location: str | None,
     results_wanted: int,
     output_file: str | None = None,
+    max_workers: int | None = None,
 ) -> pd.DataFrame:
-    discovery = discover_jobs(keywords=keywords, location=location, results_wanted=results_wanted)
-    enriched_posts = []
+    if max_workers and len(keywords) > 1:
+        discovery = discover_jobs_by_keyword(keywords=keywords, location=location, results_wanted=results_wanted, max_workers=max_workers)
+    else:
+        discovery = discover_jobs(keywords=keywords, location=location, results_wanted=results_wanted)
+    discovery = dedupe_discovery_rows(discovery)
+    valid_rows = []
     for meta in discovery:
         valid, reason = validate_discovery_row(meta)
         if not valid:
             log.warning(f"Skipping row: {reason} -- {meta}")
             continue
-        post = enrich_job(meta)
-        if post: enriched_posts.append(post)
-        time.sleep(0.5)
+        valid_rows.append(meta)
+    enriched_posts = [post for post in enrich_jobs_concurrently(valid_rows) if post]
     if not enriched_posts: return pd.DataFrame()
     rows = [p.dict() for p in enriched_posts]
     df = pd.DataFrame(rows)
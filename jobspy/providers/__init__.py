@@ -35,3 +35,7 @@ def get_provider(name: str):
 
 def list_providers():
     return list(_PROVIDERS.keys())
+
+
+# Built-in providers register themselves on import.
+from . import clearbit  # noqa: E402,F401
@@ -1,7 +1,10 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 from ..providers import Provider, register_provider
+from ..util import create_session
 
 
 @register_provider
@@ -27,29 +30,36 @@ class ClearbitProvider(Provider):
                 private_rows.append({"profile_url": str(u).strip(), "reason": "clearbit_no_api_key"})
             return public_rows, private_rows
 
-        session = requests.Session()
+        profile_urls = [str(u).strip() for u in df[url_col].dropna().tolist()]
+        # Each lookup is one independent HTTP round-trip, so they run side by side on one pooled session
+        max_workers = max(1, min(int(options.get("max_workers", 8)), len(profile_urls)))
+        session = create_session(is_tls=False, pool_maxsize=max_workers)
         session.headers.update({"Authorization": f"Bearer {key}", "User-Agent": "JobSpy-Client/1.0"})
 
-        for u in df[url_col].dropna().tolist():
-            profile_url = str(u).strip()
-            # best-effort: try to call Person API using linkedin lookup param (best-effort)
-            try:
-                resp = session.get("https://person.clearbit.com/v2/people/find?linkedin=" + requests.utils.requote_uri(profile_url), timeout=10)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    out = {
-                        "profile_url": profile_url,
-                        "linkedin": profile_url,
-                        "website": data.get("site", {}).get("url") if isinstance(data.get("site"), dict) else None,
-                        "phone": data.get("phone"),
-                        "email": data.get("email"),
-                        "connected_since": None,
-                    }
-                    public_rows.append(out)
-                elif resp.status_code == 404:
-                    private_rows.append({"profile_url": profile_url, "reason": "clearbit_not_found"})
-                else:
-                    private_rows.append({"profile_url": profile_url, "reason": f"clearbit_error_{resp.status_code}"})
-            except Exception as exc:
-                private_rows.append({"profile_url": profile_url, "reason": f"clearbit_exception_{str(exc)[:120]}"})
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for public, private in executor.map(lambda u: self._lookup(session, u), profile_urls):
+                if public: public_rows.append(public)
+                if private: private_rows.append(private)
         return public_rows, private_rows
+
+    def _lookup(self, session: requests.Session, profile_url: str) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """Look up one profile; returns (public_row, None) or (None, private_row)."""
+        # best-effort: try to call Person API using linkedin lookup param (best-effort)
+        try:
+            resp = session.get("https://person.clearbit.com/v2/people/find?linkedin=" + requests.utils.requote_uri(profile_url), timeout=10)
+            if resp.status_code == 200:
+                data = orjson.loads(resp.content)
+                return {
+                    "profile_url": profile_url,
+                    "linkedin": profile_url,
+                    "website": data.get("site", {}).get("url") if isinstance(data.get("site"), dict) else None,
+                    "phone": data.get("phone"),
+                    "email": data.get("email"),
+                    "connected_since": None,
+                }, None
+            elif resp.status_code == 404:
+                return None, {"profile_url": profile_url, "reason": "clearbit_not_found"}
+            else:
+                return None, {"profile_url": profile_url, "reason": f"clearbit_error_{resp.status_code}"}
+        except Exception as exc:
+            return None, {"profile_url": profile_url, "reason": f"clearbit_exception_{str(exc)[:120]}"}
@@ -22,7 +22,7 @@ class ProviderOrchestrator:
     def run(self, input_csv: str, options: Dict[str, Any] = None) -> Tuple[List[Dict], List[Dict]]:
         if options is None:
             options = {}
-        public_acc: List[Dict] = []
+        public_acc: Dict[str, Dict] = {}  # map profile_url -> first public row, in discovery order
         private_acc: Dict[str, Dict] = {}  # map profile_url -> reason
 
         # For each provider in order, try to fetch and add results. If provider fails, use retry_with_backoff
@@ -50,22 +50,20 @@ class ProviderOrchestrator:
                 continue
 
             # Merge public_rows - prefer first provider that returns data for a profile
-            seen = set([r.get("profile_url") for r in public_acc])
             for r in public_rows:
                 pu = r.get("profile_url")
-                if pu not in seen:
-                    public_acc.append(r)
-                    seen.add(pu)
+                if pu not in public_acc:
+                    public_acc[pu] = r
                     # if previously marked private, remove it
                     private_acc.pop(pu, None)
 
             # Merge private markers (only annotate if we don't have public data)
             for r in private_rows:
                 pu = r.get("profile_url")
-                if pu not in seen:
+                if pu not in public_acc:
                     private_acc.setdefault(pu, r)
 
         # final lists
-        public_list = public_acc
+        public_list = list(public_acc.values())
         private_list = list(private_acc.values())
         return public_list, private_list
@@ -2,7 +2,7 @@
 """
 Base repository with common CRUD operations.
 """
-from typing import TypeVar, Generic, Optional, List, Dict, Any
+from typing import TypeVar, Generic, Optional, List, Dict, Any, Callable, Iterator
 from uuid import UUID
 from jobspy.database import get_db
 from jobspy.util import create_logger
@@ -98,7 +98,7 @@ class BaseRepository(Generic[T]):
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count records matching filters."""
         try:
-            query = self.db.table(self.table_name).select("id", count="exact")
+            query = self.db.table(self.table_name).select("*", count="exact", head=True)
             if filters:
                 for key, value in filters.items():
                     query = query.eq(key, value)
@@ -107,3 +107,35 @@ class BaseRepository(Generic[T]):
         except Exception as e:
             self.log.error(f"Error counting records: {e}")
             return 0
+
+    def iter_query(
+        self,
+        build_query: Callable[[], Any],
+        limit: int = 100,
+        page_size: int = 50
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield up to `limit` rows, fetching them one `.range()` page at a time.
+
+        Args:
+            build_query: Returns a fresh filtered/ordered query (builders are single-use)
+            limit: Maximum number of rows to yield
+            page_size: Rows requested per round-trip
+
+        Returns:
+            Iterator over result rows
+
+        Raises:
+            Exception: A page fetch failed; rows already yielded are not a complete result
+        """
+        offset = 0
+        while offset < limit:
+            end = min(offset + page_size, limit) - 1
+            try:
+                rows = build_query().range(offset, end).execute().data or []
+            except Exception as e:
+                self.log.error(f"Error fetching page {offset}-{end}: {e}")
+                raise
+            yield from rows
+            if len(rows) < end - offset + 1:
+                return
+            offset = end + 1
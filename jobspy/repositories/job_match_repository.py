@@ -4,9 +4,25 @@ Job match repository for storing and retrieving match scores.
 """
 from typing import List, Dict, Any, Optional
 from uuid import UUID
+from jobspy.cache import evict_group
 from .base_repository import BaseRepository
 
 
+MATCHES_BY_SEARCH_SQL = """
+SELECT m.*, to_jsonb(j) AS jobs
+FROM job_matches m
+LEFT JOIN jobs j ON j.id = m.job_id
+WHERE m.search_id = $1 AND ($2::int IS NULL OR m.match_score >= $2) AND ($3::uuid IS NULL OR m.profile_id = $3)
+ORDER BY m.match_score DESC
+"""
+
+
+def _evict_search_results(search_ids) -> None:
+    """Cached search results go stale as soon as matches for the search change."""
+    stale = {str(s) for s in search_ids if s is not None}
+    if stale: evict_group("search_results", lambda key: key[0] in stale)
+
+
 class JobMatchRepository(BaseRepository):
     """Repository for job match operations."""
 
@@ -41,6 +57,7 @@ class JobMatchRepository(BaseRepository):
             response = self.db.table(self.table_name)\
                 .upsert(data, on_conflict="profile_id,job_id")\
                 .execute()
+            _evict_search_results([search_id])
             if response.data:
                 return response.data[0] if isinstance(response.data, list) else response.data
             return None
@@ -71,14 +88,18 @@ class JobMatchRepository(BaseRepository):
     def get_matches_by_search(
         self,
         search_id: UUID,
-        min_score: Optional[int] = None
+        min_score: Optional[int] = None,
+        profile_id: Optional[UUID] = None
     ) -> List[Dict[str, Any]]:
-        """Get all matches for a specific search."""
+        """Get all matches for a specific search, optionally only `profile_id`'s."""
         try:
             query = self.db.table(self.table_name)\
                 .select("*, jobs(*)")\
                 .eq("search_id", str(search_id))
 
+            if profile_id is not None:
+                query = query.eq("profile_id", str(profile_id))
+
             if min_score is not None:
                 query = query.gte("match_score", min_score)
 
@@ -88,6 +109,21 @@ class JobMatchRepository(BaseRepository):
             self.log.error(f"Error fetching matches by search: {e}")
             return []
 
+    async def fetch_matches_by_search(
+        self,
+        search_id: UUID,
+        min_score: Optional[int] = None,
+        profile_id: Optional[UUID] = None
+    ) -> List[Dict[str, Any]]:
+        """Same rows as get_matches_by_search, read over the asyncpg pool."""
+        try:
+            pool = await self.db.get_pool()
+            rows = await pool.fetch(MATCHES_BY_SEARCH_SQL, search_id, min_score, profile_id)
+            return [dict(row) for row in rows]
+        except Exception as e:
+            self.log.error(f"Error fetching matches by search: {e}")
+            return []
+
     def bulk_create_matches(self, matches: List[Dict[str, Any]]) -> int:
         """Bulk create match records."""
         try:
@@ -95,6 +131,7 @@ class JobMatchRepository(BaseRepository):
                 .upsert(matches, on_conflict="profile_id,job_id")\
                 .execute()
             count = len(response.data) if response.data else 0
+            _evict_search_results({m.get("search_id") for m in matches})
             self.log.info(f"Bulk created {count} matches")
             return count
         except Exception as e:
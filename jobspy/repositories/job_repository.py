@@ -2,7 +2,7 @@
 """
 Job repository for job listing operations.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from uuid import UUID
 from datetime import datetime, timedelta
 from .base_repository import BaseRepository
@@ -31,21 +31,48 @@ class JobRepository(BaseRepository):
         """Find jobs by site."""
         return self.find_by({"site": site}, limit=limit)
 
+    def _recent_jobs_query(self, days: int):
+        cutoff_date = (datetime.now() - timedelta(days=days)).date()
+        return self.db.table(self.table_name)\
+            .select("*")\
+            .gte("date_posted", str(cutoff_date))\
+            .order("date_posted", desc=True)\
+            .order("id")
+
     def find_recent_jobs(self, days: int = 7, limit: int = 100) -> List[Dict[str, Any]]:
         """Find jobs posted in the last N days."""
         try:
-            cutoff_date = (datetime.now() - timedelta(days=days)).date()
-            response = self.db.table(self.table_name)\
-                .select("*")\
-                .gte("date_posted", str(cutoff_date))\
-                .order("date_posted", desc=True)\
-                .limit(limit)\
-                .execute()
+            response = self._recent_jobs_query(days).limit(limit).execute()
             return response.data or []
         except Exception as e:
             self.log.error(f"Error finding recent jobs: {e}")
             return []
 
+    def iter_recent_jobs(self, days: int = 7, limit: int = 100, page_size: int = 50) -> Iterator[Dict[str, Any]]:
+        """Yield jobs posted in the last N days, one page at a time."""
+        return self.iter_query(lambda: self._recent_jobs_query(days), limit=limit, page_size=page_size)
+
+    def _search_jobs_query(
+        self,
+        keywords: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        is_remote: Optional[bool] = None
+    ):
+        query = self.db.table(self.table_name).select("*")
+
+        if keywords:
+            search_term = " | ".join(keywords)
+            query = query.text_search("description", search_term)
+
+        if location:
+            query = query.ilike("location->>city", f"%{location}%")
+
+        if is_remote is not None:
+            query = query.eq("is_remote", is_remote)
+
+        # .range() paging needs a total order, or rows can repeat or go missing between pages
+        return query.order("id")
+
     def search_jobs(
         self,
         keywords: Optional[List[str]] = None,
@@ -55,24 +82,28 @@ class JobRepository(BaseRepository):
     ) -> List[Dict[str, Any]]:
         """Search jobs with filters."""
         try:
-            query = self.db.table(self.table_name).select("*")
-
-            if keywords:
-                search_term = " | ".join(keywords)
-                query = query.text_search("description", search_term)
-
-            if location:
-                query = query.ilike("location->>city", f"%{location}%")
-
-            if is_remote is not None:
-                query = query.eq("is_remote", is_remote)
-
+            query = self._search_jobs_query(keywords, location, is_remote)
             response = query.limit(limit).execute()
             return response.data or []
         except Exception as e:
             self.log.error(f"Error searching jobs: {e}")
             return []
 
+    def iter_search_jobs(
+        self,
+        keywords: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        is_remote: Optional[bool] = None,
+        limit: int = 100,
+        page_size: int = 50
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield jobs matching filters, one page at a time."""
+        return self.iter_query(
+            lambda: self._search_jobs_query(keywords, location, is_remote),
+            limit=limit,
+            page_size=page_size
+        )
+
     def get_job_by_url(self, job_url: str) -> Optional[Dict[str, Any]]:
         """Find job by URL."""
         try:
@@ -86,15 +117,20 @@ class JobRepository(BaseRepository):
             self.log.error(f"Error finding job by URL: {e}")
             return None
 
-    def bulk_insert(self, jobs: List[Dict[str, Any]]) -> int:
-        """Bulk insert jobs."""
-        try:
-            response = self.db.table(self.table_name)\
-                .upsert(jobs, on_conflict="external_id,site")\
-                .execute()
-            count = len(response.data) if response.data else 0
-            self.log.info(f"Bulk inserted {count} jobs")
-            return count
-        except Exception as e:
-            self.log.error(f"Error bulk inserting jobs: {e}")
-            return 0
+    def bulk_insert(self, jobs: List[Dict[str, Any]], batch_size: int = 500) -> int:
+        """Bulk upsert jobs, one request per batch of `batch_size` rows."""
+        # Postgres rejects an upsert that touches the same conflict key twice
+        unique = {(job.get("external_id"), job.get("site")): job for job in jobs}
+        rows = list(unique.values())
+        count = 0
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            try:
+                response = self.db.table(self.table_name)\
+                    .upsert(batch, on_conflict="external_id,site")\
+                    .execute()
+                count += len(response.data) if response.data else 0
+            except Exception as e:
+                self.log.error(f"Error bulk inserting jobs {start}-{start + len(batch) - 1}: {e}")
+        self.log.info(f"Bulk inserted {count} jobs")
+        return count
@@ -6,11 +6,11 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Union, List
 import pandas as pd
 from jobspy.model import (
-    JobPost, JobResponse, Site, ScraperInput, Country, JobType, CompensationInterval, Location, SalarySource,
+    JobPost, JobResponse, Site, ScraperInput, Country, JobType, CompensationInterval, SalarySource, display_location,
 )
 from jobspy.linkedin import LinkedIn
 from jobspy.naukri import Naukri
-from jobspy.util import create_logger, extract_salary, create_session, get_enum_from_job_type, map_str_to_site, convert_to_annual, desired_order
+from jobspy.util import create_logger, find_emails, extract_salary, create_session, SeenIds, get_enum_from_job_type, map_str_to_site, convert_to_annual, desired_order
 import settings
 
 log = create_logger("ScrapeJobs")
@@ -58,8 +58,16 @@ def scrape_jobs(
     hours_old: int = None,
     enforce_annual_salary: bool = settings.ENFORCE_ANNUAL_SALARY,
     verbose: int = settings.VERBOSE,
+    seen_ids: dict | None = None,
     **kwargs,
 ) -> pd.DataFrame:
+    """Scrape the requested sites and return one normalized DataFrame.
+
+    Scrapers reuse one pooled keep-alive session per site for the whole process.
+    Pass the same (initially empty) `seen_ids` dict to repeated calls, e.g. one
+    per keyword, to make each job id count once across the calls, so
+    overlapping searches don't fetch the same descriptions again.
+    """
     set_logger_level(verbose)
     job_type = get_enum_from_job_type(job_type) if job_type else None
     def get_site_type():
@@ -97,6 +105,8 @@ def scrape_jobs(
         else:
             scraper_class = SCRAPER_MAPPING[site]
         scraper = scraper_class(proxies=proxies, ca_cert=ca_cert)
+        if seen_ids is not None:
+            scraper.seen_ids = seen_ids.setdefault(site, SeenIds())
         scraped_data: JobResponse = scraper.scrape(scraper_input)
         cap_name = site.value.capitalize()
         site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
@@ -114,86 +124,73 @@ def scrape_jobs(
         for future in as_completed(future_to_site):
             site_value, scraped_data = future.result()
             site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs: list[pd.DataFrame] = []
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
-            )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
-            )
-            if job_data["location"]:
-                job_data["location"] = Location(**job_data["location"]).display_location()
-
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
-            else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual=enforce_annual_salary,
-                    )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
-
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
-            )
-
-            job_data["skills"] = (
-                ", ".join(job_data["skills"]) if job_data["skills"] else None
-            )
-            job_data["experience_range"] = job_data.get("experience_range")
-            job_data["company_rating"] = job_data.get("company_rating")
-            job_data["company_reviews_count"] = job_data.get("company_reviews_count")
-            job_data["vacancy_count"] = job_data.get("vacancy_count")
-            job_data["work_from_home_type"] = job_data.get("work_from_home_type")
-
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
-
-    if jobs_dfs:
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None
-        jobs_df = jobs_df[desired_order]
-        return jobs_df.sort_values(
-            by=["site", "date_posted"], ascending=[True, False]
-        ).reset_index(drop=True)
-    else:
+    log.debug(f"email extraction cache: {find_emails.cache_info()}")
+
+    rows = [
+        {**job.dict(), "site": site}
+        for site, job_response in site_to_jobs_dict.items()
+        for job in job_response.jobs
+    ]
+    if not rows:
         return pd.DataFrame()
+    return _jobs_frame(rows, country_enum, enforce_annual_salary)
+
+SALARY_COLUMNS = ("interval", "min_amount", "max_amount", "currency", "salary_source")
+
+def _join_lists(column: pd.Series) -> pd.Series:
+    """Join list cells with ", "; missing or empty lists become None."""
+    return column.map(lambda values: ", ".join(values) if values else None)
+
+def _salary_fields(compensation: dict | None, description: str | None, country_enum: Country, enforce_annual_salary: bool) -> tuple:
+    if isinstance(compensation, dict):
+        salary = {
+            "interval": compensation["interval"].value if compensation.get("interval") else None,
+            "min_amount": compensation.get("min_amount"),
+            "max_amount": compensation.get("max_amount"),
+            "currency": compensation.get("currency", "USD"),
+        }
+        if enforce_annual_salary and (
+            salary["interval"]
+            and salary["interval"] != "yearly"
+            and salary["min_amount"]
+            and salary["max_amount"]
+        ):
+            convert_to_annual(salary)
+        interval, min_amount, max_amount, currency = salary.values()
+        source = SalarySource.DIRECT_DATA.value
+    elif country_enum == Country.USA:
+        interval, min_amount, max_amount, currency = extract_salary(description, enforce_annual=enforce_annual_salary)
+        source = SalarySource.DESCRIPTION.value
+    else:
+        return (None,) * len(SALARY_COLUMNS)
+    return interval, min_amount, max_amount, currency, source if min_amount else None
+
+def _jobs_frame(rows: list[dict], country_enum: Country, enforce_annual_salary: bool) -> pd.DataFrame:
+    """Build the output frame once and normalize it column by column."""
+    jobs_df = pd.DataFrame(rows)
+    jobs_df["company"] = jobs_df["company_name"]
+    jobs_df["job_type"] = jobs_df["job_type"].map(
+        lambda job_types: ", ".join(job_type.value[0] for job_type in job_types) if job_types else None
+    )
+    jobs_df["emails"] = _join_lists(jobs_df["emails"])
+    jobs_df["skills"] = _join_lists(jobs_df["skills"])
+    jobs_df["location"] = jobs_df["location"].map(
+        lambda location: display_location(location.get("city"), location.get("state"), location.get("country")) if location else None
+    )
+    salaries = [
+        _salary_fields(compensation, description, country_enum, enforce_annual_salary)
+        for compensation, description in zip(jobs_df["compensation"], jobs_df["description"])
+    ]
+    for column, values in zip(SALARY_COLUMNS, zip(*salaries)):
+        jobs_df[column] = list(values)
+
+    for column in desired_order:
+        if column not in jobs_df.columns:
+            jobs_df[column] = None
+    jobs_df = jobs_df[desired_order]
+    return jobs_df.sort_values(
+        by=["site", "date_posted"], ascending=[True, False]
+    ).reset_index(drop=True)
 
 def convert_to_annual(job_data: dict):
     if job_data["interval"] == "hourly":
@@ -2,9 +2,11 @@
 """
 Enhanced job scraping service with database persistence and deduplication.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from uuid import UUID
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import time
 from jobspy.repositories import JobRepository, JobSearchRepository
 from jobspy.scrape_jobs import scrape_jobs
 from jobspy.model import JobPost, Location, Country
@@ -30,11 +32,15 @@ class JobScraperService:
         location: str = "India",
         sites: Optional[List[str]] = None,
         results_wanted: int = 100,
-        is_remote: bool = False
+        is_remote: bool = False,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Scrape jobs and save to database.
 
+        When ``max_workers`` is greater than one, each keyword is scraped as its
+        own search on a thread pool and the results are merged by job_url.
+
         Returns:
             Dict with search_id, jobs_found, jobs_saved
         """
@@ -60,14 +66,24 @@ class JobScraperService:
 
             log.info(f"Starting scrape: {keywords} in {location} from {sites}")
 
-            df = scrape_jobs(
-                site_name=sites,
-                search_term=search_term,
-                location=location,
-                results_wanted=results_wanted,
-                is_remote=is_remote,
-                description_format=self.config.scraper.description_format
-            )
+            if max_workers and max_workers > 1 and len(keywords) > 1:
+                df = self._scrape_keywords(
+                    keywords=keywords,
+                    sites=sites,
+                    location=location,
+                    results_wanted=results_wanted,
+                    is_remote=is_remote,
+                    max_workers=max_workers
+                )
+            else:
+                df = scrape_jobs(
+                    site_name=sites,
+                    search_term=search_term,
+                    location=location,
+                    results_wanted=results_wanted,
+                    is_remote=is_remote,
+                    description_format=self.config.scraper.description_format
+                )
 
             if df is None or df.empty:
                 self.search_repo.update_status(
@@ -109,6 +125,40 @@ class JobScraperService:
                 )
             raise
 
+    def _scrape_keywords(
+        self,
+        keywords: List[str],
+        sites: List[str],
+        location: str,
+        results_wanted: int,
+        is_remote: bool,
+        max_workers: int
+    ) -> pd.DataFrame:
+        """Scrape each keyword concurrently and merge results, deduplicated by job_url."""
+        # One set of seen job ids, so a job is fetched only for the first keyword that finds it
+        seen_ids: Dict[Any, Any] = {}
+
+        def worker(idx: int, keyword: str) -> pd.DataFrame:
+            # Stagger thread starts so the sites don't see a synchronized burst
+            time.sleep(idx * 0.1)
+            return scrape_jobs(
+                site_name=sites,
+                search_term=f'"{keyword}"',
+                location=location,
+                results_wanted=results_wanted,
+                is_remote=is_remote,
+                description_format=self.config.scraper.description_format,
+                seen_ids=seen_ids
+            )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keywords))) as executor:
+            dfs = list(executor.map(worker, range(len(keywords)), keywords))
+
+        dfs = [d for d in dfs if d is not None and not d.empty]
+        if not dfs:
+            return pd.DataFrame()
+        return pd.concat(dfs, ignore_index=True).drop_duplicates(subset=["job_url"]).reset_index(drop=True)
+
     def _prepare_jobs_for_db(
         self,
         df: pd.DataFrame,
@@ -170,6 +220,10 @@ class JobScraperService:
         """Get recently scraped jobs."""
         return self.job_repo.find_recent_jobs(days=days, limit=limit)
 
+    def iter_recent_jobs(self, days: int = 7, limit: int = 100) -> Iterator[Dict[str, Any]]:
+        """Yield recently scraped jobs without materializing the full list."""
+        return self.job_repo.iter_recent_jobs(days=days, limit=limit)
+
     def search_jobs(
         self,
         keywords: Optional[List[str]] = None,
@@ -184,3 +238,18 @@ class JobScraperService:
             is_remote=is_remote,
             limit=limit
         )
+
+    def iter_search_jobs(
+        self,
+        keywords: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        is_remote: Optional[bool] = None,
+        limit: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield matching jobs from the database without materializing the full list."""
+        return self.job_repo.iter_search_jobs(
+            keywords=keywords,
+            location=location,
+            is_remote=is_remote,
+            limit=limit
+        )
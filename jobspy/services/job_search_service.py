@@ -2,16 +2,25 @@
 """
 Job search orchestration service.
 """
+import asyncio
 from typing import List, Dict, Any, Optional
 from uuid import UUID
 from jobspy.repositories import JobSearchRepository
 from jobspy.services.job_scraper_service import JobScraperService
 from jobspy.services.matching_service import MatchingService
 from jobspy.util import create_logger
+from jobspy.cache import ttl_cached
 
 log = create_logger("JobSearchService")
 
 
+SEARCH_RESULTS_CACHE = "search_results"
+
+
+def _search_results_key(self, search_id, min_score=None, profile_id=None):
+    return str(search_id), str(profile_id) if profile_id is not None else None, min_score
+
+
 class JobSearchService:
     """Service for orchestrating job searches end-to-end."""
 
@@ -28,7 +37,8 @@ class JobSearchService:
         sites: Optional[List[str]] = None,
         results_wanted: int = 100,
         is_remote: bool = False,
-        auto_match: bool = True
+        auto_match: bool = True,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Execute a complete job search with scraping and matching.
@@ -41,6 +51,7 @@ class JobSearchService:
             results_wanted: Number of results
             is_remote: Filter for remote jobs
             auto_match: Automatically match scraped jobs
+            max_workers: Scrape keywords concurrently with this many threads
 
         Returns:
             Dict with search results and match statistics
@@ -53,7 +64,8 @@ class JobSearchService:
             location=location,
             sites=sites,
             results_wanted=results_wanted,
-            is_remote=is_remote
+            is_remote=is_remote,
+            max_workers=max_workers
         )
 
         search_id = UUID(scrape_result["search_id"])
@@ -73,15 +85,36 @@ class JobSearchService:
 
         return result
 
+    @ttl_cached(_search_results_key, ttl_field="search_results_ttl_seconds", group=SEARCH_RESULTS_CACHE)
     def get_search_results(
         self,
         search_id: UUID,
-        min_score: Optional[int] = None
+        min_score: Optional[int] = None,
+        profile_id: Optional[UUID] = None
     ) -> List[Dict[str, Any]]:
-        """Get matched results for a search."""
+        """Get matched results for a search, limited to `profile_id`'s matches when given."""
+        from jobspy.repositories import JobMatchRepository
+        match_repo = JobMatchRepository()
+        return match_repo.get_matches_by_search(search_id, min_score, profile_id)
+
+    @ttl_cached(_search_results_key, ttl_field="search_results_ttl_seconds", group=SEARCH_RESULTS_CACHE)
+    async def fetch_search_results(
+        self,
+        search_id: UUID,
+        min_score: Optional[int] = None,
+        profile_id: Optional[UUID] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of get_search_results.
+
+        Reads straight from Postgres when a pool is configured, otherwise
+        runs the PostgREST query in a worker thread.
+        """
         from jobspy.repositories import JobMatchRepository
         match_repo = JobMatchRepository()
-        return match_repo.get_matches_by_search(search_id, min_score)
+        if match_repo.db.pool_enabled:
+            return await match_repo.fetch_matches_by_search(search_id, min_score, profile_id)
+        return await asyncio.to_thread(match_repo.get_matches_by_search, search_id, min_score, profile_id)
 
     def get_user_searches(
         self,
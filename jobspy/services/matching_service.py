@@ -2,15 +2,73 @@
 """
 Enhanced matching service with improved scoring algorithm.
 """
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
+import hashlib
 import re
 from jobspy.repositories import JobMatchRepository, ProfileRepository, JobRepository
 from jobspy.config import get_config
 from jobspy.util import create_logger, norm_text
+from jobspy.evaluator import (
+    CICD_KEYWORDS,
+    DESIRED_SKILLS,
+    DEV_KEYWORDS,
+    ITSM_KEYWORDS,
+    MFT_KEYWORDS,
+    ONCALL_KEYWORDS,
+    SERVICENOW_ALIASES,
+    SUPPORT_KEYWORDS,
+    detect_clouds,
+    extract_experience,
+)
+from jobspy.cache import ttl_cached
 
 log = create_logger("MatchingService")
 
+# Same keyword families as ProfileMatchEvaluator, plus the spellings this matcher also accepts
+ONCALL_TERMS = ONCALL_KEYWORDS + ("24/7",)
+CICD_TERMS = CICD_KEYWORDS + ("cicd",)
+DEV_TERMS = DEV_KEYWORDS + ("architect",)
+
+_TOKEN_RE = re.compile(r"\w+")
+_WORD_SKILL_RE = re.compile(r"[a-z0-9]+")
+_REQUIRED_YEARS_RE = re.compile(r"(\d+)(?:-(\d+))?\+?\s*years?", re.I)
+
+
+@lru_cache(maxsize=8)
+def _exclusion_patterns(signals: tuple) -> Tuple[Tuple[str, re.Pattern], ...]:
+    """Compile each exclusion signal once, keeping config order so the first listed signal wins."""
+    return tuple((s, re.compile(rf"\b{re.escape(s)}\b", re.I)) for s in signals)
+
+
+@lru_cache(maxsize=8)
+def _skill_matchers(skills: tuple) -> Tuple[frozenset, Tuple[Tuple[str, re.Pattern], ...]]:
+    """
+    Split skills into plain words and everything else.
+
+    Plain words are found by intersecting with the text's tokens, which gives
+    the same word-boundary semantics as a \\b regex; phrases and underscore
+    skills (ci_cd -> "ci cd", "ci-cd", "cicd") keep a compiled pattern each.
+    """
+    words = frozenset(s for s in skills if _WORD_SKILL_RE.fullmatch(s))
+    phrases = tuple(
+        (s, re.compile(rf"\b{re.escape(s).replace('_', '[ _-]?')}\b", re.I))
+        for s in dict.fromkeys(skills) if s not in words
+    )
+    return words, phrases
+
+
+def _match_key(self, profile: Dict[str, Any], job: Dict[str, Any]) -> bytes:
+    """Digest of everything _evaluate_match reads from the profile and job."""
+    parts = (
+        profile.get("skills", []),
+        profile.get("experience_years", 0),
+        job.get("title", ""),
+        job.get("description", ""),
+    )
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).digest()
+
 
 class MatchingService:
     """Service for matching jobs to user profiles with intelligent scoring."""
@@ -20,10 +78,6 @@ class MatchingService:
         self.profile_repo = ProfileRepository()
         self.job_repo = JobRepository()
         self.config = get_config()
-        self.exp_regex = re.compile(
-            r"(?P<min>\d+)[+]?\s*[-–to]{0,3}\s*(?P<max>\d+)?\s*years?",
-            re.I
-        )
 
     def match_jobs_for_search(
         self,
@@ -104,6 +158,7 @@ class MatchingService:
             "top_matches": top_matches
         }
 
+    @ttl_cached(_match_key)
     def _evaluate_match(
         self,
         profile: Dict[str, Any],
@@ -119,17 +174,11 @@ class MatchingService:
         text = f"{job.get('title', '')} {job.get('description', '')}"
         lowered = norm_text(text)
 
-        for exclude_signal in cfg.exclude_signals:
-            try:
-                if re.search(rf"\b{re.escape(exclude_signal)}\b", lowered, re.I):
-                    return self._create_ignore_match(
-                        f"Exclusion signal: '{exclude_signal}'"
-                    )
-            except re.error:
-                if exclude_signal in lowered:
-                    return self._create_ignore_match(
-                        f"Exclusion signal: '{exclude_signal}'"
-                    )
+        for exclude_signal, pattern in _exclusion_patterns(tuple(cfg.exclude_signals)):
+            if pattern.search(lowered):
+                return self._create_ignore_match(
+                    f"Exclusion signal: '{exclude_signal}'"
+                )
 
         score = 0
         reasons = []
@@ -169,11 +218,11 @@ class MatchingService:
             score += min(5 * len(clouds), 10)
             reasons.append(f"Cloud: {', '.join(clouds)}")
 
-        if any(k in lowered for k in ["servicenow", "itil", "incident"]):
+        if any(k in lowered for k in ITSM_KEYWORDS):
             score += 8
             reasons.append("ServiceNow/ITIL/incident")
 
-        if any(k in lowered for k in ["jenkins", "ci/cd", "cicd"]):
+        if any(k in lowered for k in CICD_TERMS):
             score += 4
             reasons.append("CI/CD")
 
@@ -203,8 +252,7 @@ class MatchingService:
         else:
             level = "Ignore"
 
-        desired_skills = ["linux", "sftp", "servicenow", "itil"]
-        missing = [d for d in desired_skills if d not in key_skills and d not in lowered]
+        missing = [d for d in DESIRED_SKILLS if d not in key_skills and d not in lowered]
 
         return {
             "match_score": score,
@@ -229,35 +277,26 @@ class MatchingService:
     def _extract_skills(self, text: str, cfg) -> List[str]:
         """Extract skills from text."""
         txt = norm_text(text)
-        found = set()
+        words, phrases = _skill_matchers(tuple(cfg.primary_skills + cfg.secondary_skills))
 
-        for skill in cfg.primary_skills + cfg.secondary_skills:
-            skill_pattern = skill.replace("_", "[ _-]?")
-            if re.search(rf"\b{re.escape(skill_pattern)}\b", txt, re.I):
-                found.add(skill)
+        found = set(words.intersection(_TOKEN_RE.findall(txt)))
+        found.update(skill for skill, pattern in phrases if pattern.search(txt))
 
-        if any(k in txt for k in ["service now", "service-now", "servicenow"]):
+        if any(k in txt for k in SERVICENOW_ALIASES):
             found.add("servicenow")
 
         return sorted(found)
 
     def _extract_experience(self, text: str) -> Optional[str]:
         """Extract experience requirement."""
-        m = self.exp_regex.search(text)
-        if m:
-            min_exp = m.group("min")
-            max_exp = m.group("max")
-            if max_exp:
-                return f"{min_exp}-{max_exp} years"
-            return f"{min_exp}+ years"
-        return None
+        return extract_experience(text)
 
     def _check_experience_match(self, req: str, profile_exp: int) -> bool:
         """Check if profile experience matches requirement."""
         if not req or profile_exp == 0:
             return False
 
-        match = re.search(r"(\d+)(?:-(\d+))?\+?\s*years?", req, re.I)
+        match = _REQUIRED_YEARS_RE.search(req)
         if not match:
             return False
 
@@ -268,47 +307,23 @@ class MatchingService:
 
     def _detect_mft(self, text: str) -> bool:
         """Detect MFT/file transfer tools."""
-        keywords = [
-            "mft", "goanywhere", "go-anywhere", "go anywhere",
-            "managed file transfer", "fms", "ftg"
-        ]
-        return any(k in text for k in keywords)
+        return any(k in text for k in MFT_KEYWORDS)
 
     def _detect_oncall(self, text: str) -> bool:
         """Detect on-call requirements."""
-        keywords = [
-            "on-call", "on call", "rota", "rotation",
-            "shift", "night shift", "24x7", "24/7"
-        ]
-        return any(k in text for k in keywords)
+        return any(k in text for k in ONCALL_TERMS)
 
     def _detect_cloud(self, text: str) -> List[str]:
         """Detect cloud platforms."""
-        clouds = []
-        if "azure" in text:
-            clouds.append("Azure")
-        if "aws" in text:
-            clouds.append("AWS")
-        if "gcp" in text or "google cloud" in text:
-            clouds.append("GCP")
-        return clouds
+        return detect_clouds(text)
 
     def _is_support_oriented(self, text: str) -> bool:
         """Check if job is support-oriented."""
-        support_keywords = [
-            "production", "support", "incident", "l2", "l3",
-            "troubleshoot", "root cause", "incident management",
-            "problem management", "service desk", "ticket"
-        ]
-        return sum(1 for k in support_keywords if k in text) >= 2
+        return sum(1 for k in SUPPORT_KEYWORDS if k in text) >= 2
 
     def _is_dev_heavy(self, text: str) -> bool:
         """Check if job is development-heavy."""
-        dev_keywords = [
-            "develop", "implementation", "design", "feature",
-            "software engineer", "engineer -", "architect"
-        ]
-        return sum(1 for k in dev_keywords if k in text) >= 2
+        return sum(1 for k in DEV_TERMS if k in text) >= 2
 
     def get_top_matches(
         self,
@@ -2,6 +2,7 @@
 """
 Profile service for managing user profiles and preferences.
 """
+import re
 from typing import Dict, Any, Optional, List
 from uuid import UUID
 from jobspy.repositories import ProfileRepository
@@ -9,6 +10,13 @@ from jobspy.util import create_logger
 
 log = create_logger("ProfileService")
 
+RESUME_SKILLS = (
+    "python", "java", "javascript", "react", "angular",
+    "docker", "kubernetes", "aws", "azure", "gcp",
+    "sql", "mongodb", "postgresql", "linux", "git"
+)
+RESUME_EXPERIENCE_REGEX = re.compile(r"(\d+)\+?\s*years?\s+(?:of\s+)?experience", re.I)
+
 
 class ProfileService:
     """Service for profile operations."""
@@ -70,22 +78,11 @@ class ProfileService:
         This is a simple keyword-based approach. In production,
         you'd use NLP or an AI service.
         """
-        skills = []
-        common_skills = [
-            "python", "java", "javascript", "react", "angular",
-            "docker", "kubernetes", "aws", "azure", "gcp",
-            "sql", "mongodb", "postgresql", "linux", "git"
-        ]
-
         lower_text = resume_text.lower()
-        for skill in common_skills:
-            if skill in lower_text:
-                skills.append(skill)
+        skills = [skill for skill in RESUME_SKILLS if skill in lower_text]
 
         exp_match = None
-        import re
-        exp_pattern = r"(\d+)\+?\s*years?\s+(?:of\s+)?experience"
-        match = re.search(exp_pattern, lower_text, re.I)
+        match = RESUME_EXPERIENCE_REGEX.search(lower_text)
         if match:
             exp_match = int(match.group(1))
 
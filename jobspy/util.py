@@ -1,15 +1,42 @@
 # jobspy/util.py
 from __future__ import annotations
+import atexit
+import hashlib
 import logging
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 import requests
 from requests.adapters import HTTPAdapter, Retry
 from urllib3.exceptions import InsecureRequestWarning
 from bs4 import BeautifulSoup
+from bs4.dammit import EntitySubstitution
+from bs4.element import Tag
+from bs4.formatter import HTMLFormatter
 from markdownify import markdownify as md
 from typing import List, Optional
+from collections import OrderedDict
 from enum import Enum
+from functools import lru_cache
 import re
 
+try:
+    import lxml
+except ImportError:  # optional
+    lxml = None
+
+# lxml's C parser builds trees many times faster than the pure-Python html.parser
+HTML_PARSER = "lxml" if lxml is not None else "html.parser"
+
+def has_class(*names: str):
+    """class_ matcher for SoupStrainer: true when any of `names` is one of the tag's classes.
+
+    bs4 4.13+ hands parse_only the raw, unsplit class attribute, so a plain
+    class_="x" strainer silently misses elements that carry several classes.
+    """
+    wanted = frozenset(names)
+    return lambda value: isinstance(value, str) and not wanted.isdisjoint(value.split())
+
 def create_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(f"JobSpy:{name}")
     if not logger.handlers:
@@ -22,13 +49,15 @@ def create_logger(name: str) -> logging.Logger:
     return logger
 
 class SessionFactory:
-    def __init__(self, proxies=None, ca_cert=None, is_tls=True, has_retry=False, delay=1, clear_cookies=False):
+    def __init__(self, proxies=None, ca_cert=None, is_tls=True, has_retry=False, delay=1, clear_cookies=False, pool_maxsize=32, pool_block=False):
         self.proxies = proxies
         self.ca_cert = ca_cert
         self.is_tls = is_tls
         self.has_retry = has_retry
         self.delay = delay
         self.clear_cookies = clear_cookies
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
 
     def make(self) -> requests.Session:
         if self.is_tls:
@@ -43,31 +72,141 @@ class SessionFactory:
             sess.cookies.clear()
         if self.proxies:
             sess.proxies.update(self.proxies)
+        retries = 0
         if self.has_retry:
+            # 429s honour Retry-After; otherwise back off exponentially with jitter, capped at 32s
             retries = Retry(
-                total=3,
+                total=5,
                 connect=3,
-                status=3,
+                status=5,
                 status_forcelist=[500, 502, 503, 504, 429],
+                allowed_methods=frozenset(["GET", "POST"]),
+                respect_retry_after_header=True,
                 backoff_factor=self.delay,
+                backoff_max=32,
+                backoff_jitter=1,
             )
-            adapter = HTTPAdapter(max_retries=retries)
-            sess.mount("http://", adapter)
-            sess.mount("https://", adapter)
+        # Size the keep-alive pool so concurrent keyword scrapes sharing this session reuse connections;
+        # with pool_block, extra threads wait for a pooled connection instead of opening throwaway ones
+        adapter = HTTPAdapter(max_retries=retries, pool_connections=self.pool_maxsize, pool_maxsize=self.pool_maxsize, pool_block=self.pool_block)
+        sess.headers["Connection"] = "keep-alive"
+        sess.mount("http://", adapter)
+        sess.mount("https://", adapter)
         return sess
 
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` acquisitions per second, with bursts of up to `burst`.
+
+    The rate adapts AIMD-style: `penalize` halves it after a throttled response,
+    `reward` climbs back toward the configured rate by a tenth per success.
+    """
+
+    def __init__(self, rate: float, burst: int, min_rate: float | None = None):
+        self.max_rate = self.rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def slowdown(self) -> float:
+        """How many times slower than the configured rate the bucket currently runs."""
+        return self.max_rate / self.rate
+
+    def penalize(self, retry_after: float | None = None) -> None:
+        """Halve the rate and drain the bucket; with `retry_after`, hold every caller for that long."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(0.0, self.tokens, -(retry_after or 0) * self.rate)
+
+    def reward(self) -> None:
+        if self.rate >= self.max_rate: return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+def retry_after_seconds(response) -> float | None:
+    """Seconds from a numeric Retry-After header, if the response sent one."""
+    value = response.headers.get("Retry-After") if getattr(response, "headers", None) else None
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+def throttle_feedback(limiter: TokenBucket, response) -> None:
+    """Feed a response's status back into `limiter`: slow down on 429/403, speed back up on success."""
+    if response.status_code in (403, 429):
+        limiter.penalize(retry_after_seconds(response))
+    elif response.status_code < 400:
+        limiter.reward()
+
+class SeenIds:
+    """Thread-safe set of job ids already claimed by a scrape; share one across concurrent scrapes of a site."""
+
+    def __init__(self):
+        self._ids: set = set()
+        self._lock = threading.Lock()
+
+    def claim(self, job_id) -> bool:
+        """Record `job_id`; False if it had already been claimed."""
+        with self._lock:
+            if job_id in self._ids:
+                return False
+            self._ids.add(job_id)
+            return True
+
+    def claim_new(self, job_ids, limit: int | None = None) -> list:
+        """Claim a page of ids in order under one lock, returning the unseen ones (at most `limit`)."""
+        claimed = []
+        append = claimed.append
+        with self._lock:
+            seen = self._ids
+            add = seen.add
+            for job_id in job_ids:
+                if limit is not None and len(claimed) >= limit: break
+                if job_id in seen: continue
+                add(job_id)
+                append(job_id)
+        return claimed
+
+EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+@lru_cache(maxsize=1024)
+def find_emails(text: str) -> tuple:
+    """Cached scan: reposted jobs repeat the same description, so the regex runs once per distinct text."""
+    return tuple(EMAIL_RE.findall(text))
+
 def extract_emails_from_text(text: str | None) -> List[str] | None:
     if not text: return None
-    return re.findall(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text)
+    # most descriptions have no address at all; a substring check is far cheaper than the regex scan
+    if "@" not in text: return []
+    return list(find_emails(text))
+
+_NON_AMOUNT_RE = re.compile(r"[^0-9.,-]")
+_SEPARATOR_RE = re.compile(r"[.,]")
+SALARY_RANGE_RE = re.compile(r"\$(?P<min>[\d,.]+)\s*(-|—|to)\s*\$(?P<max>[\d,.]+)", re.I)
 
 def currency_parser(s: str) -> float:
-    s = re.sub(r"[^0-9.,-]", "", s)
-    s = re.sub(r"[.,]", "", s[:-3]) + s[-3:]
+    s = _NON_AMOUNT_RE.sub("", s)
+    s = _SEPARATOR_RE.sub("", s[:-3]) + s[-3:]
     return float(s.replace(",", "."))
 
 def extract_salary(salary_str: str, enforce_annual: bool = False) -> tuple[Optional[str], Optional[float], Optional[float], Optional[str]]:
     if not salary_str: return None, None, None, None
-    match = re.search(r"\$(?P<min>[\d,.]+)\s*(-|—|to)\s*\$(?P<max>[\d,.]+)", salary_str, re.I)
+    match = SALARY_RANGE_RE.search(salary_str)
     if not match: return None, None, None, None
     min_amt = currency_parser(match.group("min"))
     max_amt = currency_parser(match.group("max"))
@@ -92,26 +231,61 @@ def norm_text(text: str) -> str:
     return text.lower()
 
 
-def create_session(proxies=None, ca_cert=None, is_tls=True, has_retry=False, delay=1, clear_cookies=False):
+def create_session(proxies=None, ca_cert=None, is_tls=True, has_retry=False, delay=1, clear_cookies=False, pool_maxsize=32, pool_block=False):
     """Create and return a configured requests session."""
-    return SessionFactory(proxies=proxies, ca_cert=ca_cert, is_tls=is_tls, has_retry=has_retry, delay=delay, clear_cookies=clear_cookies).make()
+    return SessionFactory(proxies=proxies, ca_cert=ca_cert, is_tls=is_tls, has_retry=has_retry, delay=delay, clear_cookies=clear_cookies, pool_maxsize=pool_maxsize, pool_block=pool_block).make()
+
+_session_cache: dict = {}
+_session_cache_lock = threading.Lock()
+
+def _proxies_key(proxies):
+    if isinstance(proxies, dict): return tuple(sorted(proxies.items()))
+    if isinstance(proxies, (list, tuple)): return tuple(proxies)
+    return proxies
+
+def cached_session(owner: str, setup=None, **kwargs) -> requests.Session:
+    """
+    Process-wide `create_session(**kwargs)` per (owner, proxies, ca_cert, is_tls).
+
+    Scrapers built without a session reuse the first one made for their site, so
+    later instances start on a pool whose DNS/TLS handshakes are already done.
+    `setup` runs once on a new session, e.g. to install the owner's headers.
+    """
+    key = (owner, _proxies_key(kwargs.get("proxies")), kwargs.get("ca_cert"), kwargs.get("is_tls", True))
+    with _session_cache_lock:
+        session = _session_cache.get(key)
+        if session is None:
+            session = _session_cache[key] = create_session(**kwargs)
+            if setup is not None: setup(session)
+    return session
 
 
 def remove_attributes(tag):
-    """Remove attributes from a BeautifulSoup Tag (recursively) to sanitize HTML."""
+    """Remove attributes from a BeautifulSoup Tag and all its descendants to sanitize HTML."""
     try:
         if hasattr(tag, "attrs"):
             tag.attrs = {}
-        for child in tag.find_all(True):
-            child.attrs = {}
+        # .descendants walks the tree iteratively; find_all(True) would first build a list of every tag
+        for child in tag.descendants:
+            if isinstance(child, Tag): child.attrs = {}
     except Exception:
         pass
     return tag
 
 
+class _BareHTMLFormatter(HTMLFormatter):
+    """formatter="html" that writes no attributes, so serializing also strips them."""
+
+    def attributes(self, tag):
+        return ()
+
+# tag.prettify(formatter=BARE_HTML) == remove_attributes(tag).prettify(formatter="html"), in one walk and without mutating tag
+BARE_HTML = _BareHTMLFormatter(entity_substitution=EntitySubstitution.substitute_html)
+
+
 def markdown_converter(html: str) -> str:
     if not html: return ""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     for t in soup(["script", "style"]):
         t.decompose()
     remove_attributes(soup)
@@ -121,8 +295,57 @@ def markdown_converter(html: str) -> str:
     except Exception:
         return str(soup)
 
+_markdown_pool: ProcessPoolExecutor | None = None
+_markdown_pool_lock = threading.Lock()
+# Large employers post the same boilerplate description many times; converted text is kept by content digest
+_markdown_cache: OrderedDict[bytes, str] = OrderedDict()
+_MARKDOWN_CACHE_SIZE = 256
+
+def markdown_converter_batch(htmls: List[str | None], workers: int = 0) -> List[str | None]:
+    """Convert a page of descriptions to Markdown; empty ones are passed through unchanged.
+
+    The conversion is CPU-bound, so with `workers` > 0 it runs in a shared process
+    pool (created on first use) instead of serially under the GIL. Identical
+    descriptions, within the batch or seen recently, are converted only once.
+    """
+    global _markdown_pool
+    out = list(htmls)
+    digests = {i: hashlib.sha1(html.encode()).digest() for i, html in enumerate(htmls) if html}
+    with _markdown_pool_lock:
+        done = {d: _markdown_cache[d] for d in set(digests.values()) if d in _markdown_cache}
+    missing = {d: htmls[i] for i, d in digests.items() if d not in done}
+    if workers > 0 and len(missing) > 1:
+        with _markdown_pool_lock:
+            if _markdown_pool is None:
+                _markdown_pool = ProcessPoolExecutor(max_workers=workers)
+        converted = _markdown_pool.map(markdown_converter, missing.values(), chunksize=max(1, len(missing) // workers))
+    else:
+        converted = map(markdown_converter, missing.values())
+    done.update(zip(missing, converted))
+    with _markdown_pool_lock:
+        for d in missing:
+            _markdown_cache[d] = done[d]
+        for d in done:
+            _markdown_cache.move_to_end(d)
+        while len(_markdown_cache) > _MARKDOWN_CACHE_SIZE:
+            _markdown_cache.popitem(last=False)
+    for i, d in digests.items():
+        out[i] = done[d]
+    return out
+
+def close_markdown_pool() -> None:
+    """Shut down the shared Markdown process pool, if one was started; the next batch starts a new one."""
+    global _markdown_pool
+    with _markdown_pool_lock:
+        pool, _markdown_pool = _markdown_pool, None
+    if pool is not None: pool.shutdown(wait=True, cancel_futures=True)
+
+atexit.register(close_markdown_pool)
 
+
+@lru_cache(maxsize=128)
 def get_enum_from_job_type(value_str):
+    """Resolve a job-type label to its JobType; postings repeat a handful of labels, so each is resolved once."""
     from jobspy.model import JobType
     if not value_str: return None
     val = value_str.lower()
@@ -132,6 +355,16 @@ def get_enum_from_job_type(value_str):
     raise Exception(f"Invalid job type: {value_str}")
 
 
+@lru_cache(maxsize=None)
+def _enum_lookup(enum_cls) -> dict:
+    """Map each member's value and lower-cased name to the member, built once per enum."""
+    lookup = {}
+    for member in enum_cls:
+        lookup.setdefault(member.value, member)
+        lookup.setdefault(member.name.lower(), member)
+    return lookup
+
+
 def get_enum_from_value(enum_cls, value):
     """Generic helper to get an enum member from a string value or name.
 
@@ -139,10 +372,9 @@ def get_enum_from_value(enum_cls, value):
     """
     if value is None:
         return None
-    val = str(value).strip().lower()
-    for member in enum_cls:
-        if val == member.value or val == member.name.lower():
-            return member
+    member = _enum_lookup(enum_cls).get(str(value).strip().lower())
+    if member is not None:
+        return member
     raise ValueError(f"{value} is not a valid member of {enum_cls}")
 
 
@@ -283,6 +283,24 @@ def _fetch_and_parse_worker(session, contact_url, headers, timeout, retries, bac
         return False, reason
 
 
+def run(input_csv: str, url_column: str = "profile_url", output_dir: str = DEFAULT_OUTPUT_DIR, max_profiles: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE, workers: int = DEFAULT_WORKERS, proxies: Optional[dict] = None) -> Dict[str, object]:
+    """In-process entry point: process_profiles with the CLI defaults."""
+    return process_profiles(
+        input_csv,
+        output_dir,
+        DEFAULT_USER_AGENT,
+        DEFAULT_TIMEOUT,
+        DEFAULT_RETRIES,
+        batch_size,
+        workers,
+        DEFAULT_DELAY,
+        DEFAULT_BACKOFF_FACTOR,
+        url_column=url_column,
+        proxies=proxies,
+        max_profiles=max_profiles,
+    )
+
+
 # ---------- Logging setup ----------
 
 def setup_logging(logfile: str):
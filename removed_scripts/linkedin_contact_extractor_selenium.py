@@ -13,6 +13,7 @@ Setup:
 Behavior:
 - Logs in with Selenium using a primary driver, extracts cookies, and spins up worker drivers that reuse those cookies.
 - Each worker navigates to profile_url + "/overlay/contact-info/", waits for overlay selectors, extracts contact info.
+- With --reuse-driver, worker drivers are pooled and kept alive across batches instead of being relaunched per batch.
 - Checkpoints per-batch CSVs are written so runs can resume.
 - Final outputs are timestamped Excel files (CSV fallback).
 
@@ -22,12 +23,16 @@ Notes & security:
 """
 
 import argparse
+import atexit
 import logging
 import os
+import queue
+import threading
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Tuple, List
+from typing import Callable, Optional, Dict, Tuple, List
 
 import pandas as pd
 from bs4 import BeautifulSoup
@@ -107,6 +112,55 @@ def make_driver(headless: bool, user_agent: str = DEFAULT_USER_AGENT, proxy: Opt
     return driver
 
 
+class DriverPool:
+    """Up to `size` long-lived drivers handed out through a queue.
+
+    Drivers are created lazily by `factory` the first time no idle one is
+    available, so Chrome is bootstrapped once per worker rather than per batch.
+    """
+
+    def __init__(self, factory: Callable[[], object], size: int):
+        self.factory = factory
+        self.size = max(1, size)
+        self._idle: "queue.Queue" = queue.Queue()
+        self._drivers: List[object] = []
+        self._lock = threading.Lock()
+
+    def get(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            create = len(self._drivers) < self.size
+            if create:
+                self._drivers.append(None)
+        if not create:
+            return self._idle.get()
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._lock:
+                self._drivers.remove(None)
+            raise
+        with self._lock:
+            self._drivers[self._drivers.index(None)] = driver
+        return driver
+
+    def put(self, driver) -> None:
+        self._idle.put(driver)
+
+    def close_all(self) -> None:
+        with self._lock:
+            drivers = [d for d in self._drivers if d is not None]
+            self._drivers.clear()
+        for d in drivers:
+            try:
+                d.quit()
+            except Exception:
+                pass
+
+
 def login_linkedin(driver, username: str, password: str, timeout: int = 20) -> bool:
     logger = logging.getLogger("linkedin_selenium")
     try:
@@ -294,7 +348,28 @@ def finalize_outputs(output_dir: str):
 
 # ---------- Main orchestration ----------
 
-def process_with_selenium(input_csv: str, url_column: str, output_dir: str, batch_size: int, workers: int, headless: bool, retries: int, delay: float, timeout: int, proxy: Optional[str], single_driver: bool = False):
+def fetch_profile_with_retries(driver, profile_url: str, retries: int, delay: float, timeout: int) -> Tuple[bool, dict]:
+    """Return (public, row): the parsed contact row, or a private row with the last failure reason."""
+    logger = logging.getLogger("linkedin_selenium")
+    contact_url = profile_url.rstrip("/") + "/overlay/contact-info/"
+    attempt = 0
+    while True:
+        success, html, reason = fetch_overlay(driver, contact_url, timeout=timeout)
+        if success and html:
+            parsed = parse_contact_html(html)
+            parsed["profile_url"] = profile_url
+            logger.info("Parsed %s", profile_url)
+            return True, parsed
+        attempt += 1
+        logger.debug("Failed %s attempt %d/%d: %s", profile_url, attempt, retries, reason)
+        if attempt > retries:
+            return False, {"profile_url": profile_url, "reason": reason or "unavailable"}
+        # backoff before retry
+        sleep_for = (2 ** attempt) * delay + random.random() * 0.5
+        time.sleep(sleep_for)
+
+
+def process_with_selenium(input_csv: str, url_column: str, output_dir: str, batch_size: int, workers: int, headless: bool, retries: int, delay: float, timeout: int, proxy: Optional[str], single_driver: bool = False, reuse_driver: bool = False):
     logger = logging.getLogger("linkedin_selenium")
     df = pd.read_csv(input_csv)
     if url_column not in df.columns:
@@ -324,12 +399,43 @@ def process_with_selenium(input_csv: str, url_column: str, output_dir: str, batc
     batch_idx = 0
     processed = 0
 
+    pool = None
+    if reuse_driver and not single_driver:
+        def worker_factory():
+            d = make_driver(headless=headless, proxy=proxy)
+            apply_cookies_to_driver(d, cookies)
+            return d
+        pool = DriverPool(worker_factory, workers)
+        atexit.register(pool.close_all)
+
+    def pooled_fetch(profile_url: str):
+        d = pool.get()
+        try:
+            return fetch_profile_with_retries(d, profile_url, retries, delay, timeout)
+        finally:
+            pool.put(d)
+            # polite per-profile delay
+            time.sleep(delay + random.random() * 0.2)
+
     for i in range(0, total, batch_size):
         batch = urls[i:i+batch_size]
         public_rows = []
         private_rows = []
         logger.info("Processing batch %d (size=%d)", batch_idx + 1, len(batch))
 
+        if pool is not None:
+            # drivers survive across batches; each thread borrows one per profile
+            with ThreadPoolExecutor(max_workers=pool.size) as exe:
+                for success, row in exe.map(pooled_fetch, batch):
+                    (public_rows if success else private_rows).append(row)
+                    processed += 1
+                    if processed % 50 == 0:
+                        logger.info("Processed %d / %d", processed, total)
+            write_batch_checkpoint(output_dir, batch_idx, public_rows, private_rows)
+            batch_idx += 1
+            time.sleep(max(1.0, delay))
+            continue
+
         # create worker drivers and apply cookies (or use single primary driver)
         workers_drivers = []
         if single_driver:
@@ -351,25 +457,8 @@ def process_with_selenium(input_csv: str, url_column: str, output_dir: str, batc
         try:
             for idx, profile_url in enumerate(batch):
                 d = workers_drivers[idx % len(workers_drivers)]
-                contact_url = profile_url.rstrip("/") + "/overlay/contact-info/"
-                attempt = 0
-                while attempt <= retries:
-                    success, html, reason = fetch_overlay(d, contact_url, timeout=timeout)
-                    if success and html:
-                        parsed = parse_contact_html(html)
-                        parsed["profile_url"] = profile_url
-                        public_rows.append(parsed)
-                        logger.info("Parsed %s", profile_url)
-                        break
-                    else:
-                        attempt += 1
-                        logger.debug("Failed %s attempt %d/%d: %s", profile_url, attempt, retries, reason)
-                        if attempt > retries:
-                            private_rows.append({"profile_url": profile_url, "reason": reason or "unavailable"})
-                            break
-                        # backoff before retry
-                        sleep_for = (2 ** attempt) * delay + random.random() * 0.5
-                        time.sleep(sleep_for)
+                success, row = fetch_profile_with_retries(d, profile_url, retries, delay, timeout)
+                (public_rows if success else private_rows).append(row)
                 processed += 1
                 if processed % 50 == 0:
                     logger.info("Processed %d / %d", processed, total)
@@ -392,6 +481,8 @@ def process_with_selenium(input_csv: str, url_column: str, output_dir: str, batc
         time.sleep(max(1.0, delay))
 
     primary.quit()
+    if pool is not None:
+        pool.close_all()
 
     pub_path, priv_path, pub_count, priv_count = finalize_outputs(output_dir)
     summary = {"total": total, "public_count": pub_count, "private_count": priv_count, "public_path": pub_path, "private_path": priv_path}
@@ -414,6 +505,7 @@ def cli():
     parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT)
     parser.add_argument("--proxy", default=None)
     parser.add_argument("--single-driver", action="store_true", dest="single_driver", help="Use primary driver for all fetches (no worker drivers)")
+    parser.add_argument("--reuse-driver", action="store_true", dest="reuse_driver", help="Keep a pool of worker drivers alive across batches and fetch in parallel")
 
     args = parser.parse_args()
 
@@ -423,7 +515,7 @@ def cli():
     logger = setup_logging(logfile)
 
     try:
-        summary = process_with_selenium(args.input, args.url_column, args.output_dir, args.batch_size, args.workers, args.headless, args.retries, args.delay, args.timeout, args.proxy, single_driver=args.single_driver)
+        summary = process_with_selenium(args.input, args.url_column, args.output_dir, args.batch_size, args.workers, args.headless, args.retries, args.delay, args.timeout, args.proxy, single_driver=args.single_driver, reuse_driver=args.reuse_driver)
         logger.info("Finished run. Summary: %s", summary)
     except Exception as exc:
         logger.exception("Processing failed: %s", exc)
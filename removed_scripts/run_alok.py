@@ -12,5 +12,6 @@ if __name__ == "__main__":
         location=location,
         results_wanted=results_wanted,
         output_file=output_file,
+        max_workers=len(keywords),
     )
     print(f"Personalized pipeline completed. {len(df)} jobs saved to {output_file}")
\ No newline at end of file
@@ -1,5 +1,5 @@
 # run_discover.py
-from jobspy.pipeline import discover_jobs
+from jobspy.pipeline import discover_jobs_by_keyword
 
 if __name__ == "__main__":
     keywords = ["Application Support", "ServiceNow", "IT Support"]
@@ -7,7 +7,7 @@ if __name__ == "__main__":
     results_wanted = 100
     sites = ["linkedin", "naukri"]
 
-    jobs = discover_jobs(keywords=keywords, location=location, results_wanted=results_wanted, sites=sites)
+    jobs = discover_jobs_by_keyword(keywords=keywords, location=location, results_wanted=results_wanted, sites=sites)
     print(f"Discovered {len(jobs)} jobs")
     for job in jobs:
         print(f"{job['site']}: {job['title']} @ {job['company']} – {job['job_url']}")
\ No newline at end of file
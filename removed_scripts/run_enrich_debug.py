@@ -1,19 +1,23 @@
 # run_enrich_debug.py
-from jobspy.pipeline import discover_jobs, validate_discovery_row, enrich_job
+from jobspy.pipeline import discover_jobs_by_keyword, validate_discovery_row, enrich_jobs_concurrently, dedupe_discovery_rows
+import settings
 
 if __name__ == "__main__":
+    settings.ENRICH_CACHE_ENABLED = True
     keywords = ["Application Support", "ServiceNow", "IT Support"]
     location = "India"
     results_wanted = 50
 
-    discovery = discover_jobs(keywords=keywords, location=location, results_wanted=results_wanted)
-    enriched = []
-    for meta in discovery:
+    discovery = discover_jobs_by_keyword(keywords=keywords, location=location, results_wanted=results_wanted)
+    rows = []
+    for meta in dedupe_discovery_rows(discovery):
         valid, reason = validate_discovery_row(meta)
         if not valid:
             print(f"Skipping: {reason} – {meta}")
             continue
-        post = enrich_job(meta)
+        rows.append(meta)
+    enriched = []
+    for post in enrich_jobs_concurrently(rows):
         if post:
             enriched.append(post)
             print(f"{post.site}: {post.title} @ {post.company_name}")
@@ -3,17 +3,29 @@
 """
 Start the JobSpy API server.
 """
+import importlib.util
+import os
+
 import uvicorn
 from jobspy.config import get_config
 
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
 if __name__ == "__main__":
     config = get_config()
 
+    # uvloop/httptools roughly double request throughput; fall back where they are unavailable (e.g. Windows)
     uvicorn.run(
         "jobspy.api.app:create_app",
         factory=True,
         host="0.0.0.0",
         port=8000,
         reload=config.debug,
+        workers=None if config.debug else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="uvloop" if _installed("uvloop") else "asyncio",
+        http="httptools" if _installed("httptools") else "h11",
         log_level=config.log_level.lower()
     )
@@ -6,6 +6,9 @@ from enum import Enum
 # ---------- General ----------
 RESULTS_WANTED = 150
 DESCRIPTION_FORMAT = "markdown"          # "markdown" or "html"
+MARKDOWN_PROCESS_WORKERS = 0             # >0 converts each page's descriptions in that many worker processes
+ENRICH_MAX_PAGE_BYTES = 2_000_000        # enrichment stops reading a job page after this many bytes
+ENRICH_CONCURRENCY = 8                   # job pages fetched at once while enriching
 ENFORCE_ANNUAL_SALARY = False
 VERBOSE = 2
 
@@ -26,6 +29,10 @@ LI_BAND_DELAY = 4.0
 LI_JOBS_PER_PAGE = 25
 LI_MAX_PAGES = 40
 LI_FETCH_DESCRIPTION = True
+LI_DESCRIPTION_WORKERS = 8   # job detail pages fetched concurrently per results page
+LI_REQUESTS_PER_SECOND = 5.0 # client-side limit shared by every LinkedIn request; adapts to 429/403
+LI_REQUEST_BURST = 10
+LI_POOL_SIZE = 32            # keep-alive connections kept to linkedin.com; at least description workers + page prefetch
 LI_EASY_APPLY = None
 
 # ---------- Naukri ----------
@@ -33,26 +40,9 @@ NAUKRI_DELAY = 2.5
 NAUKRI_BAND_DELAY = 3.5
 NAUKRI_JOBS_PER_PAGE = 20
 NAUKRI_MAX_PAGES = 50
+NAUKRI_REQUESTS_PER_SECOND = 2.0   # client-side limit; halves after each 429/403 and recovers on success
+NAUKRI_REQUEST_BURST = 4
 
-'''
-# ---------- Profile (Alok‑specific) ----------
-PROFILE_PRIMARY_SKILLS = [
-    "linux", "shell", "bash", "servicenow", "itil", "incident", "sla",
-    "mft", "sftp", "ftps", "ftp", "as2", "goanywhere", "fms", "ftg",
-    "monitor", "monitoring", "alert", "log", "log analysis", "python",
-    "jenkins", "bitbucket", "azure", "aws",
-]
-
-PROFILE_SECONDARY_SKILLS = [
-    "java", "spring", "rest", "api", "devops", "observability",
-    "grafana", "prometheus",
-]
-
-PROFILE_EXCLUDE_SIGNALS = [
-    "frontend", "react", "vue", "angular", "ux", "ui",
-    "dsa", "competitive programming",
-]
-'''
 # ---------- Profile (Alok-specific, DevOps-focused) ----------
 
 PROFILE_PRIMARY_SKILLS = [
@@ -98,6 +88,10 @@ CA_CERT = None            # path to custom CA bundle if needed
 DRY_RUN = False           # If True, use mock scrapers that do not make network calls
 SAMPLE_RESULTS = 1        # Number of sample results returned in dry-run mode
 
+# ---------- Enrichment cache ----------
+ENRICH_CACHE_ENABLED = False                   # If True, reuse scored postings across runs (never in dry-run)
+ENRICH_CACHE_PATH = OUTPUT_DIR / ".enrich_cache"  # shelve file, keyed by job_url + profile settings
+
 # ---------- Aggregation ----------
 ENABLE_AGGREGATE_OUTPUT = True
 AGGREGATE_CSV = OUTPUT_DIR / "all_jobs.csv"  # master CSV storing aggregated results
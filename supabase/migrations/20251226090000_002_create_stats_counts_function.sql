@@ -0,0 +1,19 @@
+/*
+  # System statistics counts
+
+  ## Overview
+  Adds a single read-only function returning the row counts shown by the admin
+  stats endpoint, so the API makes one round-trip instead of one per table.
+
+  ## Functions Created
+  - `stats_counts()` returns one row with `profiles`, `jobs`, `searches`, `matches` (bigint)
+*/
+
+CREATE OR REPLACE FUNCTION stats_counts()
+RETURNS TABLE(profiles bigint, jobs bigint, searches bigint, matches bigint) AS $$
+  SELECT
+    (SELECT count(*) FROM profiles),
+    (SELECT count(*) FROM jobs),
+    (SELECT count(*) FROM job_searches),
+    (SELECT count(*) FROM job_matches);
+$$ LANGUAGE sql STABLE;
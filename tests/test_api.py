@@ -64,3 +64,155 @@ def test_create_profile_with_auth():
     if response.status_code == 201:
         data = response.json()
         assert data["email"] == profile_data["email"]
+
+
+def test_system_stats_etag_not_modified():
+    """Test admin stats honours If-None-Match within the cache window."""
+    first = client.get("/api/v1/admin/stats")
+    etag = first.headers["etag"]
+    assert "max-age" in first.headers["cache-control"]
+
+    second = client.get("/api/v1/admin/stats", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+@pytest.mark.parametrize("accept, expected", [
+    ("zstd, br, gzip", "zstd"),
+    ("br, gzip", "br"),
+    ("gzip", "gzip"),
+    ("zstd;q=0, gzip", "gzip"),
+])
+def test_response_compression_negotiation(accept, expected):
+    """Test large responses are compressed with the preferred coding."""
+    pytest.importorskip("zstandard")
+    pytest.importorskip("brotli")
+    response = client.get("/api/openapi.json", headers={"Accept-Encoding": accept})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == expected
+
+
+def _job_row(i=0, **extra):
+    return {
+        "id": str(uuid4()), "external_id": str(i), "site": "naukri", "title": f"Job {i}",
+        "company_name": "Acme", "location": {"city": "Pune"}, "job_url": f"https://example.com/{i}",
+        "is_remote": False, "date_posted": "2025-01-01", "skills": ["sql"], **extra,
+    }
+
+
+def test_recent_jobs_ndjson_stream():
+    """Test recent jobs stream as NDJSON with the same fields as the JSON list."""
+    import json
+    from jobspy.api.dependencies import get_scraper_service
+
+    jobs = [_job_row(i, raw_data={"x": i}) for i in range(3)]
+
+    class FakeService:
+        def iter_recent_jobs(self, days, limit):
+            return iter(jobs)
+
+        def get_recent_jobs(self, days, limit):
+            return jobs
+
+    client.app.dependency_overrides[get_scraper_service] = FakeService
+    try:
+        response = client.get("/api/v1/jobs/recent", headers={"Accept": "application/x-ndjson"})
+        listed = client.get("/api/v1/jobs/recent").json()
+    finally:
+        client.app.dependency_overrides.clear()
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["title"] for r in rows] == ["Job 0", "Job 1", "Job 2"]
+    assert [r.keys() for r in rows] == [r.keys() for r in listed]
+    assert "raw_data" not in rows[0]
+
+
+def test_recent_jobs_ndjson_reports_page_error():
+    """Test a failure mid-stream ends with an error line instead of a silently short body."""
+    import json
+    from jobspy.api.dependencies import get_scraper_service
+
+    class FakeService:
+        def iter_recent_jobs(self, days, limit):
+            yield _job_row(0)
+            raise RuntimeError("page 50-99 failed")
+
+    client.app.dependency_overrides[get_scraper_service] = FakeService
+    try:
+        response = client.get("/api/v1/jobs/recent", headers={"Accept": "application/x-ndjson"})
+    finally:
+        client.app.dependency_overrides.clear()
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows[0]["title"] == "Job 0"
+    assert rows[-1]["code"] == "STREAM_ERROR" and "page 50-99" in rows[-1]["detail"]
+
+
+def test_process_time_header():
+    """Test process time header is set on API routes but not health checks."""
+    assert "x-process-time" not in client.get("/health").headers
+    response = client.get("/api/v1/admin/config")
+    assert float(response.headers["x-process-time"]) >= 0
+
+
+def test_recent_jobs_json_list():
+    """Test recent jobs are validated against JobResponse and extra columns dropped."""
+    from jobspy.api.dependencies import get_scraper_service
+
+    job = {
+        "id": str(uuid4()), "external_id": "1", "site": "naukri", "title": "Support Engineer",
+        "company_name": "Acme", "location": {"city": "Pune"}, "job_url": "https://example.com/1",
+        "is_remote": False, "date_posted": "2025-01-01", "skills": ["sql"], "raw_data": {"x": 1},
+    }
+
+    class FakeService:
+        def get_recent_jobs(self, days, limit):
+            return [job, dict(job, id=str(uuid4()))]
+
+    client.app.dependency_overrides[get_scraper_service] = FakeService
+    try:
+        response = client.get("/api/v1/jobs/recent")
+    finally:
+        client.app.dependency_overrides.clear()
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 2 and data[0]["title"] == "Support Engineer"
+    assert "raw_data" not in data[0]
+
+
+@pytest.mark.parametrize("user_id", ["not-a-uuid", "0" * 32, "zzzzzzzz-zzzz-zzzz-zzzz-zzzzzzzzzzzz"])
+def test_malformed_user_id_rejected(user_id):
+    """Test malformed X-User-ID headers get a 400."""
+    response = client.get("/api/v1/profiles/me", headers={"X-User-ID": user_id})
+    assert response.status_code == 400
+
+
+def test_search_results_serialized_as_match_list():
+    """Test search results are shaped by JobMatchResponse."""
+    from jobspy.api.dependencies import get_job_search_service
+
+    match = {
+        "id": str(uuid4()), "job_id": str(uuid4()), "match_score": 72, "alignment_level": "Strong Match",
+        "matching_skills": ["sql"], "missing_skills": [], "why_fits": "Primary skills: sql", "search_id": str(uuid4()),
+    }
+
+    class FakeService:
+        async def fetch_search_results(self, search_id, min_score=None, profile_id=None):
+            return [match]
+
+    client.app.dependency_overrides[get_job_search_service] = FakeService
+    try:
+        response = client.get(f"/api/v1/searches/{uuid4()}/results", headers={"X-User-ID": str(uuid4())})
+    finally:
+        client.app.dependency_overrides.clear()
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0]["match_score"] == 72 and "search_id" not in data[0]
+
+
+def test_parse_resume_requires_text():
+    """Test parse-resume rejects a missing or empty resume_text."""
+    headers = {"X-User-ID": str(uuid4())}
+    for body in ({}, {"resume_text": ""}):
+        response = client.post("/api/v1/profiles/me/parse-resume", json=body, headers=headers)
+        assert response.status_code == 422
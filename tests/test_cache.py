@@ -0,0 +1,105 @@
+# tests/test_cache.py
+import asyncio
+import threading
+import time
+
+from jobspy.cache import TTLCache, clear_caches, evict_group, ttl_cached
+
+
+def test_ttl_cache_expires_and_evicts():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None and cache.get("a") == 1 and len(cache) == 2
+
+    expired = TTLCache(maxsize=2, ttl=0)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+
+
+def test_ttl_cached_sync_and_async():
+    calls = []
+
+    @ttl_cached(lambda x: x)
+    def double(x):
+        calls.append(x)
+        return x * 2
+
+    @ttl_cached(lambda x: x)
+    async def triple(x):
+        calls.append(x)
+        return x * 3
+
+    assert double(2) == double(2) == 4
+    assert asyncio.run(triple(5)) == asyncio.run(triple(5)) == 15
+    assert calls == [2, 5]
+    clear_caches()
+    double(2)
+    assert calls == [2, 5, 2]
+
+
+def test_match_writes_evict_cached_search_results(monkeypatch):
+    from types import SimpleNamespace
+    from jobspy.repositories import job_match_repository
+    from jobspy.services import job_search_service
+
+    rows = {"s1": [{"match_score": 80}], "s2": [{"match_score": 70}]}
+    reads = []
+
+    class FakeMatchRepo:
+        def get_matches_by_search(self, search_id, min_score=None, profile_id=None):
+            reads.append((search_id, profile_id))
+            return rows[search_id]
+
+    monkeypatch.setattr("jobspy.repositories.JobMatchRepository", FakeMatchRepo)
+    service = job_search_service.JobSearchService.__new__(job_search_service.JobSearchService)
+    for _ in range(2):
+        service.get_search_results("s1", profile_id="u1")
+        service.get_search_results("s1", profile_id="u2")
+        service.get_search_results("s2", profile_id="u1")
+    assert len(reads) == 3
+
+    repo = job_match_repository.JobMatchRepository.__new__(job_match_repository.JobMatchRepository)
+    upsert = SimpleNamespace(execute=lambda: SimpleNamespace(data=[{}]))
+    repo.db = SimpleNamespace(table=lambda name: SimpleNamespace(upsert=lambda *a, **k: upsert))
+    repo.table_name = "job_matches"
+    repo.log = SimpleNamespace(info=lambda *a: None, error=lambda *a: None)
+    repo.bulk_create_matches([{"search_id": "s1", "profile_id": "u1", "job_id": "j1"}])
+
+    service.get_search_results("s1", profile_id="u1")
+    service.get_search_results("s2", profile_id="u1")
+    assert reads[3:] == [("s1", "u1")]
+    evict_group("search_results", lambda key: True)
+
+
+def test_ttl_cached_first_calls_share_one_cache():
+    from concurrent.futures import ThreadPoolExecutor
+    from jobspy import cache as cache_module
+
+    barrier = threading.Barrier(8)
+    created = []
+    real_cache = cache_module.TTLCache
+
+    class SlowTTLCache(real_cache):
+        def __init__(self, *args):
+            created.append(self)
+            time.sleep(0.01)
+            super().__init__(*args)
+
+    @ttl_cached(lambda x: x, group="first-call-race")
+    def identity(x):
+        return x
+
+    def first_call(x):
+        barrier.wait()
+        return identity(x)
+
+    cache_module.TTLCache = SlowTTLCache
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert list(pool.map(first_call, range(1, 9))) == list(range(1, 9))
+    finally:
+        cache_module.TTLCache = real_cache
+    assert len(created) == 1 and len(cache_module._groups["first-call-race"]) == 1
@@ -0,0 +1,48 @@
+# tests/test_evaluator.py
+from jobspy import evaluator
+from jobspy.evaluator import KeywordScanner, ProfileMatchEvaluator
+
+SUPPORT_JD = (
+    "Production support engineer: Linux, bash, ServiceNow, ITIL incident management. "
+    "On-call rota 24x7. GoAnywhere MFT, SFTP. AWS and Azure. 3-5 years."
+)
+
+
+def test_support_role_scores_strong():
+    res = ProfileMatchEvaluator().evaluate(SUPPORT_JD)
+    assert res["resume_alignment_level"] == "Strong Match"
+    assert {"linux", "servicenow", "sftp", "mft"} <= set(res["key_skills"])
+    assert res["experience_range"] == "3-5 years"
+    assert "On-call / shift work" in res["match_reasons"]
+
+
+def test_exclusion_signal_needs_word_boundary():
+    ev = ProfileMatchEvaluator()
+    assert ev.evaluate("Senior Frontend engineer, React")["resume_alignment_level"] == "Ignore"
+    # "ui" only appears inside "guide", so it must not exclude the job
+    res = ev.evaluate("Linux support guide for SFTP incidents")
+    assert not any(r.startswith("Exclusion") for r in res["match_reasons"])
+
+
+def test_exclusion_skips_keyword_scan(monkeypatch):
+    ev = ProfileMatchEvaluator()
+
+    def _fail(text):
+        raise AssertionError("scanned an excluded job")
+    monkeypatch.setattr(ev.scanner, "scan", _fail)
+    res = ev.evaluate("React frontend developer with Linux and AWS, 2+ years")
+    assert res["resume_alignment_level"] == "Ignore" and res["key_skills"] == []
+    assert res["experience_range"] == "2+ years"
+
+
+def test_keyword_scanner_fallback_matches_automaton(monkeypatch):
+    keywords = ["aws", "ci/cd", "on call", "rota", "rotation", "l2"]
+    text = "aws rotation on call l2/l3 ci/cd"
+    fast = KeywordScanner(keywords).scan(text)
+    monkeypatch.setattr(evaluator, "ahocorasick", None)
+    assert KeywordScanner(keywords).scan(text) == fast == {"aws", "ci/cd", "on call", "rota", "rotation", "l2"}
+
+def test_evaluate_batch_matches_single_evaluate():
+    evaluator = ProfileMatchEvaluator()
+    texts = ["Python SQL support engineer with 3 years experience", "", "Kubernetes AWS on-call rotation"]
+    assert evaluator.evaluate_batch(texts) == [evaluator.evaluate(t) for t in texts]
@@ -0,0 +1,12 @@
+# tests/test_exception.py
+from jobspy.exception import DataValidationError, PageFetchError, RecaptchaChallenge, ResumeParsingException, JobScrapingException
+
+
+def test_exceptions_keep_their_details():
+    err = PageFetchError("https://example.com/jobs", 503)
+    assert isinstance(err, JobScrapingException)
+    assert (err.code, err.url, err.status_code) == ("PAGE_503", "https://example.com/jobs", 503)
+    assert str(err) == "Failed to fetch https://example.com/jobs – Status 503"
+    assert ResumeParsingException("empty", ["skills", "experience"]).missing_sections == "skills, experience"
+    assert RecaptchaChallenge("linkedin", "v2").resolve() == "Check rate limits or use headless browser"
+    assert str(DataValidationError(["title missing"])) == "Data validation failed: ['title missing']"
@@ -0,0 +1,35 @@
+from datetime import date
+from jobspy._hotparse import split_location, split_city_state, posted_date, work_from_home_type, mentions_remote
+
+
+def test_split_location():
+    assert split_location("Pune, Maharashtra") == ("Pune", "Maharashtra", None)
+    assert split_location("Pune, Maharashtra, India") == ("Pune", "Maharashtra", "India")
+    assert split_location("India") == (None, None, None)
+    assert split_location("a, b, c, d") == (None, None, None)
+
+
+def test_split_city_state():
+    assert split_city_state("Pune") == ("Pune", None)
+    assert split_city_state("Pune, Maharashtra, India") == ("Pune", "Maharashtra")
+
+
+def test_posted_date():
+    today = date(2024, 5, 10)
+    assert posted_date("Just now", None, today) == today
+    assert posted_date("3 Days Ago", None, today) == date(2024, 5, 7)
+    assert posted_date("30+ ago", None, today) is None
+    assert posted_date(None, None, today) is None
+
+
+def test_work_from_home_type():
+    assert work_from_home_type("Pune (Hybrid)", "Engineer", "") == "Hybrid"
+    assert work_from_home_type("Pune", "Remote Engineer", "") == "Remote"
+    assert work_from_home_type("Pune", "Engineer", "office based") == "Work from office"
+
+
+def test_mentions_remote():
+    assert mentions_remote("Support Engineer (WFH)", "", "")
+    assert mentions_remote("Support Engineer", "Remote", "")
+    assert mentions_remote("Support Engineer", "Pune", "Happy to Work From Home")
+    assert not mentions_remote("Support Engineer", "Pune", "Office based")
@@ -8,7 +8,19 @@ def test_parse_job_type_from_html():
     assert res and res[0].name == 'FULL_TIME'
 
 
+def test_parse_tags_with_several_classes():
+    assert parse_job_type('<span class="tag job-type bold">Fulltime</span>')[0].name == 'FULL_TIME'
+    assert parse_company_industry('<span class="meta industry">IT Services</span>') == 'IT Services'
+
+
 def test_parse_company_industry_from_html():
     html = '<span class="industry">Information Technology</span>'
     res = parse_company_industry(html)
-    assert res == 'Information Technology'
\ No newline at end of file
+    assert res == 'Information Technology'
+
+def test_is_job_remote_checks_each_field():
+    from jobspy.model import Location
+    from jobspy.naukri.util import is_job_remote
+    assert is_job_remote("Support Engineer (WFH)", None, Location())
+    assert is_job_remote("Support Engineer", "Fully REMOTE role", Location(city="Pune"))
+    assert not is_job_remote("Support Engineer", "Office based", Location(city="Pune"))
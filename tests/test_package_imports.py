@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+
+
+def test_import_jobspy_loads_only_models():
+    code = "import jobspy, sys; print(sorted(m for m in sys.modules if m.startswith('jobspy')))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "['jobspy', 'jobspy.model']"
+
+
+def test_scrape_jobs_reexport_survives_submodule_import():
+    import jobspy
+    import jobspy.scrape_jobs  # noqa: F401
+    from jobspy import scrape_jobs
+    assert callable(scrape_jobs) and scrape_jobs.__module__ == "jobspy.scrape_jobs"
+
+
+def test_providers_package_not_shadowed():
+    import jobspy.providers
+    from jobspy.providers.orchestrator import ProviderOrchestrator  # noqa: F401
+    assert jobspy.providers.__file__.endswith("__init__.py")
+    assert "clearbit" in jobspy.providers.list_providers()
+
+
+def test_database_import_does_not_connect():
+    code = "import jobspy.database as d; print(d.Database._instance is None)"
+    env = {k: v for k, v in os.environ.items() if not k.startswith("SUPABASE_")}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout
+    assert out.strip() == "True"
@@ -9,4 +9,93 @@ def test_pipeline_dry_mode(tmp_path):
     df = run_personalized_pipeline(["test"], None, 1, output_file=str(out))
     assert df is not None
     assert len(df) >= 0
-    settings.DRY_RUN = False
\ No newline at end of file
+    settings.DRY_RUN = False
+
+def test_discover_by_keyword_merges_duplicates():
+    from jobspy.pipeline import discover_jobs_by_keyword
+    settings.DRY_RUN = True
+    rows = discover_jobs_by_keyword(["a", "b", "c"], None, 1)
+    settings.DRY_RUN = False
+    urls = [r["job_url"] for r in rows]
+    assert len(urls) == len(set(urls)) == 2
+
+def test_enrich_jobs_concurrently_keeps_order():
+    from jobspy.pipeline import enrich_jobs_concurrently
+    metas = [
+        {"job_url": f"https://example.com/{i}", "title": f"Job {i}", "company": "Acme", "short_description": "Python SQL support"}
+        for i in range(5)
+    ]
+    posts = enrich_jobs_concurrently(metas, max_concurrency=2)
+    assert [p.title for p in posts] == [m["title"] for m in metas]
+
+def test_enrich_job_uses_persistent_cache(tmp_path, monkeypatch):
+    from jobspy import pipeline
+    monkeypatch.setattr(settings, "ENRICH_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "ENRICH_CACHE_PATH", tmp_path / "cache")
+    from types import SimpleNamespace
+    from contextlib import nullcontext
+    requested = []
+
+    def _get(url, **kwargs):
+        requested.append(url)
+        return nullcontext(SimpleNamespace(iter_content=lambda size: iter([b"<p>Python support</p>"]), encoding="utf-8"))
+    monkeypatch.setattr(pipeline, "_enrich_session", lambda: SimpleNamespace(get=_get))
+    meta = {"job_url": "https://example.com/cached", "title": "Cached", "company": "Acme"}
+    first = pipeline.enrich_job(meta)
+    assert first is not None and requested == ["https://example.com/cached"]
+
+    # a cache hit is answered before the page is fetched again
+    second = pipeline.enrich_job(meta)
+    assert second is not None and second.job_url == first.job_url
+    assert requested == ["https://example.com/cached"]
+
+def test_normalize_output_df_maps_repeated_values():
+    import pandas as pd
+    from jobspy.pipeline import normalize_output_df
+    df = pd.DataFrame({
+        "location": [{"city": "Pune", "state": "MH"}, "{'city': 'Pune', 'state': 'MH'}", {"city": "Pune", "state": "MH"}, None],
+        "key_skills": [["sql", "linux"], ["sql", "linux"], None, ["aws"]],
+    })
+    out = normalize_output_df(df)
+    assert list(out["location"][:3]) == ["Pune, MH"] * 3
+    assert out["location"][3] is None
+    assert list(out["key_skills"]) == ["sql, linux", "sql, linux", None, "aws"]
+
+def test_normalize_output_df_parses_python_repr_locations():
+    import pandas as pd
+    from jobspy.pipeline import normalize_output_df
+    df = pd.DataFrame({"location": ["{'city': 'Pune', 'state': None}", "{'city': \"Hyderabad\", 'state': 'TG'}", "Remote"]})
+    assert list(normalize_output_df(df)["location"]) == ["Pune", "Hyderabad, TG", "Remote"]
+
+def test_dedupe_discovery_rows_by_canonical_url():
+    from jobspy.pipeline import canonical_job_url, dedupe_discovery_rows
+    assert canonical_job_url("HTTPS://WWW.Naukri.com/job-listings-1/?utm_source=x&src=jobsearch#top") == \
+        "https://www.naukri.com/job-listings-1?src=jobsearch"
+    rows = [
+        {"job_url": "https://www.linkedin.com/jobs/view/1?trk=abc", "title": "first"},
+        {"job_url": "https://www.linkedin.com/jobs/view/1/", "title": "dup"},
+        {"job_url": "https://www.linkedin.com/jobs/view/2", "title": "second"},
+        {"job_url": None, "title": "no url"},
+    ]
+    assert [r["title"] for r in dedupe_discovery_rows(rows)] == ["first", "second", "no url"]
+
+def test_read_page_stops_at_byte_cap(monkeypatch):
+    from jobspy import pipeline
+    monkeypatch.setattr(settings, "ENRICH_MAX_PAGE_BYTES", 10)
+
+    class _Res:
+        encoding = "utf-8"
+        def iter_content(self, size):
+            for _ in range(3):
+                yield b"abcdefgh"
+            raise AssertionError("read past the cap")
+    assert pipeline._read_page(_Res()) == "abcdefghab"
+
+def test_enrich_jobs_concurrently_inside_running_loop():
+    import asyncio
+    from jobspy.pipeline import enrich_jobs_concurrently
+    metas = [{"job_url": f"https://example.com/loop/{i}", "title": f"Job {i}", "company": "Acme", "short_description": "Linux support"} for i in range(2)]
+
+    async def _caller():
+        return enrich_jobs_concurrently(metas)
+    assert [p.title for p in asyncio.run(_caller())] == ["Job 0", "Job 1"]
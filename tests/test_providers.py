@@ -17,3 +17,23 @@ def test_clearbit_no_key(tmp_path):
     assert isinstance(public, list)
     assert isinstance(private, list)
     assert private and private[0]['reason'].startswith('clearbit_no_api_key')
+
+
+def test_clearbit_looks_up_profiles_concurrently(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+    from jobspy.providers import clearbit
+
+    class FakeSession:
+        headers = {}
+
+        def get(self, url, timeout=None):
+            if url.endswith("missing"):
+                return SimpleNamespace(status_code=404, content=b"")
+            return SimpleNamespace(status_code=200, content=b'{"email": "a@example.com", "site": {"url": "https://a.example"}}')
+
+    monkeypatch.setattr(clearbit, "create_session", lambda **kwargs: FakeSession())
+    p = tmp_path / "input.csv"
+    p.write_text("URL\nhttps://www.linkedin.com/in/found\nhttps://www.linkedin.com/in/missing\n")
+    public, private = get_provider('clearbit').fetch_contacts(str(p), options={"api_key": "k"})
+    assert [(r["profile_url"], r["email"], r["website"]) for r in public] == [("https://www.linkedin.com/in/found", "a@example.com", "https://a.example")]
+    assert private == [{"profile_url": "https://www.linkedin.com/in/missing", "reason": "clearbit_not_found"}]
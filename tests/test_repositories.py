@@ -68,3 +68,75 @@ def test_job_repository_upsert():
     finally:
         if job:
             repo.delete(uuid4(job["id"]))
+
+
+def test_job_repository_bulk_insert_batches():
+    """Test bulk insert splits rows into batches and dedupes conflict keys."""
+    calls = []
+
+    class FakeQuery:
+        def __init__(self, rows):
+            self.rows = rows
+
+        def execute(self):
+            return type("Response", (), {"data": self.rows})()
+
+    class FakeTable:
+        def upsert(self, rows, on_conflict=None):
+            calls.append((len(rows), on_conflict))
+            return FakeQuery(rows)
+
+    class FakeDb:
+        def table(self, name):
+            return FakeTable()
+
+    repo = JobRepository()
+    repo.db = FakeDb()
+    jobs = [{"external_id": str(i), "site": "linkedin"} for i in range(1200)]
+    jobs.append({"external_id": "0", "site": "linkedin", "title": "dup"})
+
+    assert repo.bulk_insert(jobs, batch_size=500) == 1200
+    assert calls == [(500, "external_id,site"), (500, "external_id,site"), (200, "external_id,site")]
+
+
+def test_iter_query_raises_on_page_error():
+    """Test a failed page surfaces instead of ending the stream as if it were complete."""
+    pages = []
+
+    class FakeQuery:
+        def range(self, start, end):
+            pages.append(start)
+            return self
+
+        def execute(self):
+            if len(pages) > 1:
+                raise RuntimeError("connection reset")
+            return type("Response", (), {"data": [{"id": i} for i in range(2)]})()
+
+    rows = JobRepository().iter_query(FakeQuery, limit=10, page_size=2)
+    assert [next(rows), next(rows)] == [{"id": 0}, {"id": 1}]
+    with pytest.raises(RuntimeError):
+        next(rows)
+
+
+def test_postgres_pool_sized_from_config(monkeypatch):
+    """Test the asyncpg pool uses the configured per-worker bounds."""
+    import asyncio
+    from types import SimpleNamespace
+    from jobspy import database
+    from jobspy.config import DatabaseConfig
+
+    sizes = {}
+
+    async def create_pool(dsn, min_size, max_size, **kwargs):
+        sizes.update(min_size=min_size, max_size=max_size)
+        return object()
+
+    db_config = SimpleNamespace(dsn="postgresql://x", pool_min_size=1, pool_max_size=3)
+    monkeypatch.setattr(database, "asyncpg", SimpleNamespace(create_pool=create_pool))
+    monkeypatch.setattr(database, "get_config", lambda: SimpleNamespace(database=db_config))
+    monkeypatch.setattr(database.Database, "_pool", None)
+    db = object.__new__(database.Database)
+    asyncio.run(db.get_pool())
+    assert sizes == {"min_size": 1, "max_size": 3}
+    assert DatabaseConfig(url="", anon_key="", service_role_key="").pool_max_size == 5
@@ -0,0 +1,353 @@
+# tests/test_scrapers.py
+from datetime import timedelta
+from types import SimpleNamespace
+
+import orjson
+import pytest
+import requests
+
+from jobspy.linkedin.linkedin import LinkedIn
+from jobspy.naukri.naukri import Naukri
+from jobspy.model import ScraperInput, Site
+
+def search_page(first: int, count: int = 3) -> str:
+    """LinkedIn search HTML with cards for job ids first .. first + count - 1."""
+    return "".join(
+        f'<div class="base-search-card"><a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/role-{i}?x=1"></a>'
+        f'<span class="sr-only">Role {i}</span></div>'
+        for i in range(first, first + count)
+    )
+
+
+SEARCH_HTML = search_page(1)
+DETAIL_HTML = '<div class="show-more-less-html__markup"><p>Linux support</p></div>'
+
+
+def fake_response(text: str = "", status: int = 200, url: str = ""):
+    def raise_for_status():
+        if status >= 400: raise requests.HTTPError(f"{status} for {url}")
+    return SimpleNamespace(status_code=status, text=text, content=text.encode(), url=url, raise_for_status=raise_for_status)
+
+
+class FakeSession:
+    """LinkedIn stand-in: search pages come from `search(start)`, detail pages from `detail(job_id)`.
+
+    Either callable may return HTML, a `fake_response`, or raise. Search starts,
+    detail ids and detail timeouts are recorded.
+    """
+
+    def __init__(self, search=None, detail=None):
+        self.search = search or (lambda start: SEARCH_HTML if start == 0 else "")
+        self.detail = detail or (lambda job_id: DETAIL_HTML)
+        self.starts, self.detail_ids, self.detail_timeouts = [], [], []
+
+    def get(self, url, params=None, timeout=None):
+        if "seeMoreJobPostings" in url:
+            self.starts.append(params["start"])
+            reply = self.search(params["start"])
+        else:
+            job_id = url.rsplit("/", 1)[-1]
+            self.detail_ids.append(job_id)
+            self.detail_timeouts.append(timeout)
+            reply = self.detail(job_id)
+        return fake_response(reply, url=url) if isinstance(reply, str) else reply
+
+
+def run_scrape(cls, session, attrs=None, **fields):
+    """Scrape with `session` and no politeness delays; returns the scraper and its JobResponse."""
+    scraper = cls(session=session)
+    scraper.delay = scraper.band_delay = 0
+    for name, value in (attrs or {}).items():
+        setattr(scraper, name, value)
+    fields.setdefault("search_term", "support")
+    return scraper, scraper.scrape(ScraperInput(site_type=[scraper.site], **fields))
+
+
+def test_linkedin_scrapes_multi_class_cards():
+    html = SEARCH_HTML.replace('class="base-search-card"', 'class="base-card relative base-search-card base-search-card--link job-search-card"')
+    session = FakeSession(search=lambda start: html if start == 0 else "")
+    _, result = run_scrape(LinkedIn, session, results_wanted=3, linkedin_fetch_description=False)
+    assert [j.title for j in result.jobs] == ["Role 1", "Role 2", "Role 3"]
+
+
+def test_linkedin_fetches_page_details_together():
+    session = FakeSession()
+    _, result = run_scrape(LinkedIn, session, results_wanted=2, linkedin_fetch_description=True)
+    assert [j.title for j in result.jobs] == ["Role 1", "Role 2"]
+    assert sorted(session.detail_ids) == ["1", "2"]
+    assert "Linux support" in result.jobs[0].description
+
+
+NAUKRI_JOBS = [
+    {"jobId": str(i), "title": f"Support {i}", "companyName": "Acme", "jdURL": f"/job-listings-{i}",
+     "placeholders": [{"type": "location", "label": "Pune, Maharashtra"}, {"type": "salary", "label": "5-8 Lacs P.A."}],
+     "footerPlaceholderLabel": "2 Days Ago", "jobDescription": "<p>Linux support, reach hr@acme.example</p>"}
+    for i in range(1, 4)
+]
+
+
+class FakeNaukriSession:
+    """Naukri stand-in: each search page serves `jobs(page_no)`; requested pages are recorded."""
+
+    def __init__(self, jobs=None):
+        self.jobs = jobs or (lambda page_no: NAUKRI_JOBS if page_no == 1 else [])
+        self.pages = []
+
+    def get(self, url, params=None, timeout=None):
+        self.pages.append(params["pageNo"])
+        return SimpleNamespace(status_code=200, content=orjson.dumps({"jobDetails": self.jobs(params["pageNo"])}))
+
+
+def test_naukri_parses_search_results():
+    scraper, result = run_scrape(Naukri, FakeNaukriSession(), results_wanted=5, linkedin_fetch_description=True)
+    assert [j.id for j in result.jobs] == ["nk-1", "nk-2", "nk-3"]
+    job = result.jobs[0]
+    assert (job.location.city, job.location.state) == ("Pune", "Maharashtra")
+    assert job.compensation.min_amount == 500000 and job.emails == ["hr@acme.example"]
+    assert job.date_posted == scraper.scrape_date - timedelta(days=2)
+
+
+def test_naukri_prefetches_next_page_while_processing():
+    import threading
+
+    on_main_thread = []
+
+    def paged_jobs(page_no):
+        on_main_thread.append(threading.current_thread() is threading.main_thread())
+        offset = (page_no - 1) * 3
+        return [{**job, "jobId": str(int(job["jobId"]) + offset)} for job in NAUKRI_JOBS]
+
+    session = FakeNaukriSession(paged_jobs)
+    _, result = run_scrape(Naukri, session, results_wanted=5, linkedin_fetch_description=False)
+    assert session.pages == [1, 2] and on_main_thread == [True, False]
+    assert [j.id for j in result.jobs] == [f"nk-{i}" for i in range(1, 6)]
+
+
+FULL_CARD = (
+    '<div class="base-search-card job-card"><a class="base-card__full-link" href="https://x/jobs/view/role-7?a=1"></a>'
+    '<span class="sr-only"> Role 7 </span><h4 class="base-search-card__subtitle"><a href="/company/acme?trk=x">Acme</a></h4>'
+    '<span class="job-search-card__salary-info">$100,000 - $120,000</span><div class="base-search-card__metadata">'
+    '<span class="job-search-card__location"> Pune, Maharashtra, India </span>'
+    '<time class="job-search-card__listdate" datetime="2024-05-01"></time></div></div>'
+)
+FULL_CARD_FIELDS = {
+    "title": "Role 7", "company": "Acme", "company_href": "/company/acme?trk=x",
+    "salary": "$100,000 - $120,000", "location": "Pune, Maharashtra, India", "listdate": "2024-05-01",
+}
+
+
+def test_search_cards_fields(monkeypatch):
+    from jobspy.linkedin import linkedin
+
+    monkeypatch.setattr(linkedin, "LexborHTMLParser", None)
+    [(href, card)] = linkedin._search_cards("<p>x</p>" + FULL_CARD)
+    assert (href, linkedin._card_fields(card)) == ("https://x/jobs/view/role-7?a=1", FULL_CARD_FIELDS)
+    job = LinkedIn(session=FakeSession())._process_job(FULL_CARD_FIELDS, "7", None)
+    assert (job.company_url, job.location.city, str(job.date_posted)) == ("https://www.linkedin.com/company/acme", "Pune", "2024-05-01")
+    assert (job.compensation.min_amount, job.compensation.max_amount) == (100000, 120000)
+
+
+def test_search_cards_fields_lexbor():
+    pytest.importorskip("selectolax")
+    from jobspy.linkedin import linkedin
+
+    [(href, card)] = linkedin._search_cards("<p>x</p>" + FULL_CARD)
+    assert (href, linkedin._card_fields(card)) == ("https://x/jobs/view/role-7?a=1", FULL_CARD_FIELDS)
+
+
+def test_location_parsing():
+    scraper = LinkedIn(session=FakeSession())
+    location = scraper._location_from_label("Pune, Maharashtra, India")
+    assert (location.city, location.state) == ("Pune", "Maharashtra")
+    assert scraper._location_from_label(None).city is None
+    # repeated labels share one (frozen) Location
+    assert scraper._location_from_label("Pune, Maharashtra, India") is location
+
+    naukri = Naukri(session=FakeNaukriSession())
+    location = naukri._get_location([{"type": "location", "label": "Bengaluru, Karnataka"}])
+    assert (location.city, location.state) == ("Bengaluru", "Karnataka")
+    assert naukri._get_location([{"type": "location", "label": "Remote"}]).city == "Remote"
+
+
+def test_shared_seen_ids_skip_jobs_claimed_elsewhere():
+    from jobspy.util import SeenIds
+
+    seen = SeenIds()
+    seen.claim("1")
+    session = FakeSession()
+    _, result = run_scrape(LinkedIn, session, attrs={"seen_ids": seen}, results_wanted=2, linkedin_fetch_description=True)
+    assert [j.title for j in result.jobs] == ["Role 2", "Role 3"]
+    assert sorted(session.detail_ids) == ["2", "3"]
+
+
+def test_linkedin_prefetches_next_page_by_card_offset():
+    session = FakeSession(search=lambda start: search_page(start + 1))
+    _, result = run_scrape(LinkedIn, session, results_wanted=5, linkedin_fetch_description=True)
+    assert session.starts == [0, 3]
+    assert [j.id for j in result.jobs] == [f"li-{i}" for i in range(1, 6)]
+
+
+def test_linkedin_stops_when_pages_repeat_or_page_limit_hit():
+    session = FakeSession(search=lambda start: search_page(1))
+    _, result = run_scrape(LinkedIn, session, results_wanted=50, linkedin_fetch_description=False)
+    assert session.starts == [0, 3] and len(result.jobs) == 3
+
+    session = FakeSession(search=search_page)
+    _, result = run_scrape(LinkedIn, session, attrs={"max_pages": 2}, results_wanted=50, linkedin_fetch_description=False)
+    assert session.starts == [0, 3] and len(result.jobs) == 6
+
+
+def test_linkedin_enrich_descriptions_after_list_only_scrape():
+    session = FakeSession()
+    scraper, result = run_scrape(LinkedIn, session, results_wanted=3, linkedin_fetch_description=False)
+    assert session.detail_ids == [] and all(j.description is None for j in result.jobs)
+    shortlist = result.jobs[1:]
+    enriched = scraper.enrich_descriptions(shortlist, concurrency=2)
+    assert sorted(session.detail_ids) == ["2", "3"]
+    assert [j.id for j in enriched] == [j.id for j in shortlist]
+    assert all("Linux support" in j.description for j in enriched)
+    assert scraper.enrich_descriptions(enriched) == enriched and len(session.detail_ids) == 2
+
+
+def test_linkedin_detail_timeout_leaves_job_without_details():
+    def timed_out(job_id):
+        raise requests.Timeout()
+
+    session = FakeSession(detail=timed_out)
+    _, result = run_scrape(LinkedIn, session, results_wanted=2, linkedin_fetch_description=True)
+    assert [j.description for j in result.jobs] == [None, None]
+    assert session.detail_timeouts and all(isinstance(t, tuple) for t in session.detail_timeouts)
+
+
+def test_linkedin_details_parsed_in_fetch_order_when_replies_arrive_out_of_order():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from jobspy.model import DescriptionFormat
+
+    first_done = threading.Event()
+
+    def out_of_order(job_id):
+        if job_id == "1": first_done.wait(2)
+        page = f'<div class="show-more-less-html__markup"><p>Job {job_id}</p></div>'
+        if job_id == "2": first_done.set()
+        return fake_response(page, status=500) if job_id == "3" else page
+
+    scraper = LinkedIn(session=FakeSession(detail=out_of_order))
+    scraper.scraper_input = ScraperInput(site_type=[Site.LINKEDIN], description_format=DescriptionFormat.HTML)
+    with ThreadPoolExecutor(max_workers=3) as scraper._executor:
+        details = scraper._fetch_job_details(["1", "2", "3"])
+    assert list(details) == ["1", "2", "3"]
+    assert "Job 1" in details["1"]["description"] and "Job 2" in details["2"]["description"]
+    assert details["3"] == {}
+
+
+def test_linkedin_job_details_from_multi_class_markup():
+    page = (
+        '<div class="similar"><img class="artdeco-entity-image artdeco-entity-image--square" data-delayed-url="https://logo/acme"></div>'
+        '<div class="show-more-less-html__markup show-more-less-html__markup--clamp-after-5 relative"><p>Linux support</p></div>'
+        '<ul class="description__job-criteria-list">'
+        '<li><h3 class="description__job-criteria-subheader">Seniority level</h3>'
+        '<span class="description__job-criteria-text description__job-criteria-text--criteria">Associate</span></li>'
+        '<li><h3 class="description__job-criteria-subheader">Job function</h3>'
+        '<span class="description__job-criteria-text description__job-criteria-text--criteria">IT</span></li></ul>'
+        '<code id="applyUrl" style="display: none"><!--"https://www.linkedin.com/jobs/view/externalApply/9?url=https%3A%2F%2Facme.example%2Fjobs%2F9&urlHash=x"--></code>'
+    )
+    response = SimpleNamespace(text=page, content=page.encode(), url="https://www.linkedin.com/jobs/view/9")
+    details = LinkedIn(session=FakeSession())._parse_detail_html(response)
+    assert "Linux support" in details["description"]
+    assert (details["job_level"], details["job_function"], details["company_logo"]) == ("Associate", "IT", "https://logo/acme")
+    assert details["job_url_direct"] == "https://acme.example/jobs/9&urlHash=x"
+
+
+def test_linkedin_criteria_fields_in_one_pass():
+    from bs4 import BeautifulSoup
+    from jobspy.linkedin.util import parse_all_criteria
+    from jobspy.model import JobType
+
+    html = "".join(
+        f'<li><h3 class="description__job-criteria-subheader">{h}</h3>'
+        f'<span class="description__job-criteria-text description__job-criteria-text--criteria">{v}</span></li>'
+        for h, v in [("Seniority level", "Mid-Senior level"), ("Employment type", "Full-time"), ("Industries", "Software")]
+    )
+    fields = parse_all_criteria(BeautifulSoup(html, "html.parser"))
+    assert fields == {"job_type": [JobType.FULL_TIME], "job_level": "Mid-Senior level", "company_industry": "Software", "job_function": None}
+
+
+def test_search_cards_strainer_matches_multi_class_cards():
+    from bs4 import BeautifulSoup
+    from jobspy.linkedin.linkedin import SEARCH_CARDS
+
+    html = '<li><div class="base-card relative base-search-card job-search-card"><span class="sr-only">Role</span></div></li>'
+    assert len(BeautifulSoup(html, "html.parser", parse_only=SEARCH_CARDS).find_all("div", class_="base-search-card")) == 1
+
+
+def test_naukri_load_job_details(monkeypatch):
+    from jobspy.naukri import naukri
+
+    payload = orjson.dumps({"jobDetails": NAUKRI_JOBS[:1], "clusters": {"wfhType": []}})
+    assert naukri._load_job_details(payload) == NAUKRI_JOBS[:1]
+    monkeypatch.setattr(naukri, "simdjson", None)
+    assert naukri._load_job_details(payload) == NAUKRI_JOBS[:1]
+    assert naukri._load_job_details(orjson.dumps({"noOfJobs": 0})) == []
+
+
+def test_linkedin_job_posts_match_validated_models():
+    from jobspy.model import JobPost
+
+    _, result = run_scrape(LinkedIn, FakeSession(), results_wanted=2, linkedin_fetch_description=True)
+    for job in result.jobs:
+        assert JobPost.model_validate(job.model_dump()).model_dump() == job.model_dump()
+
+
+def test_jobs_frame_normalizes_columns():
+    import importlib
+    from jobspy.model import Compensation, CompensationInterval, Country, JobPost, Location
+    from jobspy.util import desired_order
+    scrape_jobs = importlib.import_module("jobspy.scrape_jobs")
+    rows = [
+        {**JobPost(id="a", title="A", job_url="u/a", emails=["x@y.com", "z@y.com"], location=Location(city="Pune", state="MH"),
+                   compensation=Compensation(interval=CompensationInterval.MONTHLY, min_amount=10, max_amount=20, currency="INR")).dict(), "site": "naukri"},
+        {**JobPost(id="b", title="B", job_url="u/b", description="$40 - $50 an hour", emails=[]).dict(), "site": "linkedin"},
+    ]
+    df = scrape_jobs._jobs_frame(rows, Country.USA, enforce_annual_salary=True)
+    assert list(df.columns) == desired_order
+    by_id = df.set_index("id")
+    assert by_id.loc["a", "emails"] == "x@y.com, z@y.com" and by_id.loc["a", "location"] == "Pune, MH"
+    assert (by_id.loc["a", "interval"], by_id.loc["a", "min_amount"], by_id.loc["a", "salary_source"]) == ("yearly", 120, "direct_data")
+    assert (by_id.loc["b", "interval"], by_id.loc["b", "min_amount"], by_id.loc["b", "salary_source"]) == ("yearly", 83200, "description")
+    assert by_id["emails"].isna()["b"]
+
+
+def test_linkedin_session_reuses_keep_alive_connections():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    peers = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            peers.add(self.client_address)
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        scraper = LinkedIn()
+        url = f"http://127.0.0.1:{server.server_address[1]}/jobs/view/1"
+        with ThreadPoolExecutor(max_workers=scraper.description_workers) as pool:
+            for _ in range(3):
+                assert all(r.status_code == 200 for r in pool.map(lambda _: scraper.session.get(url, timeout=5), range(16)))
+        # three rounds of fan-out ride on at most one connection per worker
+        assert len(peers) <= scraper.description_workers
+    finally:
+        server.shutdown()
+        server.server_close()
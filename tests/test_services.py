@@ -42,6 +42,35 @@ def test_skill_extraction():
     assert "linux" in skills
 
 
+def test_skill_extraction_word_boundaries():
+    """Test single-word skills need a whole token."""
+    service = MatchingService()
+    cfg = service.config.matching
+
+    skills = service._extract_skills("JavaScript developer on Linux; java_beans.", cfg)
+
+    assert "java" not in skills
+    assert "linux" in skills
+
+
+def test_underscore_skills_match_their_variants():
+    """Test underscore skills match spaced, hyphenated and joined text, and score as primary skills."""
+    service = MatchingService()
+    cfg = service.config.matching
+
+    assert service._extract_skills("CI CD, ci-cd and cicd", cfg) == ["ci_cd"]
+
+    job = {
+        "title": "Application Support Analyst",
+        "description": "Handle incident management and log analysis for customer apps; maintain CI-CD pipelines.",
+    }
+    result = service._evaluate_match({"skills": [], "experience_years": 3}, job)
+
+    # 14 / "Ignore" while these skills never matched
+    assert result["matching_skills"] == ["ci_cd", "incident_management", "log_analysis"]
+    assert (result["match_score"], result["alignment_level"]) == (50, "Good Match")
+
+
 def test_experience_extraction():
     """Test experience extraction."""
     service = MatchingService()
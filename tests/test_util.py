@@ -7,13 +7,158 @@ from jobspy.model import JobType, Country
 def test_get_enum_from_value():
     assert get_enum_from_value(Country, "india") == Country.INDIA
     assert get_enum_from_value(Country, "USA") == Country.USA
+    with pytest.raises(ValueError):
+        get_enum_from_value(Country, "mars")
+
+
+def test_country_from_string():
+    assert Country.from_string(" India ") == Country.INDIA
+    assert Country.from_string("worldwide") == "worldwide"
+
+
+def test_display_location():
+    from jobspy.model import Location, display_location
+
+    assert Location(city="Pune", state="Maharashtra", country=Country.INDIA).display_location() == "Pune, Maharashtra, India"
+    assert display_location(None, None, "worldwide") == "worldwide"
 
 
 def test_get_enum_from_job_type():
     assert get_enum_from_job_type("fulltime") == JobType.FULL_TIME
     assert get_enum_from_job_type("internship") == JobType.INTERNSHIP
+    # cached lookups must still reject unknown labels on every call
+    for _ in range(2):
+        with pytest.raises(Exception):
+            get_enum_from_job_type("gig")
 
 
 def test_extract_job_type():
     res = extract_job_type(["fulltime", JobType.CONTRACT])
-    assert JobType.FULL_TIME in res and JobType.CONTRACT in res
\ No newline at end of file
+    assert JobType.FULL_TIME in res and JobType.CONTRACT in res
+
+def test_create_session_pool_size():
+    from jobspy.util import create_session
+    sess = create_session(is_tls=False, pool_maxsize=16)
+    adapter = sess.get_adapter("https://example.com")
+    assert adapter._pool_maxsize == 16
+
+def test_create_session_retries_throttled_requests():
+    from jobspy.util import create_session
+    retries = create_session(is_tls=False, has_retry=True).get_adapter("https://example.com").max_retries
+    assert 429 in retries.status_forcelist
+    assert retries.respect_retry_after_header
+    assert "POST" in retries.allowed_methods
+
+def test_scrapers_reuse_shared_session():
+    import requests
+    from jobspy.linkedin.linkedin import LinkedIn
+    from jobspy.naukri.naukri import Naukri
+    shared = requests.Session()
+    assert LinkedIn(session=shared).session is shared
+    assert Naukri(session=shared).session is shared
+    assert "appid" not in shared.headers
+    assert Naukri().session.headers["appid"] == "109"
+
+def test_scrapers_without_a_session_share_one_per_site():
+    from jobspy.linkedin.linkedin import LinkedIn
+    from jobspy.naukri.naukri import Naukri
+    assert Naukri().session is Naukri().session
+    assert LinkedIn().session is LinkedIn().session
+    assert LinkedIn().session is not Naukri().session
+    assert Naukri(proxies={"https": "http://proxy:8080"}).session is not Naukri().session
+
+def test_scraper_session_blocks_on_full_pool():
+    from jobspy.naukri.naukri import Naukri
+    adapter = Naukri().session.get_adapter("https://www.naukri.com")
+    assert adapter._pool_block and adapter._pool_maxsize >= Naukri.jobs_per_page
+
+def test_token_bucket_waits_once_burst_is_spent(monkeypatch):
+    from jobspy import util
+    clock = [0.0]
+    monkeypatch.setattr(util.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(util.time, "sleep", lambda s: clock.__setitem__(0, clock[0] + s))
+    bucket = util.TokenBucket(rate=5, burst=2)
+    for _ in range(3):
+        bucket.acquire()
+    assert clock[0] == 0.2
+
+def test_token_bucket_backs_off_and_recovers(monkeypatch):
+    from types import SimpleNamespace
+    from jobspy import util
+    clock = [0.0]
+    monkeypatch.setattr(util.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(util.time, "sleep", lambda s: clock.__setitem__(0, clock[0] + s))
+    bucket = util.TokenBucket(rate=4, burst=1)
+    util.throttle_feedback(bucket, SimpleNamespace(status_code=429, headers={"Retry-After": "3"}))
+    assert bucket.rate == 2 and bucket.slowdown == 2
+    bucket.acquire()
+    assert clock[0] == 3.5
+    for _ in range(10):
+        util.throttle_feedback(bucket, SimpleNamespace(status_code=200, headers={}))
+    assert bucket.rate == 4
+
+def test_extract_emails_from_text():
+    from jobspy.util import extract_emails_from_text
+    assert extract_emails_from_text(None) is None
+    assert extract_emails_from_text("no contact details") == []
+    assert extract_emails_from_text("mail hr@acme.example or jobs@acme.co.in") == ["hr@acme.example", "jobs@acme.co.in"]
+
+def test_extract_emails_from_text_cached_results_are_independent():
+    from jobspy.util import extract_emails_from_text
+    text = "apply to careers@acme.example"
+    first = extract_emails_from_text(text)
+    first.append("mutated@acme.example")
+    assert extract_emails_from_text(text) == ["careers@acme.example"]
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_markdown_converter_batch(workers):
+    from jobspy.util import markdown_converter_batch
+    # distinct bodies per run, so the conversion cache doesn't answer for the pool
+    out = markdown_converter_batch([f"<p><b>Linux {workers}</b></p>", None, "", f"<p>AWS {workers}</p>"], workers=workers)
+    assert out[0].strip() == f"**Linux {workers}**"
+    assert out[1:3] == [None, ""]
+    assert out[3].strip() == f"AWS {workers}"
+
+def test_close_markdown_pool_shuts_down_and_restarts():
+    from jobspy import util
+    util.markdown_converter_batch(["<p>pool close a</p>", "<p>pool close b</p>"], workers=2)
+    pool = util._markdown_pool
+    util.close_markdown_pool()
+    assert util._markdown_pool is None and pool._shutdown_thread
+    util.close_markdown_pool()
+    out = util.markdown_converter_batch(["<p>pool reopen a</p>", "<p>pool reopen b</p>"], workers=2)
+    assert [o.strip() for o in out] == ["pool reopen a", "pool reopen b"]
+    util.close_markdown_pool()
+
+def test_markdown_converter_batch_converts_repeats_once(monkeypatch):
+    from collections import OrderedDict
+    from jobspy import util
+    calls = []
+    monkeypatch.setattr(util, "markdown_converter", lambda html: calls.append(html) or html.upper())
+    monkeypatch.setattr(util, "_markdown_cache", OrderedDict())
+    html = "<p>same boilerplate for the repeat test</p>"
+    assert util.markdown_converter_batch([html, "<p>other</p>", html]) == [html.upper(), "<P>OTHER</P>", html.upper()]
+    assert util.markdown_converter_batch([html]) == [html.upper()]
+    assert sorted(calls) == ["<p>other</p>", html]
+
+def test_bare_html_formatter_matches_stripped_prettify():
+    from bs4 import BeautifulSoup
+    from jobspy.util import BARE_HTML, remove_attributes
+    html = '<div class="a b" id="x"><p style="c">A &amp; B &lt; é<br class="x"><img src="y"></p><ul><li data-x="1">x</li></ul></div>'
+    tag = BeautifulSoup(html, "html.parser").div
+    assert tag.prettify(formatter=BARE_HTML) == remove_attributes(BeautifulSoup(html, "html.parser").div).prettify(formatter="html")
+    assert tag["id"] == "x"
+
+def test_seen_ids_claim_new():
+    from jobspy.util import SeenIds
+    seen = SeenIds()
+    assert seen.claim("1")
+    assert seen.claim_new(["1", "2", "2", "3", "4"], limit=2) == ["2", "3"]
+    assert not seen.claim("3")
+    assert seen.claim("4")
+
+def test_remove_attributes_clears_nested_tags():
+    from bs4 import BeautifulSoup
+    from jobspy.util import remove_attributes
+    soup = BeautifulSoup('<div class="a"><p id="b">x <a href="/c" data-x="1">y</a></p></div>', "html.parser")
+    assert str(remove_attributes(soup.div)) == "<div><p>x <a>y</a></p></div>"